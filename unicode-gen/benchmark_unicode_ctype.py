@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (C) 2014-2016 Free Software Foundation, Inc.
+# This file is part of the GNU C Library.
+#
+# The GNU C Library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# The GNU C Library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with the GNU C Library; if not, see
+# <http://www.gnu.org/licenses/>.
+
+'''
+This script measures the time of the queries of the unicode_ctype
+module and compares them with the unicodedata module of Python and
+with the predicates of unicode_utils.
+
+The unicodedata queries only approximate the LC_CTYPE classes, they
+are there to compare the speed, not the results.
+
+To see how it is used, call it with the “-h” option:
+
+    $ ./benchmark_unicode_ctype.py -h
+    … prints usage message …
+'''
+
+import argparse
+import time
+import unicodedata
+
+import unicode_utils
+import unicode_ctype
+
+def measure(code_points, function):
+    '''Returns the time in nanoseconds per call of function for each of
+    the code points'''
+    start = time.perf_counter()
+    for code_point in code_points:
+        function(code_point)
+    return (time.perf_counter() - start) * 1e9 / len(code_points)
+
+def report(label, nanoseconds):
+    '''Prints one line of the results'''
+    print('{:<45s} {:8.1f} ns/call'.format(label, nanoseconds))
+
+def report_load(label, start):
+    '''Prints the time since start'''
+    print('{:<45s} {:8.1f} ms'.format(
+        label, (time.perf_counter() - start) * 1e3))
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(
+        description='''
+        Compare the speed of the unicode_ctype queries with unicodedata
+        and unicode_utils.
+        ''')
+    PARSER.add_argument(
+        '-u', '--unicode_data_file',
+        nargs='?',
+        type=str,
+        default='UnicodeData.txt',
+        help=('The UnicodeData.txt file to read, '
+              + 'default: %(default)s'))
+    PARSER.add_argument(
+        '-d', '--derived_core_properties_file',
+        nargs='?',
+        type=str,
+        default='DerivedCoreProperties.txt',
+        help=('The DerivedCoreProperties.txt file to read, '
+              + 'default: %(default)s'))
+    PARSER.add_argument(
+        '-t', '--ctype_tables',
+        nargs='?',
+        type=str,
+        default='unicode_ctype.tables',
+        help=('The tables written by gen_unicode_ctype.py --ctype_tables, '
+              + 'default: %(default)s'))
+    PARSER.add_argument(
+        '-r', '--repeat',
+        nargs='?',
+        type=int,
+        default=3,
+        help='Number of rounds, the best one counts, default: %(default)s')
+    ARGS = PARSER.parse_args()
+
+    START = time.perf_counter()
+    TABLES = unicode_ctype.load(ARGS.ctype_tables)
+    report_load('unicode_ctype.load()', START)
+    START = time.perf_counter()
+    unicode_utils.fill_all(
+        unicode_data_file=ARGS.unicode_data_file,
+        derived_core_properties_file=ARGS.derived_core_properties_file)
+    report_load('unicode_utils.fill_all()', START)
+
+    # All code points of the Basic Multilingual Plane and of the
+    # Supplementary Multilingual Plane.
+    CODE_POINTS = range(0x20000)
+    ALPHA = unicode_utils.CLASS_ALPHA
+    CANDIDATES = (
+        ('loop overhead (lambda cp: cp)', lambda code_point: code_point),
+        ('unicode_ctype classes(cp) & CLASS_ALPHA',
+         lambda code_point: TABLES.classes(code_point) & ALPHA),
+        ('unicode_ctype has_class(cp, "alpha")',
+         lambda code_point: TABLES.has_class(code_point, 'alpha')),
+        ('unicode_ctype class_predicate("alpha")(cp)',
+         TABLES.class_predicate('alpha')),
+        ('unicode_ctype toupper(cp)', TABLES.toupper),
+        ('unicodedata category(chr(cp))[0] == "L"',
+         lambda code_point: unicodedata.category(chr(code_point))[0] == 'L'),
+        ('ord(chr(cp).upper()[0])',
+         lambda code_point: ord(chr(code_point).upper()[0])),
+        ('unicode_utils is_alpha(cp)', unicode_utils.is_alpha),
+        ('unicode_utils is_punct(cp)', unicode_utils.is_punct),
+        ('unicode_utils to_upper(cp)', unicode_utils.to_upper),
+    )
+    for (LABEL, FUNCTION) in CANDIDATES:
+        report(LABEL, min(measure(CODE_POINTS, FUNCTION)
+                          for round in range(ARGS.repeat)))
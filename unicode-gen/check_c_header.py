@@ -0,0 +1,148 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (C) 2014-2016 Free Software Foundation, Inc.
+# This file is part of the GNU C Library.
+#
+# The GNU C Library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# The GNU C Library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with the GNU C Library; if not, see
+# <http://www.gnu.org/licenses/>.
+
+'''
+This script checks that the C header written by
+“gen_unicode_ctype.py --c_header” gives the same character classes
+and case mappings as the LC_CTYPE file generated in the same run.
+
+It compiles a small test driver which looks up every code point in
+the tables of the header and compares the results with the contents
+of the LC_CTYPE file.
+
+To see how it is used, call it with the “-h” option:
+
+    $ ./check_c_header.py -h
+    … prints usage message …
+'''
+
+import sys
+import os
+import argparse
+import subprocess
+import tempfile
+
+from ctype_compatibility import extract_character_classes
+import unicode_utils
+
+# The test driver, it prints one line for every code point which is in
+# any class or has any case mapping.
+TEST_DRIVER = '''
+#include <stdio.h>
+#include "{header:s}"
+
+int
+main (void)
+{{
+  for (uint32_t wc = 0; wc <= 0x{max_code_point:X}; wc++)
+    {{
+      uint16_t classes = unicode_ctype_classes (wc);
+      uint32_t upper = unicode_ctype_toupper (wc);
+      uint32_t lower = unicode_ctype_tolower (wc);
+      uint32_t title = unicode_ctype_totitle (wc);
+      if (classes != 0 || upper != wc || lower != wc || title != wc)
+        printf ("%X %X %X %X %X\\n", wc, classes, upper, lower, title);
+    }}
+  return 0;
+}}
+'''
+
+def run_test_driver(header, compiler):
+    '''Compiles and runs the test driver for the header.
+
+    Returns a dictionary mapping the character classes and case
+    mappings to lists of code points and code point pairs, like
+    ctype_compatibility.extract_character_classes().
+    '''
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'check_c_header.c')
+        program = os.path.join(directory, 'check_c_header')
+        with open(source, mode='w') as source_file:
+            source_file.write(TEST_DRIVER.format(
+                header=os.path.abspath(header),
+                max_code_point=unicode_utils.MAX_CODE_POINT))
+        subprocess.check_call(
+            compiler.split() + ['-std=c99', '-O2', '-o', program, source])
+        output = subprocess.check_output([program], universal_newlines=True)
+    ctype_dict = {name: [] for name in unicode_utils.CHARACTER_CLASSES}
+    for map_name in ('toupper', 'tolower', 'totitle'):
+        ctype_dict[map_name] = []
+    for line in output.splitlines():
+        (code_point, classes, upper, lower, title) = [
+            int(field, 16) for field in line.split()]
+        for name, flag in unicode_utils.CHARACTER_CLASSES.items():
+            if classes & flag:
+                ctype_dict[name].append(code_point)
+        for map_name, mapped in (('toupper', upper), ('tolower', lower),
+                                 ('totitle', title)):
+            if mapped != code_point:
+                ctype_dict[map_name].append((code_point, mapped))
+    return ctype_dict
+
+def compare(ctype_dict, header_dict):
+    '''Reports the differences between the classes and mappings of the
+    LC_CTYPE file and those of the header, returns their number'''
+    differences = 0
+    # Classes left out of the LC_CTYPE file, like “outdigit”, are not
+    # compared.
+    for char_class in sorted(ctype_dict):
+        missing = set(ctype_dict[char_class]) - set(header_dict[char_class])
+        added = set(header_dict[char_class]) - set(ctype_dict[char_class])
+        print('%(char_class)s: %(missing)d missing, %(added)d added' %{
+            'char_class': char_class,
+            'missing': len(missing),
+            'added': len(added)})
+        for code_point in sorted(missing):
+            print('%s: missing in header: %s' %(char_class, code_point))
+        for code_point in sorted(added):
+            print('%s: added in header: %s' %(char_class, code_point))
+        differences += len(missing) + len(added)
+    return differences
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(
+        description='''
+        Check the C header written by gen_unicode_ctype.py against
+        the LC_CTYPE file.
+        ''')
+    PARSER.add_argument(
+        '-i', '--ctype_file',
+        nargs='?',
+        type=str,
+        default='i18n',
+        help='The LC_CTYPE file, default: %(default)s')
+    PARSER.add_argument(
+        '--c_header',
+        nargs='?',
+        type=str,
+        default='unicode_ctype.h',
+        help='The C header, default: %(default)s')
+    PARSER.add_argument(
+        '--cc',
+        nargs='?',
+        type=str,
+        default=os.environ.get('CC', 'cc'),
+        help='The C compiler, default: %(default)s')
+    ARGS = PARSER.parse_args()
+
+    DIFFERENCES = compare(extract_character_classes(ARGS.ctype_file),
+                          run_test_driver(ARGS.c_header, ARGS.cc))
+    print('Number of differences = %d' %DIFFERENCES)
+    if DIFFERENCES > 0:
+        sys.exit(1)
@@ -0,0 +1,474 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+# Copyright (C) 2014-2016 Free Software Foundation, Inc.
+# This file is part of the GNU C Library.
+#
+# The GNU C Library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# The GNU C Library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with the GNU C Library; if not, see
+# <http://www.gnu.org/licenses/>.
+
+'''
+This script checks the data structures of unicode_utils against
+straightforward implementations with Python sets, dictionaries and
+strings.
+
+It is run by “make check”.  To see how it is used, call it with the
+“-h” option:
+
+    $ ./check_unicode_utils.py -h
+    … prints usage message …
+'''
+
+import sys
+import os
+import io
+import re
+import array
+import random
+import argparse
+import tempfile
+import subprocess
+
+import unicode_utils
+import unicode_ctype
+import gen_unicode_ctype
+
+def report(name, failures):
+    '''Prints the result of one check, returns the number of failures'''
+    for failure in failures:
+        print('%s: %s' %(name, failure))
+    print('%s: %d failures' %(name, len(failures)))
+    return len(failures)
+
+def random_ranges(rng, count, limit):
+    '''Returns a list of count random (first, last) ranges below limit,
+    they may overlap or be adjacent'''
+    ranges = []
+    for dummy in range(count):
+        first = rng.randrange(limit)
+        ranges.append((first, min(first + rng.randrange(8), limit - 1)))
+    return ranges
+
+def code_point_set(ranges):
+    '''Returns the Python set of the code points in ranges'''
+    return {code_point
+            for first, last in ranges
+            for code_point in range(first, last + 1)}
+
+def check_interval_set(rng, rounds):
+    '''Compares the IntervalSet operations with those of Python sets'''
+    failures = []
+    for round_number in range(rounds):
+        ranges_a = random_ranges(rng, rng.randrange(12), 64)
+        ranges_b = random_ranges(rng, rng.randrange(12), 64)
+        interval_a = unicode_utils.IntervalSet(ranges_a)
+        interval_b = unicode_utils.IntervalSet(ranges_b)
+        set_a = code_point_set(ranges_a)
+        set_b = code_point_set(ranges_b)
+        results = (
+            ('a', interval_a, set_a),
+            ('a | b', interval_a | interval_b, set_a | set_b),
+            ('a & b', interval_a & interval_b, set_a & set_b),
+            ('a - b', interval_a - interval_b, set_a - set_b),
+            ('a ^ b', interval_a ^ interval_b, set_a ^ set_b),
+        )
+        for expression, interval_set, expected in results:
+            runs = list(interval_set.runs())
+            if (set(interval_set) != expected
+                    or len(interval_set) != len(expected)
+                    or bool(interval_set) != bool(expected)
+                    or any(code_point in interval_set
+                           for code_point in range(64)
+                           if code_point not in expected)
+                    or any(runs[index][1] + 1 >= runs[index + 1][0]
+                           for index in range(len(runs) - 1))):
+                failures.append('round %d: %s = %r, expected %r' %(
+                    round_number, expression, runs, sorted(expected)))
+        if (interval_a == interval_b) != (set_a == set_b):
+            failures.append('round %d: a == b is wrong' %round_number)
+        complement = interval_a.complement()
+        if (len(complement) != unicode_utils.MAX_CODE_POINT + 1 - len(set_a)
+                or complement & interval_a
+                or (complement | interval_a).complement()):
+            failures.append('round %d: complement of %r is %r' %(
+                round_number, list(interval_a.runs()),
+                list(complement.runs())))
+    return report('IntervalSet', failures)
+
+def check_case_mapping(rng, rounds):
+    '''Compares CaseMapping and CaseMapping.tailored() with
+    dictionaries'''
+    failures = []
+    for round_number in range(rounds):
+        pairs = {code_point: rng.randrange(1, 200)
+                 for code_point in rng.sample(range(1, 200), 20)}
+        overlay = {code_point: rng.randrange(1, 200)
+                   for code_point in rng.sample(range(1, 200), 5)}
+        mapping = unicode_utils.CaseMapping(sorted(pairs.items()))
+        tailored = mapping.tailored(overlay)
+        expected_tailored = dict(pairs)
+        expected_tailored.update(overlay)
+        for name, case_mapping, expected in (
+                ('mapping', mapping, pairs),
+                ('tailored', tailored, expected_tailored)):
+            changed = sorted(
+                (code_point, mapped)
+                for code_point, mapped in expected.items()
+                if code_point != mapped)
+            if (any(case_mapping(code_point)
+                    != expected.get(code_point, code_point)
+                    for code_point in range(256))
+                    or list(case_mapping.items()) != changed
+                    or len(case_mapping) != len(changed)):
+                failures.append('round %d: %s differs' %(
+                    round_number, name))
+            deltas = case_mapping.deltas()
+            if any(deltas[code_point] != case_mapping(code_point)
+                   - code_point for code_point in range(256)):
+                failures.append('round %d: deltas of %s differ' %(
+                    round_number, name))
+        if any(mapping(code_point) != pairs.get(code_point, code_point)
+               for code_point in overlay):
+            failures.append('round %d: tailored() changed the mapping'
+                            %round_number)
+    return report('CaseMapping', failures)
+
+def check_trie_table(rng, rounds):
+    '''Compares the lookups in TrieTables with the values they are
+    built from'''
+    failures = []
+    size = unicode_utils.MAX_CODE_POINT + 1
+    for round_number in range(rounds):
+        values = array.array('H', bytes(2 * size))
+        for first, last in random_ranges(rng, 200, size):
+            values[first:last + 1] = array.array(
+                'H', [rng.randrange(1, 1 << 16)]) * (last - first + 1)
+        for shifts in ((12, 5), (8,)):
+            table = unicode_utils.TrieTable(values, shifts)
+            code_points = [rng.randrange(size) for dummy in range(2000)]
+            code_points.extend((0, size - 1))
+            code_points.extend(first for first, last in random_ranges(
+                rng, 50, size))
+            for code_point in code_points:
+                if table[code_point] != values[code_point]:
+                    failures.append(
+                        'round %d: shifts %r: table[0x%04X] = %d, '
+                        'expected %d' %(round_number, shifts, code_point,
+                                        table[code_point],
+                                        values[code_point]))
+    return report('TrieTable', failures)
+
+def check_locale_tailoring(directory):
+    '''Checks read_locale_tailoring() and the classes and case
+    mappings tailored by it'''
+    failures = []
+    path = os.path.join(directory, 'xx_XX.txt')
+    with open(path, mode='w') as tailoring_file:
+        tailoring_file.write(
+            '# comment\n'
+            '\n'
+            'conventions ; Example # comment\n'
+            'upper ; 0069 ; 0130\n'
+            'add ; alpha ; 0030..0032\n'
+            'add ; alpha ; 0033\n'
+            'remove ; punct ; 0021..0022\n')
+    tailoring = unicode_utils.read_locale_tailoring(path)
+    if (tailoring.name, tailoring.conventions) != ('xx_XX', 'Example'):
+        failures.append('name %r, conventions %r' %(
+            tailoring.name, tailoring.conventions))
+    if tailoring.overlays != {'upper': {0x0069: 0x0130},
+                              'lower': {}, 'title': {}}:
+        failures.append('overlays %r' %tailoring.overlays)
+    classes = {'alpha': unicode_utils.IntervalSet([(0x0041, 0x005A)]),
+               'punct': unicode_utils.IntervalSet([(0x0021, 0x002F)]),
+               'digit': unicode_utils.IntervalSet([(0x0030, 0x0039)])}
+    tailored = unicode_utils.UCD().tailored_character_classes(
+        tailoring, classes)
+    expected = {'alpha': set(range(0x0041, 0x005B)) | set(range(0x30, 0x34)),
+                'punct': set(range(0x0023, 0x0030)),
+                'digit': set(range(0x0030, 0x003A))}
+    if {name: set(code_point_set)
+            for name, code_point_set in tailored.items()} != expected:
+        failures.append('tailored classes %r' %tailored)
+    if tailored['digit'] is not classes['digit']:
+        failures.append('untailored class is not shared')
+    upper = unicode_utils.CaseMapping([(0x0061, 0x0041), (0x0069, 0x0049)])
+    tailored_upper = upper.tailored(tailoring.overlays['upper'])
+    if (tailored_upper(0x0069), tailored_upper(0x0061)) != (0x0130, 0x0041):
+        failures.append('tailored upper mapping is wrong')
+    for line in ('upper ; 0069\n', 'add ; nonsense ; 0030\n',
+                 'remove ; alpha ; 0039..0030\n', 'totitle ; 0061 ; 0041\n',
+                 'lower ; 110000 ; 0041\n'):
+        with open(path, mode='w') as tailoring_file:
+            tailoring_file.write(line)
+        stderr = sys.stderr
+        sys.stderr = io.StringIO()
+        try:
+            unicode_utils.read_locale_tailoring(path)
+            failures.append('%r is accepted' %line)
+        except SystemExit:
+            pass
+        finally:
+            sys.stderr = stderr
+    return report('read_locale_tailoring', failures)
+
+def check_property_sets(property_file):
+    '''Compares read_property_sets() with Python sets built from the
+    ranges of parse_property_ranges()'''
+    expected = {}
+    for first, last, prop in unicode_utils.parse_property_ranges(
+            property_file):
+        expected.setdefault(prop, set()).update(range(first, last + 1))
+    property_sets = unicode_utils.read_property_sets(property_file)
+    failures = []
+    if list(property_sets) != list(expected):
+        failures.append('properties %r, expected %r' %(
+            list(property_sets), list(expected)))
+    for prop, code_point_set in property_sets.items():
+        if set(code_point_set) != expected.get(prop):
+            failures.append('%s differs' %prop)
+    return report('read_property_sets', failures)
+
+def check_name_index(unicode_data_file):
+    '''Compares NameIndex.search() with a loop over all names'''
+    ucd = unicode_utils.UCD()
+    ucd.fill_attributes(unicode_data_file)
+    attributes = ucd.attributes
+    names = {code_point: attributes.name(code_point)
+             for code_point in attributes}
+    index = ucd.name_index()
+    failures = []
+    for substrings in (('LIGATURE',), ('MUSICAL SYMBOL', 'BALINESE'),
+                       ('CJK UNIFIED IDEOGRAPH',), ('ZZZ NOT A NAME',),
+                       ('LATIN CAPITAL LETTER A',)):
+        expected = {code_point for code_point, name in names.items()
+                    if any(substring in name for substring in substrings)}
+        found = index.search(*substrings)
+        if found != expected:
+            failures.append('search%r: %d missing, %d added' %(
+                substrings, len(expected - found), len(found - expected)))
+    prefix = 'LATIN SMALL LETTER'
+    expected = {code_point for code_point, name in names.items()
+                if name.startswith(prefix)}
+    found = index.search_prefix(prefix)
+    if found != expected:
+        failures.append('search_prefix(%r): %d missing, %d added' %(
+            prefix, len(expected - found), len(found - expected)))
+    return report('NameIndex', failures)
+
+def check_unassigned(unicode_data_file):
+    '''Checks that the predicates of UCD are false for the code points
+    which are not in UnicodeData.txt, like surrogates and unassigned
+    code points'''
+    ucd = unicode_utils.UCD()
+    ucd.fill_attributes(unicode_data_file)
+    predicates = [name for name in dir(ucd) if name.startswith('is_')]
+    unassigned = unicode_utils.IntervalSet(ucd.attributes.runs()).complement()
+    failures = []
+    for first, last in unassigned.runs():
+        for code_point in sorted({first, last}):
+            for name in predicates:
+                if getattr(ucd, name)(code_point):
+                    failures.append('%s(0x%04X) is true' %(name, code_point))
+    if 0xD800 not in unassigned:
+        failures.append('surrogates are in the store')
+    return report('unassigned code points', failures)
+
+def check_ctype_tables(directory, unicode_data_file,
+                       derived_core_properties_file):
+    '''Compares the queries of unicode_ctype for every code point with
+    the classes and case mappings the tables are written from'''
+    failures = []
+    unicode_utils.fill_all(
+        unicode_data_file=unicode_data_file,
+        derived_core_properties_file=derived_core_properties_file)
+    ucd = unicode_utils.DEFAULT_UCD
+    classes = ucd.character_classes()
+    path = os.path.join(directory, 'unicode_ctype.tables')
+    gen_unicode_ctype.output_ctype_tables(path, '9.0.0', classes)
+    tables = unicode_ctype.load(path)
+    flags = unicode_utils.class_flags(classes)
+    code_points = range(unicode_utils.MAX_CODE_POINT + 1)
+    if [tables.classes(code_point) for code_point in code_points] != list(
+            flags):
+        failures.append('classes() differs')
+    is_punct = tables.class_predicate('punct')
+    if {code_point for code_point in code_points
+            if is_punct(code_point)} != set(classes['punct']):
+        failures.append('class_predicate("punct") differs')
+    if ({code_point for code_point in code_points
+         if tables.has_class(code_point, 'alpha')}
+            != set(classes['alpha'])):
+        failures.append('has_class(…, "alpha") differs')
+    for map_name, field in unicode_ctype.MAPPINGS:
+        query = getattr(tables, map_name)
+        mapping = ucd.case_mapping(field)
+        if any(query(code_point) != mapping(code_point)
+               for code_point in code_points):
+            failures.append('%s() differs' %map_name)
+        for code_point in (-1, unicode_utils.MAX_CODE_POINT + 1):
+            try:
+                query(code_point)
+                failures.append('%s(%d) is accepted' %(map_name, code_point))
+            except ValueError:
+                pass
+    # unicode_ctype must stay usable without the Unicode data files.
+    if subprocess.call(
+            [sys.executable, '-c',
+             'import sys, unicode_ctype; '
+             'sys.exit("unicode_utils" in sys.modules)'],
+            cwd=os.path.dirname(os.path.abspath(unicode_ctype.__file__))):
+        failures.append('importing unicode_ctype imports unicode_utils')
+    return report('unicode_ctype', failures)
+
+def wrapped_lines(tokens, max_column=75, prefix='   '):
+    '''Returns the tokens wrapped the way the LC_CTYPE sections were
+    written before WrappedLineWriter, one string at a time'''
+    text = ''
+    line = prefix
+    for token in tokens:
+        if line.strip():
+            line += ';'
+        if len(line + token) > max_column:
+            text += line + '/\n'
+            line = prefix
+        line += token
+    if line.strip():
+        text += line + '\n'
+    return text
+
+def check_wrapped_line_writer(rng, rounds):
+    '''Compares the lines of WrappedLineWriter with wrapped_lines()'''
+    failures = []
+    # A line of exactly 75 columns and one which is one column longer
+    for tokens, expected in (
+            (['A' * 35, 'B' * 36], '   %s;%s\n' %('A' * 35, 'B' * 36)),
+            (['A' * 35, 'B' * 37], '   %s;/\n   %s\n' %('A' * 35, 'B' * 37))):
+        output_file = io.StringIO()
+        with unicode_utils.WrappedLineWriter(output_file) as writer:
+            writer.add_tokens(tokens)
+        if output_file.getvalue() != expected:
+            failures.append('%r: %r' %(tokens, output_file.getvalue()))
+    for round_number in range(rounds):
+        tokens = [rng.choice(('<U%04X>', '(<U%04X>,<U0041>)', 'x%X'))
+                  %rng.randrange(1 << rng.choice((8, 16, 20)))
+                  + rng.choice(('', '..<U0041>', '..(2)..<U0000FFFF>'))
+                  for dummy in range(rng.randrange(60))]
+        output_file = io.StringIO()
+        with unicode_utils.WrappedLineWriter(output_file) as writer:
+            writer.write('upper /\n')
+            writer.add_tokens(tokens[:len(tokens) // 2])
+            writer.add_tokens(tokens[len(tokens) // 2:])
+        text = output_file.getvalue()
+        if text != 'upper /\n' + wrapped_lines(tokens):
+            failures.append('round %d: %r' %(round_number, text))
+        for line in text.splitlines()[1:]:
+            # The tokens end at column 75 at most, continuation lines
+            # add “;/” after them.
+            if len(line[:-2] if line.endswith(';/') else line) > 75:
+                failures.append('round %d: line too long: %r' %(
+                    round_number, line))
+    return report('WrappedLineWriter', failures)
+
+def check_split_input_file(directory):
+    '''Checks split_input_file() on files with missing markers, empty
+    files and files with CRLF line endings'''
+    cases = (
+        # (contents, expected head, expected tail)
+        ('', '', ''),
+        ('a\nb\n', 'a\nb\n', ''),
+        ('a\nSTART\nbody\nEND\nz\n', 'a\nSTART\n', 'END\nz\n'),
+        ('START\nbody\n', 'START\n', ''),
+        ('START', 'START', ''),
+        ('a\nSTART\nEND', 'a\nSTART\n', 'END'),
+        ('END\nSTART\nbody\n', 'END\nSTART\n', ''),
+        (' START\nSTARTED\nx\n END\nENDING\n', ' START\nSTARTED\n',
+         'ENDING\n'),
+        ('a\r\nSTART\r\nbody\r\nEND\r\nz\r\n', 'a\nSTART\n', 'END\nz\n'),
+        ('date "2014-06-24"\r\nSTART\n', 'date "today"\nSTART\n', ''),
+    )
+    date = re.compile(rb'^date "[0-9-]*"', re.MULTILINE)
+    failures = []
+    path = os.path.join(directory, 'input')
+    for contents, expected_head, expected_tail in cases + ((None, '', ''),):
+        if contents is not None:
+            with open(path, mode='w', newline='') as input_file:
+                input_file.write(contents)
+        with unicode_utils.split_input_file(
+                path if contents is not None else None, 'START', 'END',
+                head_substitutions=((date, b'date "today"'),)) \
+                as (head, tail):
+            result = []
+            for region in (head, tail):
+                output_file = io.TextIOWrapper(io.BytesIO(), newline='')
+                region.copy_to(output_file)
+                output_file.flush()
+                result.append(output_file.buffer.getvalue().decode())
+                if bool(region) != bool(result[-1]):
+                    failures.append('%r: bool() is wrong' %contents)
+        if result != [expected_head, expected_tail]:
+            failures.append('%r: got %r, expected %r' %(
+                contents, result, [expected_head, expected_tail]))
+    return report('split_input_file', failures)
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(
+        description='''
+        Check the data structures of unicode_utils.
+        ''')
+    PARSER.add_argument(
+        '-u', '--unicode_data_file',
+        nargs='?',
+        type=str,
+        default='UnicodeData.txt',
+        help=('The UnicodeData.txt file to read, '
+              + 'default: %(default)s'))
+    PARSER.add_argument(
+        '-d', '--derived_core_properties_file',
+        nargs='?',
+        type=str,
+        default='DerivedCoreProperties.txt',
+        help=('The DerivedCoreProperties.txt file to read, '
+              + 'default: %(default)s'))
+    PARSER.add_argument(
+        '--seed',
+        nargs='?',
+        type=int,
+        default=0,
+        help='The seed of the random checks, default: %(default)s')
+    PARSER.add_argument(
+        '--rounds',
+        nargs='?',
+        type=int,
+        default=200,
+        help='Number of rounds of the random checks, default: %(default)s')
+    ARGS = PARSER.parse_args()
+
+    RNG = random.Random(ARGS.seed)
+    FAILURES = 0
+    FAILURES += check_interval_set(RNG, ARGS.rounds)
+    FAILURES += check_case_mapping(RNG, ARGS.rounds)
+    FAILURES += check_trie_table(RNG, max(ARGS.rounds // 50, 1))
+    FAILURES += check_wrapped_line_writer(RNG, ARGS.rounds)
+    with tempfile.TemporaryDirectory() as DIRECTORY:
+        FAILURES += check_split_input_file(DIRECTORY)
+        FAILURES += check_locale_tailoring(DIRECTORY)
+        FAILURES += check_ctype_tables(
+            DIRECTORY, ARGS.unicode_data_file,
+            ARGS.derived_core_properties_file)
+    FAILURES += check_property_sets(ARGS.derived_core_properties_file)
+    FAILURES += check_name_index(ARGS.unicode_data_file)
+    FAILURES += check_unassigned(ARGS.unicode_data_file)
+    print('Number of failures = %d' %FAILURES)
+    if FAILURES > 0:
+        sys.exit(1)
@@ -33,32 +33,24 @@ import time
 import unicode_utils
 
 def read_input_file(filename):
-    '''Reads the original glibc translit_circle file to get the
+    '''Splits the original glibc translit_circle file into the
     original head and tail.
 
     We want to replace only the part of the file between
     “translit_start” and “translit_end”
+
+    Returns a context manager giving (head, tail), both empty if
+    filename is None, see unicode_utils.split_input_file().
     '''
-    head = tail = ''
-    with open(filename, mode='r') as translit_file:
-        for line in translit_file:
-            head = head + line
-            if line.startswith('translit_start'):
-                break
-        for line in translit_file:
-            if line.startswith('translit_end'):
-                tail = line
-                break
-        for line in translit_file:
-            tail = tail + line
-    return (head, tail)
+    return unicode_utils.split_input_file(
+        filename, 'translit_start', 'translit_end')
 
 def output_head(translit_file, unicode_version, head=''):
     '''Write the header of the output file, i.e. the part of the file
     before the “translit_start” line.
     '''
     if ARGS.input_file and head:
-        translit_file.write(head)
+        head.copy_to(translit_file)
     else:
         translit_file.write('escape_char /\n')
         translit_file.write('comment_char %\n')
@@ -77,31 +69,35 @@ def output_head(translit_file, unicode_version, head=''):
 def output_tail(translit_file, tail=''):
     '''Write the tail of the output file'''
     if ARGS.input_file and tail:
-        translit_file.write(tail)
+        tail.copy_to(translit_file)
     else:
         translit_file.write('translit_end\n')
         translit_file.write('\n')
         translit_file.write('END LC_CTYPE\n')
 
-def output_transliteration(translit_file):
-    '''Write the new transliteration to the output file'''
-    translit_file.write('\n')
-    for code_point in sorted(unicode_utils.UNICODE_ATTRIBUTES):
-        name = unicode_utils.UNICODE_ATTRIBUTES[code_point]['name']
-        decomposition = unicode_utils.UNICODE_ATTRIBUTES[
-            code_point]['decomposition']
-        if decomposition.startswith('<circle>'):
-            decomposition = decomposition[9:]
+def output_transliteration(translit_file, unicode_data_file):
+    '''Write the new transliteration to the output file
+
+    The lines of the UnicodeData.txt file are streamed, only the few
+    records with a <circle> decomposition are looked at.
+    '''
+    writer = unicode_utils.WrappedLineWriter(translit_file)
+    writer.write('\n')
+    for record in unicode_utils.iter_records(
+            unicode_data_file, fields=('name', 'decomposition')):
+        if record.decomposition.startswith('<circle>'):
+            decomposition = record.decomposition[9:]
             decomposed_code_points = [int(x, 16)
                                       for x in decomposition.split(' ')]
-            translit_file.write('% {:s}\n'.format(name))
-            translit_file.write('{:s} "<U0028>'.format(
-                unicode_utils.ucs_symbol(code_point)))
+            writer.write('% {:s}\n'.format(record.name))
+            writer.write('{:s} "<U0028>'.format(
+                unicode_utils.ucs_symbol(record.first)))
             for decomposed_code_point in decomposed_code_points:
-                translit_file.write('{:s}'.format(
+                writer.write('{:s}'.format(
                     unicode_utils.ucs_symbol(decomposed_code_point)))
-            translit_file.write('<U0029>"\n')
-    translit_file.write('\n')
+            writer.write('<U0029>"\n')
+    writer.write('\n')
+    writer.flush()
 
 
 if __name__ == "__main__":
@@ -141,11 +137,8 @@ if __name__ == "__main__":
         help='The Unicode version of the input files used.')
     ARGS = PARSER.parse_args()
 
-    unicode_utils.fill_attributes(ARGS.unicode_data_file)
-    HEAD = TAIL = ''
-    if ARGS.input_file:
-        (HEAD, TAIL) = read_input_file(ARGS.input_file)
-    with open(ARGS.output_file, mode='w') as TRANSLIT_FILE:
-        output_head(TRANSLIT_FILE, ARGS.unicode_version, head=HEAD)
-        output_transliteration(TRANSLIT_FILE)
-        output_tail(TRANSLIT_FILE, tail=TAIL)
+    with read_input_file(ARGS.input_file) as (HEAD, TAIL):
+        with open(ARGS.output_file, mode='w') as TRANSLIT_FILE:
+            output_head(TRANSLIT_FILE, ARGS.unicode_version, head=HEAD)
+            output_transliteration(TRANSLIT_FILE, ARGS.unicode_data_file)
+            output_tail(TRANSLIT_FILE, tail=TAIL)
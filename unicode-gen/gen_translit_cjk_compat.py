@@ -34,32 +34,24 @@ import sys
 import unicode_utils
 
 def read_input_file(filename):
-    '''Reads the original glibc translit_cjk_compat file to get the
+    '''Splits the original glibc translit_cjk_compat file into the
     original head and tail.
 
     We want to replace only the part of the file between
     “translit_start” and “translit_end”
+
+    Returns a context manager giving (head, tail), both empty if
+    filename is None, see unicode_utils.split_input_file().
     '''
-    head = tail = ''
-    with open(filename, mode='r') as translit_file:
-        for line in translit_file:
-            head = head + line
-            if line.startswith('translit_start'):
-                break
-        for line in translit_file:
-            if line.startswith('translit_end'):
-                tail = line
-                break
-        for line in translit_file:
-            tail = tail + line
-    return (head, tail)
+    return unicode_utils.split_input_file(
+        filename, 'translit_start', 'translit_end')
 
 def output_head(translit_file, unicode_version, head=''):
     '''Write the header of the output file, i.e. the part of the file
     before the “translit_start” line.
     '''
     if ARGS.input_file and head:
-        translit_file.write(head)
+        head.copy_to(translit_file)
     else:
         translit_file.write('escape_char /\n')
         translit_file.write('comment_char %\n')
@@ -79,7 +71,7 @@ def output_head(translit_file, unicode_version, head=''):
 def output_tail(translit_file, tail=''):
     '''Write the tail of the output file'''
     if ARGS.input_file and tail:
-        translit_file.write(tail)
+        tail.copy_to(translit_file)
     else:
         translit_file.write('translit_end\n')
         translit_file.write('\n')
@@ -112,13 +104,18 @@ def special_decompose(code_point_list):
 
 def output_transliteration(translit_file):
     '''Write the new transliteration to the output file'''
-    translit_file.write('\n')
-    for code_point in sorted(unicode_utils.UNICODE_ATTRIBUTES):
-        name = unicode_utils.UNICODE_ATTRIBUTES[code_point]['name']
-        decomposition = unicode_utils.UNICODE_ATTRIBUTES[
-            code_point]['decomposition']
-        if decomposition.startswith('<square>'):
-            decomposition = decomposition[9:]
+    writer = unicode_utils.WrappedLineWriter(translit_file)
+    writer.write('\n')
+    # The members of a block share the decomposition, so a block is
+    # checked once and only visited if it has one.
+    for first, last in unicode_utils.UNICODE_ATTRIBUTES.runs():
+        decomposition = unicode_utils.UNICODE_ATTRIBUTES.decomposition(
+            first)
+        if not decomposition.startswith('<square>'):
+            continue
+        decomposition = decomposition[9:]
+        for code_point in range(first, last + 1):
+            name = unicode_utils.UNICODE_ATTRIBUTES.name(code_point)
             decomposed_code_points = [[int(x, 16)
                                        for x in decomposition.split(' ')]]
             if decomposed_code_points[0]:
@@ -139,25 +136,29 @@ def output_transliteration(translit_file):
                         break
                     decomposed_code_points.append(
                         special_decomposed_code_points)
-                translit_file.write('% {:s}\n'.format(name))
-                translit_file.write('{:s} '.format(
+                writer.write('% {:s}\n'.format(name))
+                writer.write('{:s} '.format(
                     unicode_utils.ucs_symbol(code_point)))
                 for index in range(0, len(decomposed_code_points)):
                     if index > 0:
-                        translit_file.write(';')
+                        writer.write(';')
                     if len(decomposed_code_points[index]) > 1:
-                        translit_file.write('"')
+                        writer.write('"')
                     for decomposed_code_point in decomposed_code_points[index]:
-                        translit_file.write('{:s}'.format(
+                        writer.write('{:s}'.format(
                             unicode_utils.ucs_symbol(decomposed_code_point)))
                     if len(decomposed_code_points[index]) > 1:
-                        translit_file.write('"')
-                translit_file.write('\n')
-    for code_point in sorted(unicode_utils.UNICODE_ATTRIBUTES):
-        name = unicode_utils.UNICODE_ATTRIBUTES[code_point]['name']
-        decomposition = unicode_utils.UNICODE_ATTRIBUTES[
-            code_point]['decomposition']
-        if decomposition and name.startswith('CJK COMPATIBILITY IDEOGRAPH'):
+                        writer.write('"')
+                writer.write('\n')
+    for first, last in unicode_utils.UNICODE_ATTRIBUTES.runs():
+        decomposition = unicode_utils.UNICODE_ATTRIBUTES.decomposition(
+            first)
+        if not decomposition:
+            continue
+        for code_point in range(first, last + 1):
+            name = unicode_utils.UNICODE_ATTRIBUTES.name(code_point)
+            if not name.startswith('CJK COMPATIBILITY IDEOGRAPH'):
+                continue
             decomposed_code_points = [int(x, 16)
                                       for x in decomposition.split(' ')]
             if len(decomposed_code_points) != 1:
@@ -165,14 +166,15 @@ def output_transliteration(translit_file):
                     'Unexpected decomposition length {:x} {:s} {:s}\n'.format(
                         code_point, name, decomposition))
                 exit(1)
-            translit_file.write('% {:s}\n'.format(name))
-            translit_file.write('{:s} '.format(
+            writer.write('% {:s}\n'.format(name))
+            writer.write('{:s} '.format(
                 unicode_utils.ucs_symbol(code_point)))
             for decomposed_code_point in decomposed_code_points:
-                translit_file.write('{:s}'.format(
+                writer.write('{:s}'.format(
                     unicode_utils.ucs_symbol(decomposed_code_point)))
-            translit_file.write('\n')
-    translit_file.write('\n')
+            writer.write('\n')
+    writer.write('\n')
+    writer.flush()
 
 if __name__ == "__main__":
     PARSER = argparse.ArgumentParser(
@@ -211,11 +213,10 @@ if __name__ == "__main__":
         help='The Unicode version of the input files used.')
     ARGS = PARSER.parse_args()
 
-    unicode_utils.fill_attributes(ARGS.unicode_data_file)
-    HEAD = TAIL = ''
-    if ARGS.input_file:
-        (HEAD, TAIL) = read_input_file(ARGS.input_file)
-    with open(ARGS.output_file, mode='w') as TRANSLIT_FILE:
-        output_head(TRANSLIT_FILE, ARGS.unicode_version, head=HEAD)
-        output_transliteration(TRANSLIT_FILE)
-        output_tail(TRANSLIT_FILE, tail=TAIL)
+    unicode_utils.fill_attributes(
+        ARGS.unicode_data_file, fields=('name', 'decomposition'))
+    with read_input_file(ARGS.input_file) as (HEAD, TAIL):
+        with open(ARGS.output_file, mode='w') as TRANSLIT_FILE:
+            output_head(TRANSLIT_FILE, ARGS.unicode_version, head=HEAD)
+            output_transliteration(TRANSLIT_FILE)
+            output_tail(TRANSLIT_FILE, tail=TAIL)
@@ -32,33 +32,116 @@ import argparse
 import time
 import unicode_utils
 
+# Substrings of the names of the combining characters which are not
+# removed, see is_combining_remove().
+COMBINING_REMOVE_IGNORED = (
+    'DEVANAGARI',
+    'BENGALI',
+    'CYRILLIC',
+    'SYRIAC',
+    'THAANA',
+    'NKO',
+    'GURMUKHI',
+    'TAMIL',
+    'GUJARATI',
+    'ORIYA',
+    'TELUGU',
+    'KANNADA',
+    'MALAYALAM',
+    'SINHALA',
+    'THAI',
+    'LAO',
+    'TIBETAN',
+    'MYANMAR',
+    'ETHIOPIC',
+    'TAGALOG',
+    'HANUNOO',
+    'BUHID',
+    'TAGBANWA',
+    'KHMER',
+    'MONGOLIAN',
+    'LIMBU',
+    'NEW TAI LUE',
+    'BUGINESE',
+    'BALINESE',
+    'SUNDANESE',
+    'LEPCHA',
+    'IDEOGRAPHIC',
+    'HANGUL',
+    'SYLOTI',
+    'SAURASHTRA',
+    'KAYAH',
+    'REJANG',
+    'CHAM',
+    'VARIATION SELECTOR',
+    'KHAROSHTHI',
+    'MUSICAL SYMBOL',
+    'SAMARITAN',
+    'MANDAIC',
+    'TAI THAM',
+    'BATAK',
+    'VEDIC',
+    'COPTIC',
+    'TIFINAGH',
+    'BAMUM',
+    'JAVANESE',
+    'TAI VIET',
+    'MEETEI',
+    'MANICHAEAN',
+    'BRAHMI',
+    'KAITHI',
+    'CHAKMA',
+    'MAHAJANI',
+    'SHARADA',
+    'KHOJKI',
+    'KHUDAWADI',
+    'GRANTHA',
+    'TIRHUTA',
+    'SIDDHAM',
+    'MODI VOWEL',
+    'MODI SIGN',
+    'TAKRI',
+    'BASSA VAH',
+    'PAHAWH HMONG',
+    'MIAO',
+    'DUPLOYAN',
+    'MENDE KIKAKUI',
+    'AHOM',
+    'SIGNWRITING',
+)
+
+# Substrings of the names of the characters whose canonical
+# decomposition is ignored, see canonical_decompose().
+DECOMPOSITION_IGNORED = (
+    'MUSICAL SYMBOL',
+    'CJK COMPATIBILITY IDEOGRAPH',
+    'BALINESE',
+    'KAITHI LETTER',
+    'CHAKMA VOWEL',
+    'GRANTHA VOWEL',
+    'TIRHUTA VOWEL',
+    'SIDDHAM VOWEL',
+)
+
 def read_input_file(filename):
-    '''Reads the original glibc translit_combining file to get the
+    '''Splits the original glibc translit_combining file into the
     original head and tail.
 
     We want to replace only the part of the file between
     “translit_start” and “translit_end”
+
+    Returns a context manager giving (head, tail), both empty if
+    filename is None, see unicode_utils.split_input_file().
     '''
-    head = tail = ''
-    with open(filename, mode='r') as translit_file:
-        for line in translit_file:
-            head = head + line
-            if line.startswith('translit_start'):
-                break
-        for line in translit_file:
-            if line.startswith('translit_end'):
-                tail = line
-                break
-        for line in translit_file:
-            tail = tail + line
-    return (head, tail)
+    return unicode_utils.split_input_file(
+        filename, 'translit_start', 'translit_end')
 
 def output_head(translit_file, unicode_version, head=''):
     '''Write the header of the output file, i.e. the part of the file
     before the “translit_start” line.
     '''
     if ARGS.input_file and head:
-        translit_file.write(head)
+        head.copy_to(translit_file)
     else:
         translit_file.write('escape_char /\n')
         translit_file.write('comment_char %\n')
@@ -79,7 +162,7 @@ def output_head(translit_file, unicode_version, head=''):
 def output_tail(translit_file, tail=''):
     '''Write the tail of the output file'''
     if ARGS.input_file and tail:
-        translit_file.write(tail)
+        tail.copy_to(translit_file)
     else:
         translit_file.write('translit_end\n')
         translit_file.write('\n')
@@ -99,84 +182,8 @@ def is_combining_remove(code_point):
     '''
     if not unicode_utils.is_combining(code_point):
         return False
-    name = unicode_utils.UNICODE_ATTRIBUTES[code_point]['name']
-    for substring in ('DEVANAGARI',
-                      'BENGALI',
-                      'CYRILLIC',
-                      'SYRIAC',
-                      'THAANA',
-                      'NKO',
-                      'GURMUKHI',
-                      'TAMIL',
-                      'GUJARATI',
-                      'ORIYA',
-                      'TELUGU',
-                      'KANNADA',
-                      'MALAYALAM',
-                      'SINHALA',
-                      'THAI',
-                      'LAO',
-                      'TIBETAN',
-                      'MYANMAR',
-                      'ETHIOPIC',
-                      'TAGALOG',
-                      'HANUNOO',
-                      'BUHID',
-                      'TAGBANWA',
-                      'KHMER',
-                      'MONGOLIAN',
-                      'LIMBU',
-                      'NEW TAI LUE',
-                      'BUGINESE',
-                      'BALINESE',
-                      'SUNDANESE',
-                      'LEPCHA',
-                      'IDEOGRAPHIC',
-                      'HANGUL',
-                      'SYLOTI',
-                      'SAURASHTRA',
-                      'KAYAH',
-                      'REJANG',
-                      'CHAM',
-                      'VARIATION SELECTOR',
-                      'KHAROSHTHI',
-                      'MUSICAL SYMBOL',
-                      'SAMARITAN',
-                      'MANDAIC',
-                      'TAI THAM',
-                      'BATAK',
-                      'VEDIC',
-                      'COPTIC',
-                      'TIFINAGH',
-                      'BAMUM',
-                      'JAVANESE',
-                      'TAI VIET',
-                      'MEETEI',
-                      'MANICHAEAN',
-                      'BRAHMI',
-                      'KAITHI',
-                      'CHAKMA',
-                      'MAHAJANI',
-                      'SHARADA',
-                      'KHOJKI',
-                      'KHUDAWADI',
-                      'GRANTHA',
-                      'TIRHUTA',
-                      'SIDDHAM',
-                      'MODI VOWEL',
-                      'MODI SIGN',
-                      'TAKRI',
-                      'BASSA VAH',
-                      'PAHAWH HMONG',
-                      'MIAO',
-                      'DUPLOYAN',
-                      'MENDE KIKAKUI',
-                      'AHOM',
-                      'SIGNWRITING'
-    ):
-        if substring in name:
-            return False
-    return True
+    return code_point not in unicode_utils.name_index().search(
+        *COMBINING_REMOVE_IGNORED)
 
 def canonical_decompose(code_point):
     '''http://www.unicode.org/reports/tr44/#Character_Decomposition_Mappings
@@ -200,19 +207,11 @@ def canonical_decompose(code_point):
     about the usefulness of including them and want to keep close
     to the spirit of the original file for the moment.
     '''
-    name = unicode_utils.UNICODE_ATTRIBUTES[code_point]['name']
-    for substring in ('MUSICAL SYMBOL',
-                      'CJK COMPATIBILITY IDEOGRAPH',
-                      'BALINESE',
-                      'KAITHI LETTER',
-                      'CHAKMA VOWEL',
-                      'GRANTHA VOWEL',
-                      'TIRHUTA VOWEL',
-                      'SIDDHAM VOWEL'):
-        if substring in name:
-            return []
-    decomposition = unicode_utils.UNICODE_ATTRIBUTES[
-        code_point]['decomposition']
+    if code_point in unicode_utils.name_index().search(
+            *DECOMPOSITION_IGNORED):
+        return []
+    decomposition = unicode_utils.UNICODE_ATTRIBUTES.decomposition(
+        code_point)
     if decomposition and not decomposition.startswith('<'):
         decomposed_code_points = [int(x, 16) for x in decomposition.split(' ')]
         if decomposed_code_points:
@@ -335,12 +334,17 @@ def output_combining_remove(translit_file):
     characters are replaced by empty strings.
     '''
     translit_file.write('\n')
-    for code_point in sorted(unicode_utils.UNICODE_ATTRIBUTES):
-        name = unicode_utils.UNICODE_ATTRIBUTES[code_point]['name']
-        if is_combining_remove(code_point):
-            translit_file.write('% {:s}\n'.format(name))
-            translit_file.write('{:s} ""\n'.format(
-                unicode_utils.ucs_symbol(code_point)))
+    # The members of a block share the category, so a block is checked
+    # once and only visited if its members are combining characters.
+    for first, last in unicode_utils.UNICODE_ATTRIBUTES.runs():
+        if not unicode_utils.is_combining(first):
+            continue
+        for code_point in range(first, last + 1):
+            name = unicode_utils.UNICODE_ATTRIBUTES.name(code_point)
+            if is_combining_remove(code_point):
+                translit_file.write('% {:s}\n'.format(name))
+                translit_file.write('{:s} ""\n'.format(
+                    unicode_utils.ucs_symbol(code_point)))
     translit_file.write('\n')
 
 def output_decompositions(translit_file):
@@ -348,55 +352,64 @@ def output_decompositions(translit_file):
     characters are decomposed and combining characters stripped from
     the decompositions.
     '''
-    for code_point in sorted(unicode_utils.UNICODE_ATTRIBUTES):
-        if special_decompose([code_point]) != [code_point]:
-            decomposed_code_points = [special_decompose([code_point])]
-        else:
-            decomposed_code_points = [canonical_decompose(code_point)]
-        if decomposed_code_points[0]:
-            while True:
-                special_decomposed_code_points = special_decompose(
-                    decomposed_code_points[-1])
-                if (special_decomposed_code_points
-                        != decomposed_code_points[-1]):
+    # The members of a block share the decomposition and none of them
+    # has a special decomposition, so a block without a decomposition
+    # is skipped as a whole.
+    for first, last in unicode_utils.UNICODE_ATTRIBUTES.runs():
+        if (first != last
+                and not unicode_utils.UNICODE_ATTRIBUTES.decomposition(first)):
+            continue
+        for code_point in range(first, last + 1):
+            if special_decompose([code_point]) != [code_point]:
+                decomposed_code_points = [special_decompose([code_point])]
+            else:
+                decomposed_code_points = [canonical_decompose(code_point)]
+            if decomposed_code_points[0]:
+                while True:
+                    special_decomposed_code_points = special_decompose(
+                        decomposed_code_points[-1])
+                    if (special_decomposed_code_points
+                            != decomposed_code_points[-1]):
+                        decomposed_code_points.append(
+                            special_decomposed_code_points)
+                        continue
+                    special_decomposed_code_points = []
+                    for decomposed_code_point in decomposed_code_points[-1]:
+                        special_decomposed_code_points += special_decompose(
+                            [decomposed_code_point])
+                    if (special_decomposed_code_points
+                            == decomposed_code_points[-1]):
+                        break
                     decomposed_code_points.append(
                         special_decomposed_code_points)
-                    continue
-                special_decomposed_code_points = []
-                for decomposed_code_point in decomposed_code_points[-1]:
-                    special_decomposed_code_points += special_decompose(
-                        [decomposed_code_point])
-                if (special_decomposed_code_points
-                        == decomposed_code_points[-1]):
-                    break
-                decomposed_code_points.append(
-                    special_decomposed_code_points)
-            for index in range(0, len(decomposed_code_points)):
-                decomposed_code_points[index] = [
-                    x for x in decomposed_code_points[index]
-                    if not is_combining_remove(x)]
-        if decomposed_code_points[0]:
-            translit_file.write('% {:s}\n'.format(
-                unicode_utils.UNICODE_ATTRIBUTES[code_point]['name']))
-            translit_file.write('{:s} '.format(
-                unicode_utils.ucs_symbol(code_point)))
-            for index in range(0, len(decomposed_code_points)):
-                if index > 0:
-                    translit_file.write(';')
-                if len(decomposed_code_points[index]) > 1:
-                    translit_file.write('"')
-                for decomposed_code_point in decomposed_code_points[index]:
-                    translit_file.write('{:s}'.format(
-                        unicode_utils.ucs_symbol(decomposed_code_point)))
-                if len(decomposed_code_points[index]) > 1:
-                    translit_file.write('"')
-            translit_file.write('\n')
+                for index in range(0, len(decomposed_code_points)):
+                    decomposed_code_points[index] = [
+                        x for x in decomposed_code_points[index]
+                        if not is_combining_remove(x)]
+            if decomposed_code_points[0]:
+                translit_file.write('% {:s}\n'.format(
+                    unicode_utils.UNICODE_ATTRIBUTES.name(code_point)))
+                translit_file.write('{:s} '.format(
+                    unicode_utils.ucs_symbol(code_point)))
+                for index in range(0, len(decomposed_code_points)):
+                    if index > 0:
+                        translit_file.write(';')
+                    if len(decomposed_code_points[index]) > 1:
+                        translit_file.write('"')
+                    for decomposed_code_point in decomposed_code_points[index]:
+                        translit_file.write('{:s}'.format(
+                            unicode_utils.ucs_symbol(decomposed_code_point)))
+                    if len(decomposed_code_points[index]) > 1:
+                        translit_file.write('"')
+                translit_file.write('\n')
     translit_file.write('\n')
 
 def output_transliteration(translit_file):
     '''Write the new transliteration to the output file'''
-    output_combining_remove(translit_file)
-    output_decompositions(translit_file)
+    writer = unicode_utils.WrappedLineWriter(translit_file)
+    output_combining_remove(writer)
+    output_decompositions(writer)
+    writer.flush()
 
 if __name__ == "__main__":
     PARSER = argparse.ArgumentParser(
@@ -436,10 +449,8 @@ if __name__ == "__main__":
     ARGS = PARSER.parse_args()
 
     unicode_utils.fill_attributes(ARGS.unicode_data_file)
-    HEAD = TAIL = ''
-    if ARGS.input_file:
-        (HEAD, TAIL) = read_input_file(ARGS.input_file)
-    with open(ARGS.output_file, mode='w') as TRANSLIT_FILE:
-        output_head(TRANSLIT_FILE, ARGS.unicode_version, head=HEAD)
-        output_transliteration(TRANSLIT_FILE)
-        output_tail(TRANSLIT_FILE, tail=TAIL)
+    with read_input_file(ARGS.input_file) as (HEAD, TAIL):
+        with open(ARGS.output_file, mode='w') as TRANSLIT_FILE:
+            output_head(TRANSLIT_FILE, ARGS.unicode_version, head=HEAD)
+            output_transliteration(TRANSLIT_FILE)
+            output_tail(TRANSLIT_FILE, tail=TAIL)
@@ -33,32 +33,24 @@ import time
 import unicode_utils
 
 def read_input_file(filename):
-    '''Reads the original glibc translit_compat file to get the
+    '''Splits the original glibc translit_compat file into the
     original head and tail.
 
     We want to replace only the part of the file between
     “translit_start” and “translit_end”
+
+    Returns a context manager giving (head, tail), both empty if
+    filename is None, see unicode_utils.split_input_file().
     '''
-    head = tail = ''
-    with open(filename, mode='r') as translit_file:
-        for line in translit_file:
-            head = head + line
-            if line.startswith('translit_start'):
-                break
-        for line in translit_file:
-            if line.startswith('translit_end'):
-                tail = line
-                break
-        for line in translit_file:
-            tail = tail + line
-    return (head, tail)
+    return unicode_utils.split_input_file(
+        filename, 'translit_start', 'translit_end')
 
 def output_head(translit_file, unicode_version, head=''):
     '''Write the header of the output file, i.e. the part of the file
     before the “translit_start” line.
     '''
     if ARGS.input_file and head:
-        translit_file.write(head)
+        head.copy_to(translit_file)
     else:
         translit_file.write('escape_char /\n')
         translit_file.write('comment_char %\n')
@@ -78,7 +70,7 @@ def output_head(translit_file, unicode_version, head=''):
 def output_tail(translit_file, tail=''):
     '''Write the tail of the output file'''
     if ARGS.input_file and tail:
-        translit_file.write(tail)
+        tail.copy_to(translit_file)
     else:
         translit_file.write('translit_end\n')
         translit_file.write('\n')
@@ -111,8 +103,8 @@ def compatibility_decompose(code_point):
 
     because they seem to be not useful for transliteration.
     '''
-    decomposition = unicode_utils.UNICODE_ATTRIBUTES[
-        code_point]['decomposition']
+    decomposition = unicode_utils.UNICODE_ATTRIBUTES.decomposition(
+        code_point)
     compatibility_tags = (
         '<compat>', '<super>', '<sub>', '<vertical>')
     for compatibility_tag in compatibility_tags:
@@ -224,61 +216,72 @@ def special_ligature_decompose(code_point):
 
 def output_transliteration(translit_file):
     '''Write the new transliteration to the output file'''
-    translit_file.write('\n')
-    for code_point in sorted(unicode_utils.UNICODE_ATTRIBUTES):
-        name = unicode_utils.UNICODE_ATTRIBUTES[code_point]['name']
-        decomposed_code_points = [compatibility_decompose(code_point)]
-        if not decomposed_code_points[0]:
-            if special_decompose([code_point]) != [code_point]:
-                decomposed_code_points[0] = special_decompose([code_point])
-        else:
-            special_decomposed_code_points = []
-            while True:
-                special_decomposed_code_points = special_decompose(
-                    decomposed_code_points[-1])
-                if (special_decomposed_code_points
-                        != decomposed_code_points[-1]):
+    writer = unicode_utils.WrappedLineWriter(translit_file)
+    writer.write('\n')
+    name_index = unicode_utils.name_index()
+    ligatures = name_index.search('LIGATURE') - name_index.search('ARABIC')
+    # The members of a block share the decomposition and none of them
+    # has a special decomposition, so a block without a decomposition
+    # is skipped as a whole.
+    for first, last in unicode_utils.UNICODE_ATTRIBUTES.runs():
+        if (first != last
+                and not unicode_utils.UNICODE_ATTRIBUTES.decomposition(first)):
+            continue
+        for code_point in range(first, last + 1):
+            name = unicode_utils.UNICODE_ATTRIBUTES.name(code_point)
+            decomposed_code_points = [compatibility_decompose(code_point)]
+            if not decomposed_code_points[0]:
+                if special_decompose([code_point]) != [code_point]:
+                    decomposed_code_points[0] = special_decompose([code_point])
+            else:
+                special_decomposed_code_points = []
+                while True:
+                    special_decomposed_code_points = special_decompose(
+                        decomposed_code_points[-1])
+                    if (special_decomposed_code_points
+                            != decomposed_code_points[-1]):
+                        decomposed_code_points.append(
+                            special_decomposed_code_points)
+                        continue
+                    special_decomposed_code_points = []
+                    for decomposed_code_point in decomposed_code_points[-1]:
+                        special_decomposed_code_points += special_decompose(
+                            [decomposed_code_point])
+                    if (special_decomposed_code_points
+                            == decomposed_code_points[-1]):
+                        break
                     decomposed_code_points.append(
                         special_decomposed_code_points)
-                    continue
-                special_decomposed_code_points = []
-                for decomposed_code_point in decomposed_code_points[-1]:
-                    special_decomposed_code_points += special_decompose(
-                        [decomposed_code_point])
-                if (special_decomposed_code_points
-                        == decomposed_code_points[-1]):
-                    break
-                decomposed_code_points.append(
-                    special_decomposed_code_points)
-        if decomposed_code_points[0]:
-            translit_file.write('% {:s}\n'.format(name))
-            translit_file.write('{:s} '.format(
-                unicode_utils.ucs_symbol(code_point)))
-            for index in range(0, len(decomposed_code_points)):
-                if index > 0:
-                    translit_file.write(';')
-                translit_file.write('"')
-                for decomposed_code_point in decomposed_code_points[index]:
-                    translit_file.write('{:s}'.format(
-                        unicode_utils.ucs_symbol(decomposed_code_point)))
-                translit_file.write('"')
-            translit_file.write('\n')
-        elif 'LIGATURE' in name and 'ARABIC' not in name:
-            decomposed_code_points = special_ligature_decompose(code_point)
-            if decomposed_code_points[0] != code_point:
-                translit_file.write('% {:s}\n'.format(name))
-                translit_file.write('{:s} '.format(
+            if decomposed_code_points[0]:
+                writer.write('% {:s}\n'.format(name))
+                writer.write('{:s} '.format(
                     unicode_utils.ucs_symbol(code_point)))
-                translit_file.write('"')
-                for decomposed_code_point in decomposed_code_points:
-                    translit_file.write('{:s}'.format(
-                        unicode_utils.ucs_symbol(decomposed_code_point)))
-                translit_file.write('"')
-                translit_file.write('\n')
-            else:
-                print('Warning: unhandled ligature: {:x} {:s}'.format(
-                    code_point, name))
-    translit_file.write('\n')
+                for index in range(0, len(decomposed_code_points)):
+                    if index > 0:
+                        writer.write(';')
+                    writer.write('"')
+                    for decomposed_code_point in decomposed_code_points[index]:
+                        writer.write('{:s}'.format(
+                            unicode_utils.ucs_symbol(decomposed_code_point)))
+                    writer.write('"')
+                writer.write('\n')
+            elif code_point in ligatures:
+                decomposed_code_points = special_ligature_decompose(code_point)
+                if decomposed_code_points[0] != code_point:
+                    writer.write('% {:s}\n'.format(name))
+                    writer.write('{:s} '.format(
+                        unicode_utils.ucs_symbol(code_point)))
+                    writer.write('"')
+                    for decomposed_code_point in decomposed_code_points:
+                        writer.write('{:s}'.format(
+                            unicode_utils.ucs_symbol(decomposed_code_point)))
+                    writer.write('"')
+                    writer.write('\n')
+                else:
+                    print('Warning: unhandled ligature: {:x} {:s}'.format(
+                        code_point, name))
+    writer.write('\n')
+    writer.flush()
 
 if __name__ == "__main__":
     PARSER = argparse.ArgumentParser(
@@ -318,10 +321,8 @@ if __name__ == "__main__":
     ARGS = PARSER.parse_args()
 
     unicode_utils.fill_attributes(ARGS.unicode_data_file)
-    HEAD = TAIL = ''
-    if ARGS.input_file:
-        (HEAD, TAIL) = read_input_file(ARGS.input_file)
-    with open(ARGS.output_file, mode='w') as TRANSLIT_FILE:
-        output_head(TRANSLIT_FILE, ARGS.unicode_version, head=HEAD)
-        output_transliteration(TRANSLIT_FILE)
-        output_tail(TRANSLIT_FILE, tail=TAIL)
+    with read_input_file(ARGS.input_file) as (HEAD, TAIL):
+        with open(ARGS.output_file, mode='w') as TRANSLIT_FILE:
+            output_head(TRANSLIT_FILE, ARGS.unicode_version, head=HEAD)
+            output_transliteration(TRANSLIT_FILE)
+            output_tail(TRANSLIT_FILE, tail=TAIL)
@@ -30,66 +30,72 @@ To see how this script is used, call it with the “-h” option:
 '''
 
 import argparse
+import sys
+import io
 import time
 import re
 import unicode_utils
+import unicode_ctype
 
-def code_point_ranges(is_class_function):
-    '''Returns a list of ranges of code points for which is_class_function
-    returns True.
+def code_point_ranges(code_point_set):
+    '''Returns a list of the ranges of code points in code_point_set,
+    an IntervalSet like those returned by
+    unicode_utils.UCD.character_classes().
+
+    Runs of at least three single code points two apart, like the
+    alternating upper and lower case letters of Latin Extended-A,
+    Greek or Cyrillic, are merged into one range with the step 2.
 
     Example:
 
-    [[65, 90], [192, 214], [216, 222], [256], … ]
+    [[65, 90], [192, 214], [216, 222], [256, 310, 2], … ]
     '''
-    cp_ranges  = []
-    for code_point in sorted(unicode_utils.UNICODE_ATTRIBUTES):
-        if is_class_function(code_point):
-            if (cp_ranges
-                and cp_ranges[-1][-1] == code_point - 1):
-                if len(cp_ranges[-1]) == 1:
-                    cp_ranges[-1].append(code_point)
-                else:
-                    cp_ranges[-1][-1] = code_point
-            else:
-                cp_ranges.append([code_point])
+    cp_ranges = []
+    # The single code points two apart seen last, not yet in cp_ranges
+    singles = []
+    def flush_singles():
+        if len(singles) >= 3:
+            cp_ranges.append([singles[0], singles[-1], 2])
+        else:
+            cp_ranges.extend([code_point] for code_point in singles)
+        del singles[:]
+    for first, last in code_point_set.runs():
+        if first != last:
+            flush_singles()
+            cp_ranges.append([first, last])
+            continue
+        if singles and first != singles[-1] + 2:
+            flush_singles()
+        singles.append(first)
+    flush_singles()
     return cp_ranges
 
-def output_charclass(i18n_file, class_name, is_class_function):
+def output_charclass(i18n_file, class_name, code_point_set):
     '''Output a LC_CTYPE character class section
 
     Example:
 
     upper /
-       <U0041>..<U005A>;<U00C0>..<U00D6>;<U00D8>..<U00DE>;<U0100>;<U0102>;/
+       <U0041>..<U005A>;<U00C0>..<U00D6>;<U00D8>..<U00DE>;/
+       <U0100>..(2)..<U0136>;<U0139>..(2)..<U0147>;<U014A>..(2)..<U0176>;/
        …
        <U0001D790>..<U0001D7A8>;<U0001D7CA>;<U0001F130>..<U0001F149>;/
        <U0001F150>..<U0001F169>;<U0001F170>..<U0001F189>
     '''
-    cp_ranges = code_point_ranges(is_class_function)
+    cp_ranges = code_point_ranges(code_point_set)
     if cp_ranges:
-        i18n_file.write('%s /\n' %class_name)
-        max_column = 75
-        prefix = '   '
-        line = prefix
-        range_string = ''
-        for code_point_range in cp_ranges:
-            if line.strip():
-                line  += ';'
-            if len(code_point_range) == 1:
-                range_string = unicode_utils.ucs_symbol(code_point_range[0])
-            else:
-                range_string = unicode_utils.ucs_symbol_range(
-                    code_point_range[0], code_point_range[-1])
-            if len(line+range_string) > max_column:
-                i18n_file.write(line+'/\n')
-                line = prefix
-            line += range_string
-        if line.strip():
-            i18n_file.write(line+'\n')
-        i18n_file.write('\n')
+        writer = unicode_utils.WrappedLineWriter(i18n_file)
+        writer.write('%s /\n' %class_name)
+        writer.add_tokens(
+            unicode_utils.ucs_symbol(code_point_range[0])
+            if len(code_point_range) == 1
+            else unicode_utils.ucs_symbol_range(*code_point_range)
+            for code_point_range in cp_ranges)
+        writer.end_tokens()
+        writer.write('\n')
+        writer.flush()
 
-def output_charmap(i18n_file, map_name, map_function):
+def output_charmap(i18n_file, map_name, case_mapping):
     '''Output a LC_CTYPE character map section
 
     Example:
@@ -100,31 +106,36 @@ def output_charmap(i18n_file, map_name, map_function):
       (<U000118DC>,<U000118BC>);(<U000118DD>,<U000118BD>);/
       (<U000118DE>,<U000118BE>);(<U000118DF>,<U000118BF>)
     '''
-    max_column = 75
-    prefix = '   '
-    line = prefix
-    map_string = ''
-    i18n_file.write('%s /\n' %map_name)
-    for code_point in sorted(unicode_utils.UNICODE_ATTRIBUTES):
-        mapped = map_function(code_point)
-        if code_point != mapped:
-            if line.strip():
-                line += ';'
-            map_string = '(' \
-                         + unicode_utils.ucs_symbol(code_point) \
-                         + ',' \
-                         + unicode_utils.ucs_symbol(mapped) \
-                         + ')'
-            if len(line+map_string) > max_column:
-                i18n_file.write(line+'/\n')
-                line = prefix
-            line += map_string
-    if line.strip():
-        i18n_file.write(line+'\n')
-    i18n_file.write('\n')
+    writer = unicode_utils.WrappedLineWriter(i18n_file)
+    writer.write('%s /\n' %map_name)
+    writer.add_tokens(
+        '(' + unicode_utils.ucs_symbol(code_point)
+        + ',' + unicode_utils.ucs_symbol(mapped) + ')'
+        for code_point, mapped in case_mapping.items())
+    writer.end_tokens()
+    writer.write('\n')
+    writer.flush()
+
+# The text of the sections written by output_section(), see there.
+SECTIONS = {}
+
+def output_section(i18n_file, output_function, name, data):
+    '''Write a section with output_charclass() or output_charmap()
+
+    When several output files are written in one run, the character
+    classes and case mappings which are not tailored are the same
+    objects for all of them, so the text of their sections is
+    generated only once and copied into the other files.
+    '''
+    key = (output_function, name, id(data))
+    if key not in SECTIONS or SECTIONS[key][0] is not data:
+        section = io.StringIO()
+        output_function(section, name, data)
+        SECTIONS[key] = (data, section.getvalue())
+    i18n_file.write(SECTIONS[key][1])
 
 def read_input_file(filename):
-    '''Reads the original glibc i18n file to get the original head
+    '''Splits the original glibc i18n file into the original head
     and tail.
 
     We want to replace only the character classes in LC_CTYPE, and the
@@ -132,33 +143,24 @@ def read_input_file(filename):
     To avoid having to cut and paste the generated data into the
     original file, it is helpful to read the original file here
     to be able to generate a complete result file.
+
+    Returns a context manager giving (head, tail), both empty if
+    filename is None, see unicode_utils.split_input_file().
     '''
-    head = tail = ''
-    with open(filename, mode='r') as i18n_file:
-        for line in i18n_file:
-            match = re.match(
-                r'^(?P<key>date\s+)(?P<value>"[0-9]{4}-[0-9]{2}-[0-9]{2}")',
-                line)
-            if match:
-                line = match.group('key') \
-                       + '"{:s}"\n'.format(time.strftime('%Y-%m-%d'))
-            head = head + line
-            if line.startswith('LC_CTYPE'):
-                break
-        for line in i18n_file:
-            if line.startswith('translit_start'):
-                tail = line
-                break
-        for line in i18n_file:
-            tail = tail + line
-    return (head, tail)
+    date = re.compile(
+        rb'^(date[^\S\n]+)"[0-9]{4}-[0-9]{2}-[0-9]{2}"[^\r\n]*',
+        re.MULTILINE)
+    today = '\\1"{:s}"'.format(time.strftime('%Y-%m-%d')).encode('ascii')
+    return unicode_utils.split_input_file(
+        filename, 'LC_CTYPE', 'translit_start',
+        head_substitutions=((date, today),))
 
 def output_head(i18n_file, unicode_version, head=''):
     '''Write the header of the output file, i.e. the part of the file
     before the “LC_CTYPE” line.
     '''
-    if ARGS.input_file and head:
-        i18n_file.write(head)
+    if head:
+        head.copy_to(i18n_file)
     else:
         i18n_file.write('escape_char /\n')
         i18n_file.write('comment_char %\n')
@@ -191,13 +193,19 @@ def output_tail(i18n_file, tail=''):
     '''Write the tail of the output file, i.e. the part of the file
     after the last “LC_CTYPE” character class.
     '''
-    if ARGS.input_file and tail:
-        i18n_file.write(tail)
+    if tail:
+        tail.copy_to(i18n_file)
     else:
         i18n_file.write('END LC_CTYPE\n')
 
-def output_tables(i18n_file, unicode_version, turkish):
-    '''Write the new LC_CTYPE character classes to the output file'''
+def output_tables(i18n_file, unicode_version, classes, tailoring=None):
+    '''Write the new LC_CTYPE character classes to the output file
+
+    classes is the dictionary of the character classes, the case
+    mappings are tailored by the unicode_utils.LocaleTailoring
+    tailoring if it is not None.
+    '''
+    ucd = unicode_utils.DEFAULT_UCD
     i18n_file.write('% The following is the 14652 i18n fdcc-set '
                     + 'LC_CTYPE category.\n')
     i18n_file.write('% It covers Unicode version {:s}.\n'.format(
@@ -208,18 +216,18 @@ def output_tables(i18n_file, unicode_version, turkish):
                     + 'program.\n\n')
     i18n_file.write('% The "upper" class reflects the uppercase '
                     + 'characters of class "alpha"\n')
-    output_charclass(i18n_file, 'upper', unicode_utils.is_upper)
+    output_section(i18n_file, output_charclass, 'upper', classes['upper'])
     i18n_file.write('% The "lower" class reflects the lowercase '
                     + 'characters of class "alpha"\n')
-    output_charclass(i18n_file, 'lower', unicode_utils.is_lower)
+    output_section(i18n_file, output_charclass, 'lower', classes['lower'])
     i18n_file.write('% The "alpha" class of the "i18n" FDCC-set is '
                     + 'reflecting\n')
     i18n_file.write('% the recommendations in TR 10176 annex A\n')
-    output_charclass(i18n_file, 'alpha', unicode_utils.is_alpha)
+    output_section(i18n_file, output_charclass, 'alpha', classes['alpha'])
     i18n_file.write('% The "digit" class must only contain the '
                     + 'BASIC LATIN digits, says ISO C 99\n')
     i18n_file.write('% (sections 7.25.2.1.5 and 5.2.1).\n')
-    output_charclass(i18n_file, 'digit', unicode_utils.is_digit)
+    output_section(i18n_file, output_charclass, 'digit', classes['digit'])
     i18n_file.write('% The "outdigit" information is by default '
                     + '"0" to "9".  We don\'t have to\n')
     i18n_file.write('% provide it here since localedef will fill '
@@ -228,37 +236,165 @@ def output_tables(i18n_file, unicode_version, turkish):
                     + 'their own values.\n')
     i18n_file.write('% outdigit /\n')
     i18n_file.write('%    <U0030>..<U0039>\n\n')
-    # output_charclass(i18n_file, 'outdigit', is_outdigit)
-    output_charclass(i18n_file, 'space', unicode_utils.is_space)
-    output_charclass(i18n_file, 'cntrl', unicode_utils.is_cntrl)
-    output_charclass(i18n_file, 'punct', unicode_utils.is_punct)
-    output_charclass(i18n_file, 'graph', unicode_utils.is_graph)
-    output_charclass(i18n_file, 'print', unicode_utils.is_print)
+    # output_charclass(i18n_file, 'outdigit', classes['outdigit'])
+    output_section(i18n_file, output_charclass, 'space', classes['space'])
+    output_section(i18n_file, output_charclass, 'cntrl', classes['cntrl'])
+    output_section(i18n_file, output_charclass, 'punct', classes['punct'])
+    output_section(i18n_file, output_charclass, 'graph', classes['graph'])
+    output_section(i18n_file, output_charclass, 'print', classes['print'])
     i18n_file.write('% The "xdigit" class must only contain the '
                     + 'BASIC LATIN digits and A-F, a-f,\n')
     i18n_file.write('% says ISO C 99 '
                     + '(sections 7.25.2.1.12 and 6.4.4.1).\n')
-    output_charclass(i18n_file, 'xdigit', unicode_utils.is_xdigit)
-    output_charclass(i18n_file, 'blank', unicode_utils.is_blank)
-    if turkish:
+    output_section(i18n_file, output_charclass, 'xdigit', classes['xdigit'])
+    output_section(i18n_file, output_charclass, 'blank', classes['blank'])
+    if tailoring and tailoring.conventions:
         i18n_file.write('% The case conversions reflect '
-                        + 'Turkish conventions.\n')
-        output_charmap(i18n_file, 'toupper', unicode_utils.to_upper_turkish)
-        output_charmap(i18n_file, 'tolower', unicode_utils.to_lower_turkish)
-    else:
-        output_charmap(i18n_file, 'toupper', unicode_utils.to_upper)
-        output_charmap(i18n_file, 'tolower', unicode_utils.to_lower)
-    output_charmap(i18n_file, 'map "totitle";', unicode_utils.to_title)
+                        + '{:s} conventions.\n'.format(
+                            tailoring.conventions))
+    output_section(i18n_file, output_charmap, 'toupper',
+                   ucd.tailored_case_mapping('upper', tailoring))
+    output_section(i18n_file, output_charmap, 'tolower',
+                   ucd.tailored_case_mapping('lower', tailoring))
+    output_section(i18n_file, output_charmap, 'map "totitle";',
+                   ucd.tailored_case_mapping('title', tailoring))
     i18n_file.write('% The "combining" class reflects ISO/IEC 10646-1 '
                     + 'annex B.1\n')
     i18n_file.write('% That is, all combining characters (level 2+3).\n')
-    output_charclass(i18n_file, 'class "combining";',
-                     unicode_utils.is_combining)
+    output_section(i18n_file, output_charclass, 'class "combining";',
+                   classes['combining'])
     i18n_file.write('% The "combining_level3" class reflects '
                     + 'ISO/IEC 10646-1 annex B.2\n')
     i18n_file.write('% That is, combining characters of level 3.\n')
-    output_charclass(i18n_file, 'class "combining_level3";',
-                     unicode_utils.is_combining_level3)
+    output_section(i18n_file, output_charclass, 'class "combining_level3";',
+                   classes['combining_level3'])
+
+# C types of the typecodes of the arrays in a unicode_utils.TrieTable
+C_TYPES = {'B': 'uint8_t', 'H': 'uint16_t', 'I': 'uint32_t', 'i': 'int32_t'}
+
+def output_c_array(header_file, name, table):
+    '''Output a typed array as a static const C array definition'''
+    header_file.write('static const {:s} {:s}[{:d}] =\n{{\n'.format(
+        C_TYPES[table.typecode], name, len(table)))
+    max_column = 75
+    prefix = '  '
+    line = prefix
+    for value in table:
+        value_string = '{:d},'.format(value)
+        if len(line) + len(value_string) + 1 > max_column:
+            header_file.write(line.rstrip() + '\n')
+            line = prefix
+        line += value_string + ' '
+    if line.strip():
+        header_file.write(line.rstrip() + '\n')
+    header_file.write('};\n\n')
+
+def output_c_lookup(header_file, name, table, return_type):
+    '''Output the C arrays of a unicode_utils.TrieTable and an inline
+    function name(wc) looking up the value of a code point in them'''
+    for level, level_table in enumerate(table.tables):
+        output_c_array(header_file, '{:s}_level{:d}'.format(name, level + 1),
+                       level_table)
+    shifts = table.shifts
+    header_file.write('static inline {:s}\n'.format(return_type))
+    header_file.write('{:s}_value (uint32_t wc)\n{{\n'.format(name))
+    header_file.write('  uint32_t index = {:s}_level1[wc >> {:d}];\n'.format(
+        name, shifts[0]))
+    for level in range(1, len(shifts)):
+        bits = shifts[level-1] - shifts[level]
+        header_file.write(
+            '  index = {:s}_level{:d}[(index << {:d})\n'.format(
+                name, level + 1, bits)
+            + '    + ((wc >> {:d}) & 0x{:X})];\n'.format(
+                shifts[level], (1 << bits) - 1))
+    header_file.write(
+        '  return {:s}_level{:d}[(index << {:d}) + (wc & 0x{:X})];\n'.format(
+            name, len(shifts) + 1, shifts[-1], (1 << shifts[-1]) - 1))
+    header_file.write('}\n\n')
+
+def output_c_header(header_file, unicode_version, classes,
+                    tailoring=None):
+    '''Write a self-contained C header with multi-level lookup tables
+    for the character classes and case mappings written to LC_CTYPE.
+
+    unicode_ctype_classes(wc) returns the UNICODE_CTYPE_* flags of the
+    classes of wc, unicode_ctype_is(wc, UNICODE_CTYPE_ALPHA) tests one
+    class, unicode_ctype_toupper(wc), unicode_ctype_tolower(wc) and
+    unicode_ctype_totitle(wc) return the case mappings.
+    '''
+    ucd = unicode_utils.DEFAULT_UCD
+    header_file.write('/* Generated automatically by gen_unicode_ctype.py '
+                      + 'for Unicode {:s}.\n'.format(unicode_version))
+    header_file.write('   Character classes and case mappings of the '
+                      + 'LC_CTYPE category')
+    if tailoring:
+        header_file.write(' tailored for {:s}'.format(tailoring.name))
+    header_file.write('.  */\n\n')
+    header_file.write('#ifndef UNICODE_CTYPE_H\n')
+    header_file.write('#define UNICODE_CTYPE_H\n\n')
+    header_file.write('#include <stdint.h>\n\n')
+    for name, flag in unicode_utils.CHARACTER_CLASSES.items():
+        header_file.write('#define UNICODE_CTYPE_{:s} 0x{:04X}\n'.format(
+            name.upper(), flag))
+    header_file.write('\n')
+    output_c_lookup(header_file, 'unicode_ctype_classes',
+                    unicode_utils.TrieTable(
+                        unicode_utils.class_flags(classes)),
+                    'uint16_t')
+    header_file.write(
+        'static inline uint16_t\n'
+        + 'unicode_ctype_classes (uint32_t wc)\n{\n'
+        + '  return wc <= 0x{:X} ? unicode_ctype_classes_value (wc) : 0;\n'
+        .format(unicode_utils.MAX_CODE_POINT)
+        + '}\n\n')
+    header_file.write(
+        'static inline int\n'
+        + 'unicode_ctype_is (uint32_t wc, uint16_t flag)\n{\n'
+        + '  return (unicode_ctype_classes (wc) & flag) != 0;\n'
+        + '}\n\n')
+    for field, map_name in (('upper', 'toupper'), ('lower', 'tolower'),
+                            ('title', 'totitle')):
+        name = 'unicode_ctype_' + map_name
+        output_c_lookup(header_file, name,
+                        unicode_utils.TrieTable(
+                            ucd.tailored_case_mapping(
+                                field, tailoring).deltas()),
+                        'int32_t')
+        header_file.write(
+            'static inline uint32_t\n'
+            + '{:s} (uint32_t wc)\n{{\n'.format(name)
+            + '  return wc <= 0x{:X} ? wc + {:s}_value (wc) : wc;\n'.format(
+                unicode_utils.MAX_CODE_POINT, name)
+            + '}\n\n')
+    header_file.write('#endif /* UNICODE_CTYPE_H */\n')
+
+def output_ctype_tables(filename, unicode_version, classes, tailoring=None):
+    '''Write the tables file of the unicode_ctype module for the
+    character classes and case mappings written to LC_CTYPE.
+
+    It is written by unicode_utils.write_snapshot(), the tables are
+    the two stages of a unicode_utils.TrieTable with the shift
+    unicode_ctype.SHIFT for the class flags and for the deltas of each
+    case mapping.
+    '''
+    ucd = unicode_utils.DEFAULT_UCD
+    arrays = {}
+    stages = {'classes': unicode_utils.TrieTable(
+        unicode_utils.class_flags(classes), (unicode_ctype.SHIFT,))}
+    for map_name, field in unicode_ctype.MAPPINGS:
+        stages[map_name] = unicode_utils.TrieTable(
+            ucd.tailored_case_mapping(field, tailoring).deltas(),
+            (unicode_ctype.SHIFT,))
+    for name, table in stages.items():
+        (arrays[name + '_index'], arrays[name + '_values']) = table.tables
+    metadata = {'format': unicode_ctype.TABLES_FORMAT,
+                'version': unicode_ctype.TABLES_VERSION,
+                'unicode_version': unicode_version,
+                'locale': tailoring.name if tailoring else None,
+                'shift': unicode_ctype.SHIFT,
+                'classes': unicode_utils.CHARACTER_CLASSES}
+    unicode_utils.write_snapshot(filename, metadata, arrays,
+                                 ignore_errors=False)
 
 if __name__ == "__main__":
     PARSER = argparse.ArgumentParser(
@@ -289,9 +425,9 @@ if __name__ == "__main__":
         '-o', '--output_file',
         nargs='?',
         type=str,
-        default='i18n.new',
         help='''The file which shall contain the generated LC_CTYPE category,
-        default: %(default)s.  If the original
+        default: i18n.new, none if only --c_header or --ctype_tables
+        is given.  If the original
         glibc/localedata/locales/i18n has been given
         as an option, all data from the original file
         except the newly generated LC_CTYPE character
@@ -307,18 +443,117 @@ if __name__ == "__main__":
     PARSER.add_argument(
         '--turkish',
         action='store_true',
-        help='Use Turkish case conversions.')
+        help='''Use Turkish case conversions, the same as a target
+        with the tailoring tr_TR.''')
+    PARSER.add_argument(
+        '--target',
+        action='append',
+        nargs='+',
+        default=[],
+        metavar='FILE',
+        help='''Followed by INPUT_FILE OUTPUT_FILE [TAILORING]: write
+        OUTPUT_FILE from the original file INPUT_FILE, which may be
+        empty (“''”) to write a file without one, with the locale
+        tailoring TAILORING applied if it is given.  TAILORING is a
+        locale like tr_TR with a file in the tailorings directory or
+        the name of a tailoring file, see
+        unicode_utils.read_locale_tailoring().  Replaces -i, -o and
+        --turkish.  Can be given several times, for example to write
+        i18n and tr_TR in one run.  Only the sections which differ
+        between the targets are generated more than once.''')
+    PARSER.add_argument(
+        '--numpy',
+        action='store_true',
+        help='''Compute the character classes with NumPy, if it is
+        installed.''')
+    PARSER.add_argument(
+        '--check_numpy',
+        action='store_true',
+        help='''Check that NumPy computes the same character classes
+        as the is_* functions and exit.''')
+    PARSER.add_argument(
+        '--c_header',
+        nargs='?',
+        type=str,
+        help='''Also write a C header with lookup tables for the
+        character classes and case mappings of the first output file
+        to this file, see check_c_header.py.  Without -o or --target
+        no LC_CTYPE file is written.''')
+    PARSER.add_argument(
+        '--ctype_tables',
+        nargs='?',
+        type=str,
+        help='''Also write the tables for the unicode_ctype module with
+        the character classes and case mappings of the first output
+        file to this file.  Without -o or --target no LC_CTYPE file is
+        written.''')
     ARGS = PARSER.parse_args()
+    # (input file, output file, tailoring) of all LC_CTYPE files to
+    # write, the tailoring of the first one is also used for --c_header
+    # and --ctype_tables.
+    TARGETS = []
+    SIDE_OUTPUT_TAILORING = (
+        unicode_utils.locale_tailoring('tr_TR') if ARGS.turkish else None)
+    if not ARGS.target:
+        if ARGS.output_file or not (ARGS.c_header or ARGS.ctype_tables):
+            TARGETS.append((ARGS.input_file,
+                            ARGS.output_file or 'i18n.new',
+                            SIDE_OUTPUT_TAILORING))
+    elif ARGS.input_file or ARGS.output_file or ARGS.turkish:
+        PARSER.error('-i, -o and --turkish cannot be used with --target')
+    for FIELDS in ARGS.target:
+        # The fields are separate arguments, file names may contain
+        # any character.
+        if len(FIELDS) == 2:
+            FIELDS.append('')
+        if len(FIELDS) != 3 or not FIELDS[1]:
+            PARSER.error('invalid --target: %s' %' '.join(FIELDS))
+        TAILORING = None
+        if FIELDS[2]:
+            try:
+                TAILORING = unicode_utils.locale_tailoring(FIELDS[2])
+            except OSError as ERROR:
+                PARSER.error('invalid --target: %s: %s'
+                             %(' '.join(FIELDS), ERROR))
+        TARGETS.append((FIELDS[0] or None, FIELDS[1], TAILORING))
 
-    unicode_utils.fill_attributes(
-        ARGS.unicode_data_file)
-    unicode_utils.fill_derived_core_properties(
-        ARGS.derived_core_properties_file)
+    unicode_utils.fill_all(
+        unicode_data_file=ARGS.unicode_data_file,
+        derived_core_properties_file=ARGS.derived_core_properties_file)
+    if ARGS.check_numpy:
+        if unicode_utils.numpy is None:
+            sys.stderr.write('NumPy is not installed\n')
+            exit(1)
+        DIFFERENCES = unicode_utils.DEFAULT_UCD.check_numpy_character_classes()
+        for CLASS_NAME in DIFFERENCES:
+            sys.stderr.write(
+                'NumPy and is_* differ for class "%s"\n' %CLASS_NAME)
+        exit(1 if DIFFERENCES else 0)
     unicode_utils.verifications()
-    HEAD = TAIL = ''
-    if ARGS.input_file:
-        (HEAD, TAIL) = read_input_file(ARGS.input_file)
-    with open(ARGS.output_file, mode='w') as I18N_FILE:
-        output_head(I18N_FILE, ARGS.unicode_version, head=HEAD)
-        output_tables(I18N_FILE, ARGS.unicode_version, ARGS.turkish)
-        output_tail(I18N_FILE, tail=TAIL)
+    if ARGS.numpy:
+        CLASSES = unicode_utils.DEFAULT_UCD.numpy_character_classes()
+    else:
+        CLASSES = unicode_utils.DEFAULT_UCD.character_classes()
+    for (INPUT_FILE, OUTPUT_FILE, TAILORING) in TARGETS:
+        with read_input_file(INPUT_FILE) as (HEAD, TAIL):
+            with open(OUTPUT_FILE, mode='w') as I18N_FILE:
+                output_head(I18N_FILE, ARGS.unicode_version, head=HEAD)
+                output_tables(
+                    I18N_FILE, ARGS.unicode_version,
+                    unicode_utils.DEFAULT_UCD.tailored_character_classes(
+                        TAILORING, CLASSES),
+                    tailoring=TAILORING)
+                output_tail(I18N_FILE, tail=TAIL)
+    if TARGETS:
+        SIDE_OUTPUT_TAILORING = TARGETS[0][2]
+    SIDE_OUTPUT_CLASSES = unicode_utils.DEFAULT_UCD.tailored_character_classes(
+        SIDE_OUTPUT_TAILORING, CLASSES)
+    if ARGS.c_header:
+        with open(ARGS.c_header, mode='w') as HEADER_FILE:
+            output_c_header(HEADER_FILE, ARGS.unicode_version,
+                            SIDE_OUTPUT_CLASSES,
+                            tailoring=SIDE_OUTPUT_TAILORING)
+    if ARGS.ctype_tables:
+        output_ctype_tables(ARGS.ctype_tables, ARGS.unicode_version,
+                            SIDE_OUTPUT_CLASSES,
+                            tailoring=SIDE_OUTPUT_TAILORING)
@@ -0,0 +1,1915 @@
+/* Generated automatically by gen_unicode_ctype.py for Unicode 9.0.0.
+   Character classes and case mappings of the LC_CTYPE category.  */
+
+#ifndef UNICODE_CTYPE_H
+#define UNICODE_CTYPE_H
+
+#include <stdint.h>
+
+#define UNICODE_CTYPE_UPPER 0x0001
+#define UNICODE_CTYPE_LOWER 0x0002
+#define UNICODE_CTYPE_ALPHA 0x0004
+#define UNICODE_CTYPE_DIGIT 0x0008
+#define UNICODE_CTYPE_OUTDIGIT 0x0010
+#define UNICODE_CTYPE_SPACE 0x0020
+#define UNICODE_CTYPE_CNTRL 0x0040
+#define UNICODE_CTYPE_PUNCT 0x0080
+#define UNICODE_CTYPE_GRAPH 0x0100
+#define UNICODE_CTYPE_PRINT 0x0200
+#define UNICODE_CTYPE_XDIGIT 0x0400
+#define UNICODE_CTYPE_BLANK 0x0800
+#define UNICODE_CTYPE_COMBINING 0x1000
+#define UNICODE_CTYPE_COMBINING_LEVEL3 0x2000
+
+static const uint8_t unicode_ctype_classes_level1[272] =
+{
+  0, 1, 2, 3, 4, 5, 5, 5, 5, 6, 7, 5, 5, 8, 9, 10, 11, 12, 13, 14, 15, 16,
+  17, 5, 18, 16, 16, 19, 16, 20, 21, 22, 5, 5, 5, 5, 5, 5, 5, 5, 5, 5, 23,
+  24, 25, 16, 16, 26, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+  16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+  16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+  16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+  16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+  16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+  16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+  16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+  16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+  16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+  16, 27, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 9,
+  9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 9, 28, 9, 9, 9, 9, 9, 9, 9, 9, 9,
+  9, 9, 9, 9, 9, 9, 28,
+};
+
+static const uint16_t unicode_ctype_classes_level2[3712] =
+{
+  0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 8, 16, 17, 18, 19,
+  20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 18, 8, 33, 8, 34, 8,
+  8, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 43, 43, 46, 47, 48, 49,
+  50, 43, 43, 51, 43, 52, 53, 54, 55, 56, 56, 57, 58, 59, 60, 61, 62, 63,
+  64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 73, 77, 78, 79, 80,
+  81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98,
+  99, 100, 101, 56, 102, 103, 104, 56, 105, 106, 107, 108, 109, 110, 111,
+  56, 43, 112, 113, 114, 115, 31, 116, 117, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 118, 43, 119, 120, 121, 43, 122, 43, 123, 124, 125, 31, 31,
+  126, 127, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 128, 129, 43, 43, 130, 131, 132, 133, 134, 43, 135, 136,
+  137, 138, 43, 43, 139, 140, 141, 43, 142, 143, 144, 145, 146, 43, 147,
+  148, 149, 150, 43, 151, 152, 153, 154, 56, 56, 155, 156, 157, 158, 159,
+  160, 43, 161, 43, 162, 163, 164, 165, 56, 166, 167, 18, 18, 18, 18, 18,
+  18, 23, 168, 8, 8, 8, 8, 169, 8, 8, 8, 170, 171, 172, 173, 171, 174,
+  175, 176, 177, 178, 179, 180, 181, 182, 183, 184, 185, 186, 187, 32,
+  188, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 182, 149, 189, 190, 149, 149, 191, 32, 192,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 193, 194, 195, 196, 197,
+  31, 198, 199, 200, 8, 8, 8, 201, 18, 202, 43, 203, 204, 205, 205, 206,
+  149, 207, 208, 56, 209, 149, 149, 210, 149, 149, 149, 149, 149, 149,
+  211, 212, 213, 214, 99, 43, 215, 127, 43, 117, 216, 217, 43, 43, 218,
+  219, 149, 220, 182, 149, 149, 149, 149, 149, 149, 182, 149, 149, 149,
+  149, 149, 149, 149, 149, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 142, 149, 149, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 142,
+  56, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 221, 149, 222, 164, 43, 43, 43, 43, 43, 43, 43, 43, 223, 224, 8,
+  225, 226, 43, 43, 227, 228, 229, 8, 230, 231, 232, 56, 233, 234, 235,
+  43, 236, 237, 238, 239, 240, 43, 241, 242, 243, 60, 244, 245, 246, 43,
+  247, 248, 249, 43, 250, 251, 252, 253, 254, 255, 256, 18, 18, 43, 257,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 258, 259, 260, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 261, 43, 43,
+  262, 56, 263, 264, 265, 43, 43, 266, 267, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 164, 268, 43, 269, 43, 270, 271, 272, 273, 274, 275, 43, 43,
+  43, 276, 277, 278, 279, 280, 43, 143, 281, 282, 283, 284, 285, 56, 43,
+  43, 43, 219, 286, 287, 43, 288, 289, 290, 291, 292, 56, 56, 56, 56, 243,
+  43, 293, 294, 43, 220, 295, 296, 297, 43, 298, 56, 31, 299, 300, 43,
+  301, 302, 303, 304, 43, 305, 43, 306, 56, 56, 56, 56, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 204, 142, 270, 56, 56, 56, 56, 307, 308, 309, 310,
+  143, 311, 56, 312, 313, 314, 56, 56, 43, 315, 316, 149, 317, 318, 319,
+  320, 320, 56, 321, 322, 43, 323, 324, 325, 326, 327, 56, 56, 43, 43,
+  328, 56, 31, 329, 18, 330, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  182, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 159, 331, 332, 333,
+  334, 335, 336, 337, 338, 339, 220, 340, 159, 341, 342, 343, 344, 345,
+  56, 56, 346, 347, 348, 349, 350, 73, 351, 352, 56, 56, 56, 56, 43, 353,
+  354, 56, 43, 355, 356, 56, 56, 56, 56, 56, 43, 357, 358, 56, 43, 359,
+  360, 361, 43, 362, 363, 56, 364, 365, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 31, 18, 366, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 43, 367, 56, 56, 56, 56, 56, 56, 56, 56, 368, 369, 370, 371,
+  372, 373, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 262, 56, 56, 56, 43, 43, 43, 374, 43, 43, 43, 43, 43, 43,
+  375, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 376, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 377, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 367, 143, 378, 56, 56, 268,
+  379, 43, 380, 381, 382, 383, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 43, 43,
+  384, 385, 386, 56, 56, 387, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 388, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 389, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 390, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 43, 43, 43,
+  391, 392, 393, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 149, 149, 149, 149, 149,
+  149, 149, 211, 149, 394, 149, 395, 396, 397, 149, 398, 149, 149, 399,
+  56, 56, 56, 56, 56, 149, 149, 400, 401, 56, 56, 56, 56, 402, 403, 404,
+  405, 406, 407, 408, 409, 410, 411, 412, 413, 414, 402, 403, 415, 405,
+  416, 417, 418, 409, 419, 420, 421, 422, 423, 424, 425, 426, 427, 428,
+  43, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 429, 430, 429, 431, 432, 433, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 434,
+  435, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 43, 43, 43, 43, 43, 43, 436, 56, 31,
+  437, 438, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 439, 440, 441, 442, 443, 444, 56, 445, 56, 56, 56, 56,
+  56, 56, 56, 56, 149, 446, 149, 149, 210, 447, 448, 211, 449, 450, 451,
+  452, 453, 361, 56, 454, 455, 456, 457, 56, 56, 56, 56, 56, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  458, 459, 149, 149, 149, 210, 149, 149, 460, 56, 446, 149, 461, 149,
+  462, 463, 56, 56, 464, 465, 466, 56, 401, 56, 290, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 204, 56, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 467, 43, 43, 43, 43,
+  43, 43, 301, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 390, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43, 43,
+  43, 43, 43, 43, 301, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 468,
+  149, 149, 149, 56, 56, 56, 56, 429, 429, 429, 429, 429, 429, 429, 469,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56, 56,
+  56, 56, 56, 56, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149, 149,
+  149, 149, 149, 149, 470,
+};
+
+static const uint16_t unicode_ctype_classes_level3[15072] =
+{
+  64, 64, 64, 64, 64, 64, 64, 64, 64, 2144, 96, 96, 96, 96, 64, 64, 64,
+  64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 2592, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  1816, 1816, 1816, 1816, 1816, 1816, 1816, 1816, 1816, 1816, 896, 896,
+  896, 896, 896, 896, 896, 1797, 1797, 1797, 1797, 1797, 1797, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 896, 896, 896, 896, 896, 896, 1798, 1798, 1798,
+  1798, 1798, 1798, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 896, 896, 896, 896, 64, 64,
+  64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64,
+  64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 774, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 774, 896, 896, 896, 896, 774, 896, 896, 896, 896, 896,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 896, 773, 773, 773, 773,
+  773, 773, 773, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 896,
+  774, 774, 774, 774, 774, 774, 774, 774, 773, 774, 773, 774, 773, 774,
+  773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774,
+  773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774,
+  773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774,
+  773, 774, 773, 774, 773, 774, 773, 774, 774, 773, 774, 773, 774, 773,
+  774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 774, 773, 774,
+  773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774,
+  773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774,
+  773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774,
+  773, 774, 773, 773, 774, 773, 774, 773, 774, 774, 774, 773, 773, 774,
+  773, 774, 773, 773, 774, 773, 773, 773, 774, 774, 773, 773, 773, 773,
+  774, 773, 773, 774, 773, 773, 773, 774, 774, 774, 773, 773, 774, 773,
+  773, 774, 773, 774, 773, 774, 773, 773, 774, 773, 774, 774, 773, 774,
+  773, 773, 774, 773, 773, 773, 774, 773, 774, 773, 773, 774, 774, 772,
+  773, 774, 774, 774, 772, 772, 772, 772, 773, 775, 774, 773, 775, 774,
+  773, 775, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773,
+  774, 773, 774, 773, 774, 774, 773, 774, 773, 774, 773, 774, 773, 774,
+  773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 774, 773, 775, 774,
+  773, 774, 773, 773, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774,
+  773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774,
+  773, 774, 773, 774, 774, 774, 774, 774, 774, 774, 773, 773, 774, 773,
+  773, 774, 774, 773, 774, 773, 773, 773, 773, 774, 773, 774, 773, 774,
+  773, 774, 773, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 772, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 772, 772, 772,
+  772, 772, 772, 772, 774, 774, 896, 896, 896, 896, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 774, 774, 774, 774, 774, 896,
+  896, 896, 896, 896, 896, 896, 772, 896, 772, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 4992, 4992,
+  4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992,
+  4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992,
+  4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992,
+  4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992,
+  4992, 4992, 13184, 13184, 13184, 13184, 13184, 4992, 4992, 4992, 4992,
+  4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4870, 4992, 4992, 4992,
+  4992, 4992, 4992, 4992, 4992, 4992, 13184, 4992, 4992, 4992, 4992, 4992,
+  4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992,
+  4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992,
+  4992, 4992, 4992, 773, 774, 773, 774, 772, 896, 773, 774, 0, 0, 774,
+  774, 774, 774, 896, 773, 0, 0, 0, 0, 896, 896, 773, 896, 773, 773, 773,
+  0, 773, 0, 773, 773, 774, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 0, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 773, 774, 774, 773,
+  773, 773, 774, 774, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773,
+  774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773,
+  774, 774, 774, 774, 774, 773, 774, 896, 773, 774, 773, 773, 774, 774,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 773, 774, 896,
+  4992, 4992, 4992, 4992, 4992, 13184, 13184, 773, 774, 773, 774, 773,
+  774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773,
+  774, 773, 774, 773, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774,
+  773, 774, 773, 774, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773,
+  774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773,
+  774, 773, 774, 773, 774, 773, 774, 773, 774, 0, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 0, 0, 772, 896, 896, 896, 896, 896, 896, 0,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 0, 896, 896, 0,
+  0, 896, 896, 896, 0, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992,
+  4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992,
+  4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 896, 13060, 896, 13060, 13060, 896, 4868, 4868,
+  896, 13060, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 772, 772, 772, 896, 896, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 4868, 4868, 4868, 4868, 4868,
+  4868, 4868, 4868, 13060, 13060, 13060, 896, 896, 0, 896, 896, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 4868, 4868, 4868, 4868,
+  4868, 4992, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 896, 896, 896, 896, 772, 772, 13060,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 896, 772, 4868, 4868, 4868, 4868,
+  4868, 4868, 4868, 896, 896, 4992, 4992, 4868, 4868, 4868, 4868, 772,
+  772, 4868, 4868, 896, 4992, 4992, 4992, 4868, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 896, 896, 772, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 896,
+  772, 13060, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868,
+  4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4992, 4992, 4992, 4992,
+  4992, 4992, 4992, 4992, 4992, 4992, 4992, 0, 0, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 4992,
+  4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 772, 772, 896, 896, 896,
+  896, 772, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 4868,
+  4868, 4992, 4992, 772, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868,
+  4868, 772, 4868, 4868, 4868, 772, 4868, 4868, 4868, 4868, 4992, 0, 0,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 4992, 4992,
+  4992, 0, 0, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 0, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4868, 4868, 4868, 4868,
+  4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4992, 4992, 896, 4868,
+  4868, 4868, 4868, 4868, 4868, 4868, 4992, 4992, 4992, 4992, 4992, 4992,
+  13060, 13060, 13060, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868,
+  4868, 4868, 4868, 4868, 4868, 13060, 13060, 13060, 13060, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 13060, 13060, 13184, 772,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13184, 13060, 13060, 772, 4992, 4992,
+  4992, 4992, 13060, 13060, 13060, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 13060, 13060, 896, 896, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 896, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 13060, 13060, 13060, 0, 772, 772, 772,
+  772, 772, 772, 772, 772, 0, 0, 772, 772, 0, 0, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 0, 772, 772, 772, 772, 772, 772, 772, 0, 772, 0, 0, 0,
+  772, 772, 772, 772, 0, 0, 13184, 772, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 0, 0, 13060, 13060, 0, 0, 13060, 13060, 13184, 772, 0, 0,
+  0, 0, 0, 0, 0, 0, 13060, 0, 0, 0, 0, 772, 772, 0, 772, 772, 772, 13060,
+  13060, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 13060,
+  13060, 13060, 0, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 772, 772, 0,
+  0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 0, 772, 772, 772, 772, 772, 772,
+  772, 0, 772, 772, 0, 772, 772, 0, 772, 772, 0, 0, 13184, 0, 13060,
+  13060, 13060, 13060, 13060, 0, 0, 0, 0, 13060, 13060, 0, 0, 13060,
+  13060, 13184, 0, 0, 0, 13060, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772,
+  0, 772, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 13060, 13060, 772, 772, 772, 13060, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 13060, 13060, 13060, 0, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 0, 772, 772, 772, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 772,
+  772, 772, 772, 772, 772, 772, 0, 772, 772, 0, 772, 772, 772, 772, 772,
+  0, 0, 13184, 772, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 0, 13060, 13060, 13060, 0, 13060, 13060, 13184, 0, 0, 772, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 13060, 13060, 0, 0,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 896, 896, 0, 0, 0, 0,
+  0, 0, 0, 772, 0, 0, 0, 0, 0, 0, 0, 13060, 13060, 13060, 0, 772, 772,
+  772, 772, 772, 772, 772, 772, 0, 0, 772, 772, 0, 0, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 13060, 13060, 13060, 13060,
+  13060, 0, 0, 13060, 13060, 0, 0, 13060, 13060, 13184, 0, 0, 0, 0, 0, 0,
+  0, 0, 13060, 13060, 0, 0, 0, 0, 772, 772, 0, 772, 772, 772, 13060,
+  13060, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 896, 772,
+  896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13060, 772,
+  0, 772, 772, 772, 772, 772, 772, 0, 0, 0, 772, 772, 772, 0, 772, 772,
+  772, 772, 0, 0, 0, 772, 772, 0, 772, 0, 772, 772, 0, 0, 0, 772, 772, 0,
+  0, 0, 772, 772, 772, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 0, 0, 0, 0, 13060, 13060, 13060, 13060, 13060, 0, 0,
+  0, 13060, 13060, 13060, 0, 13060, 13060, 13060, 13184, 0, 0, 772, 0, 0,
+  0, 0, 0, 0, 13060, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 13060, 13060, 13060, 13060, 0,
+  772, 772, 772, 772, 772, 772, 772, 772, 0, 772, 772, 772, 0, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 0, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 772, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 0, 13060, 13060, 13060, 0, 13060,
+  13060, 13060, 13184, 0, 0, 0, 0, 0, 0, 0, 13060, 13060, 0, 772, 772,
+  772, 0, 0, 0, 0, 0, 772, 772, 13060, 13060, 0, 0, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 0, 0, 896, 896, 896,
+  896, 896, 896, 896, 896, 772, 13060, 13060, 13060, 0, 772, 772, 772,
+  772, 772, 772, 772, 772, 0, 772, 772, 772, 0, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  0, 772, 772, 772, 772, 772, 0, 0, 13184, 772, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 0, 13060, 13060, 13060, 0, 13060, 13060,
+  13060, 13184, 0, 0, 0, 0, 0, 0, 0, 13060, 13060, 0, 0, 0, 0, 0, 0, 0,
+  772, 0, 772, 772, 13060, 13060, 0, 0, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 0, 772, 772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  13060, 13060, 13060, 0, 772, 772, 772, 772, 772, 772, 772, 772, 0, 772,
+  772, 772, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 0, 0, 772, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 0,
+  13060, 13060, 13060, 0, 13060, 13060, 13060, 13184, 772, 896, 0, 0, 0,
+  0, 772, 772, 772, 13060, 896, 896, 896, 896, 896, 896, 896, 772, 772,
+  772, 13060, 13060, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 772, 772, 772,
+  772, 772, 772, 0, 0, 13060, 13060, 0, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 0, 772, 0, 0, 772, 772, 772, 772, 772, 772, 772, 0,
+  0, 0, 13184, 0, 0, 0, 0, 13060, 13060, 13060, 13060, 13060, 13060, 0,
+  13060, 0, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 0, 0,
+  0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0,
+  13060, 13060, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 13060, 772, 772, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 0, 0, 0, 0, 896, 772, 772, 772, 772, 772, 772, 772, 13184,
+  13184, 13184, 13184, 13184, 13184, 13060, 13184, 896, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 896, 896, 0, 0, 0, 0, 0, 772, 772, 0,
+  772, 0, 0, 772, 772, 0, 772, 0, 0, 772, 0, 0, 0, 0, 0, 0, 772, 772, 772,
+  772, 0, 772, 772, 772, 772, 772, 772, 772, 0, 772, 772, 772, 0, 772, 0,
+  772, 0, 0, 772, 772, 0, 772, 772, 772, 772, 13060, 772, 772, 13060,
+  13060, 13060, 13060, 13060, 13060, 0, 13060, 13060, 772, 0, 0, 772, 772,
+  772, 772, 772, 0, 772, 0, 13184, 13184, 13184, 13184, 13184, 13060, 0,
+  0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 772, 772,
+  772, 772, 772, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 4992, 4992,
+  896, 896, 896, 896, 896, 896, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 4992,
+  896, 4992, 896, 4992, 896, 896, 896, 896, 13184, 13184, 772, 772, 772,
+  772, 772, 772, 772, 772, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0,
+  0, 0, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 4992, 4992,
+  13184, 896, 4992, 4992, 772, 772, 772, 772, 772, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 0, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 0, 896, 896, 896, 896, 896, 896, 896, 896,
+  4992, 896, 896, 896, 896, 896, 896, 0, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13184, 13060, 13184,
+  13184, 13060, 13060, 13060, 13060, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 896, 896, 896, 896, 896, 896, 772, 772, 772, 772,
+  772, 772, 13060, 13060, 13060, 13060, 772, 772, 772, 772, 13060, 13060,
+  13060, 772, 13060, 13184, 13184, 772, 772, 13060, 13060, 13184, 13184,
+  13184, 13184, 13184, 772, 772, 772, 13060, 13060, 13060, 13060, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 13060,
+  13060, 13060, 13060, 13060, 13184, 13184, 13184, 13184, 13184, 13184,
+  4992, 772, 13184, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  13184, 13184, 13060, 13060, 896, 896, 773, 773, 773, 773, 773, 773, 0,
+  773, 0, 0, 0, 0, 0, 773, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 896, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 0, 772, 772, 772, 772, 0, 0, 772,
+  772, 772, 772, 772, 772, 772, 0, 772, 0, 772, 772, 772, 772, 0, 0, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 0, 772, 772, 772, 772, 0, 0,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 0, 772, 772, 772, 772, 0, 0, 772, 772, 772,
+  772, 772, 772, 772, 0, 772, 0, 772, 772, 772, 772, 0, 0, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 772, 772, 772, 772, 0,
+  0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 0, 0, 4992, 4992, 4868, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0,
+  0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0,
+  0, 0, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 0, 0, 774, 774, 774, 774,
+  774, 774, 0, 0, 896, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 896, 896, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 2592, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 896, 896, 0, 0, 0,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 896, 896, 896,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0,
+  0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0,
+  772, 772, 772, 772, 13060, 13060, 13184, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 13060, 13060, 13184, 896, 896, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 13060, 13060, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0,
+  772, 772, 772, 0, 13060, 13060, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 13184, 13184, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13184, 13184, 13184, 13184, 13184,
+  13184, 13184, 13184, 13184, 13184, 13184, 896, 896, 896, 772, 896, 896,
+  896, 896, 772, 4992, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 0, 0, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  0, 0, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  13184, 13184, 13184, 896, 0, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 13060, 13060, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 4868, 772, 0, 0, 0, 0, 0, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 0, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 0, 0, 0, 0, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 4992, 4992, 4992, 0, 0, 0, 0, 896, 0, 0, 0,
+  896, 896, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0,
+  0, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 896, 0, 0, 0, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 4868,
+  4868, 13060, 13060, 13060, 0, 0, 896, 896, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 0, 13184, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 0, 0,
+  4992, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0,
+  0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0,
+  896, 896, 896, 896, 896, 896, 896, 772, 896, 896, 896, 896, 896, 896, 0,
+  0, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992,
+  4992, 4992, 4992, 13184, 0, 13060, 13060, 13060, 13060, 13060, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 13184, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13184, 772, 772,
+  772, 772, 772, 772, 772, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 4992, 4992, 4992, 4992, 4992, 4992, 4992,
+  4992, 4992, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 13060,
+  13060, 13060, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13184, 13184, 13060, 13060, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 13184, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13184, 13184, 0, 0, 0, 0, 0,
+  0, 0, 0, 896, 896, 896, 896, 772, 772, 772, 772, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13184, 13184, 0, 0, 0, 896, 896, 896,
+  896, 896, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 896, 896, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0,
+  0, 0, 0, 4992, 4992, 4992, 896, 13184, 4992, 4992, 4992, 4992, 4992,
+  4992, 4992, 4992, 4992, 4992, 4992, 4992, 13184, 13184, 13184, 13184,
+  13184, 13184, 13184, 13184, 772, 772, 772, 772, 4992, 772, 772, 772,
+  772, 13060, 13060, 4992, 772, 772, 0, 4992, 4992, 0, 0, 0, 0, 0, 0,
+  4992, 4992, 4992, 4992, 4992, 4992, 4992, 4868, 4868, 4868, 4868, 4868,
+  4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4992, 0, 0, 0, 0,
+  0, 4992, 4992, 4992, 4992, 4992, 773, 774, 773, 774, 773, 774, 773, 774,
+  773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 773, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 773, 773, 773, 773, 773, 773, 773, 773, 774, 774,
+  774, 774, 774, 774, 0, 0, 773, 773, 773, 773, 773, 773, 0, 0, 774, 774,
+  774, 774, 774, 774, 774, 774, 773, 773, 773, 773, 773, 773, 773, 773,
+  774, 774, 774, 774, 774, 774, 774, 774, 773, 773, 773, 773, 773, 773,
+  773, 773, 774, 774, 774, 774, 774, 774, 0, 0, 773, 773, 773, 773, 773,
+  773, 0, 0, 774, 774, 774, 774, 774, 774, 774, 774, 0, 773, 0, 773, 0,
+  773, 0, 773, 774, 774, 774, 774, 774, 774, 774, 774, 773, 773, 773, 773,
+  773, 773, 773, 773, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 0, 0, 774, 774, 774, 774, 774, 774, 774, 774, 773,
+  773, 773, 773, 773, 773, 773, 773, 774, 774, 774, 774, 774, 0, 774, 774,
+  773, 773, 773, 773, 773, 896, 774, 896, 896, 896, 774, 774, 774, 0, 774,
+  774, 773, 773, 773, 773, 773, 896, 896, 896, 774, 774, 774, 774, 0, 0,
+  774, 774, 773, 773, 773, 773, 0, 896, 896, 896, 774, 774, 774, 774, 774,
+  774, 774, 774, 773, 773, 773, 773, 773, 896, 896, 896, 0, 0, 774, 774,
+  774, 0, 774, 774, 773, 773, 773, 773, 773, 896, 896, 0, 2592, 2592,
+  2592, 2592, 2592, 2592, 2592, 896, 2592, 2592, 2592, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 96, 96, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 2592, 896, 896, 896, 896,
+  896, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 774, 0,
+  0, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 774, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 0, 0, 0,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4992,
+  4992, 13184, 13184, 4992, 4992, 4992, 4992, 13184, 13184, 13184, 4992,
+  4992, 13184, 13184, 13184, 13184, 4992, 13184, 13184, 13184, 13184,
+  13184, 4992, 4992, 4992, 13184, 13184, 4992, 4992, 4992, 4992, 4992, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 896, 896, 773, 896, 896, 896,
+  896, 773, 896, 896, 774, 773, 773, 773, 774, 774, 773, 773, 773, 774,
+  896, 773, 896, 896, 896, 773, 773, 773, 773, 773, 896, 896, 896, 896,
+  896, 896, 773, 896, 773, 896, 773, 896, 773, 773, 773, 773, 896, 774,
+  773, 773, 773, 773, 774, 772, 772, 772, 772, 774, 896, 896, 774, 774,
+  773, 773, 896, 896, 896, 896, 896, 773, 774, 774, 774, 774, 896, 896,
+  896, 896, 774, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 772, 772, 772, 773, 774, 772, 772, 772,
+  772, 896, 896, 896, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 896, 896, 896, 896, 896,
+  896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 0, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 0, 773, 774, 773, 773, 773,
+  774, 774, 773, 774, 773, 774, 773, 774, 773, 773, 773, 773, 774, 773,
+  774, 774, 773, 774, 774, 774, 774, 774, 774, 774, 774, 773, 773, 773,
+  774, 773, 774, 774, 896, 896, 896, 896, 896, 896, 773, 774, 773, 774,
+  4992, 4992, 4992, 773, 774, 0, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896,
+  896, 774, 774, 774, 774, 774, 774, 0, 774, 0, 0, 0, 0, 0, 774, 0, 0,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 0,
+  772, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13184, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772,
+  772, 772, 772, 772, 772, 0, 772, 772, 772, 772, 772, 772, 772, 0, 772,
+  772, 772, 772, 772, 772, 772, 0, 772, 772, 772, 772, 772, 772, 772, 0,
+  4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868,
+  4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868,
+  4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 772, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 0, 0, 0, 0, 2592, 896, 896, 896, 896, 772, 772, 772, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 4992, 4992, 4992, 4992, 4992, 4992, 896, 772, 772, 772,
+  772, 772, 896, 896, 772, 772, 772, 772, 772, 896, 896, 896, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 0, 0, 13184, 13184, 896, 896, 772,
+  772, 772, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 0, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 896, 896,
+  896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 896,
+  896, 896, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774,
+  772, 4992, 13184, 13184, 13184, 896, 4868, 4868, 4868, 4868, 4868, 4868,
+  4868, 4868, 4992, 4992, 896, 772, 773, 774, 773, 774, 773, 774, 773,
+  774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773,
+  774, 773, 774, 773, 774, 773, 774, 774, 774, 4868, 4868, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 4992,
+  4992, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 896, 896, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774,
+  773, 774, 773, 774, 774, 774, 773, 774, 773, 774, 773, 774, 773, 774,
+  773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774,
+  773, 774, 773, 774, 773, 774, 773, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 773, 774, 773, 774, 773, 773, 774, 773, 774, 773, 774,
+  773, 774, 773, 774, 772, 896, 896, 773, 774, 773, 774, 772, 773, 774,
+  773, 774, 774, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 774,
+  773, 774, 773, 774, 773, 774, 773, 774, 773, 774, 773, 773, 773, 773,
+  773, 0, 773, 773, 773, 773, 773, 774, 773, 774, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  772, 774, 774, 774, 772, 772, 772, 772, 772, 772, 772, 13184, 772, 772,
+  772, 13184, 772, 772, 772, 772, 13184, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 13060, 13060, 13060, 13060, 13060, 896, 896, 896, 896, 0,
+  0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0,
+  0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0,
+  0, 0, 13060, 13060, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13184, 13060, 0, 0, 0, 0, 0, 0, 0, 0,
+  896, 896, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0,
+  0, 0, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992,
+  4992, 4992, 4992, 4992, 4992, 4992, 4992, 772, 772, 772, 772, 772, 772,
+  896, 896, 896, 772, 896, 772, 0, 0, 772, 772, 772, 772, 772, 772, 13060,
+  13060, 13060, 13060, 13060, 4992, 4992, 4992, 896, 896, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13184, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 896, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 13184, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13184, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0,
+  0, 0, 0, 896, 896, 772, 772, 772, 772, 772, 13184, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 0, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772,
+  772, 13060, 772, 772, 772, 772, 772, 772, 772, 772, 13060, 13060, 0, 0,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 896, 896, 896,
+  896, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 896, 896, 896, 772,
+  13184, 13184, 13184, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 4868, 772, 4868, 4868, 4868,
+  772, 772, 4868, 4868, 772, 772, 772, 772, 772, 4868, 4992, 772, 4992,
+  772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 772, 772, 772, 896, 896, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 13060, 13060, 13060, 13060, 13060, 896, 896, 772, 772,
+  772, 13060, 13184, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772,
+  772, 772, 0, 0, 772, 772, 772, 772, 772, 772, 0, 0, 772, 772, 772, 772,
+  772, 772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772,
+  0, 772, 772, 772, 772, 772, 772, 772, 0, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 896, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  772, 772, 772, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  896, 13184, 13184, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 0, 0, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 774, 774, 774,
+  774, 774, 774, 774, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 774, 774, 774,
+  774, 774, 0, 0, 0, 0, 0, 772, 13060, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 896, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 0, 772, 772, 772, 772, 772, 0, 772, 0, 772, 772, 0, 772,
+  772, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 896, 896, 0, 0, 13184, 13184, 13184, 13184, 13184, 13184, 13184,
+  13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 4992, 4992,
+  4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992,
+  4992, 4992, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0,
+  896, 896, 896, 896, 0, 0, 0, 0, 772, 772, 772, 772, 772, 0, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 896, 0, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 896, 896, 896, 896, 896,
+  896, 896, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  896, 896, 896, 896, 896, 896, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0,
+  772, 772, 772, 772, 772, 772, 0, 0, 772, 772, 772, 772, 772, 772, 0, 0,
+  772, 772, 772, 772, 772, 772, 0, 0, 772, 772, 772, 0, 0, 0, 896, 896,
+  896, 896, 896, 896, 896, 0, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 896, 896, 896, 896, 896, 0, 0, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 0, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 0, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 772, 772, 0,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 0, 0, 896, 896, 896, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 896,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 4992, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 4992, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  4868, 4868, 4868, 4868, 4868, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 896, 772, 772,
+  772, 772, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 896, 772,
+  772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 773, 773, 773, 773,
+  773, 773, 773, 773, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 0, 0, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 0, 0, 0, 0, 0, 0, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 0,
+  0, 0, 0, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 0, 0, 0, 0, 772, 772,
+  772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 896, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 0, 0, 772,
+  0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 0, 772, 772, 0, 0, 0, 772, 0, 0, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 0, 0, 0, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 0, 772, 772, 0, 0, 0, 0, 0, 896, 896, 896, 896, 896, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 896, 896, 896, 896, 896, 896, 0, 0, 0, 896,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0,
+  0, 896, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 896,
+  896, 772, 772, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 772, 13060, 13060, 13060, 0, 13060, 13060,
+  0, 0, 0, 0, 0, 13060, 4868, 13060, 4868, 772, 772, 772, 772, 0, 772,
+  772, 772, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 0, 0, 0, 0, 4992, 13184, 4992, 0, 0, 0, 0, 13184, 896, 896, 896,
+  896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 896, 896, 896, 772,
+  772, 772, 772, 772, 772, 772, 772, 896, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 4992, 4992, 0, 0, 0, 0, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 896, 896,
+  896, 896, 896, 896, 896, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0,
+  896, 896, 896, 896, 896, 896, 896, 896, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0,
+  0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0,
+  0, 0, 0, 0, 0, 0, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 0, 0, 0, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13184,
+  896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 13184, 13184, 13184, 13060, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13184,
+  13184, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0,
+  0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0,
+  0, 0, 0, 0, 4868, 4868, 4868, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13184, 13184, 0, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 13184, 896, 896, 772, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13184, 772, 772,
+  772, 772, 896, 896, 896, 896, 896, 13184, 13184, 13184, 896, 0, 0, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 896, 772, 896, 896,
+  896, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13184,
+  13184, 13060, 896, 896, 896, 896, 896, 896, 13060, 0, 772, 772, 772,
+  772, 772, 772, 772, 0, 772, 0, 772, 772, 772, 772, 0, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 896, 0, 0, 0, 0, 0, 0, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13184, 13184, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 13060, 13060, 13060, 13060, 0,
+  772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 772, 772, 0, 0, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 13060, 13060,
+  13060, 13060, 13060, 0, 0, 13060, 13060, 0, 0, 13060, 13060, 13184, 0,
+  0, 772, 0, 0, 0, 0, 0, 0, 13060, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772,
+  13060, 13060, 0, 0, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 0, 0, 0,
+  4992, 4992, 4992, 4992, 4992, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13184, 13060, 13060,
+  13060, 13184, 772, 772, 772, 772, 896, 896, 896, 896, 896, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 0, 896, 0, 896, 0, 0, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13184, 13184,
+  772, 772, 896, 772, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 0, 0, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13184, 13184, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 772,
+  772, 772, 772, 13060, 13060, 0, 0, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13184, 13060, 896, 896, 896, 772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13184, 13184, 0, 0, 0, 0, 0,
+  0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13184, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 896, 896, 896, 896, 896, 896, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 0, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13184, 772, 896, 896, 896, 896, 896, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 0, 0, 0, 896, 896, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 0, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 896,
+  896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772,
+  772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 0, 0, 0, 0, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 0, 0, 13184, 13184, 13184, 13184, 13184, 896, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 772, 772, 772, 772, 896, 896, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 0, 896, 896, 896, 896, 896, 896, 896, 0, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 772, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060,
+  13060, 13060, 13060, 13060, 13060, 13060, 13060, 13060, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13184, 13184, 13184, 13184, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 772, 772, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0,
+  0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  0, 0, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0,
+  0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0, 896, 13184,
+  13060, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 896, 896, 896, 896, 896,
+  896, 896, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 4992, 4992, 13184, 13184, 13184, 896, 896, 896, 4992,
+  4992, 4992, 4992, 4992, 4992, 896, 896, 896, 896, 896, 896, 896, 896,
+  4992, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 896, 896, 4992, 4992,
+  4992, 4992, 4992, 4992, 4992, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 4992, 4992, 4992, 4992, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 896, 896, 4992,
+  4992, 4992, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 774, 774, 774,
+  774, 774, 774, 774, 0, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 773, 0, 773, 773, 0, 0, 773, 0, 0, 773, 773, 0, 0,
+  773, 773, 773, 773, 0, 773, 773, 773, 773, 773, 773, 773, 773, 774, 774,
+  774, 774, 0, 774, 0, 774, 774, 774, 774, 774, 774, 774, 0, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 773, 773, 0, 773, 773, 773, 773, 0, 0, 773,
+  773, 773, 773, 773, 773, 773, 773, 0, 773, 773, 773, 773, 773, 773, 773,
+  0, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 773, 773, 0,
+  773, 773, 773, 773, 0, 773, 773, 773, 773, 773, 0, 773, 0, 0, 0, 773,
+  773, 773, 773, 773, 773, 773, 0, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 773, 773, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 774, 774, 774, 774, 774, 774, 0, 0, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 896, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 896, 774, 774, 774, 774, 774, 774, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 896, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 896, 774, 774, 774, 774, 774, 774, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 896, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 896, 774, 774, 774, 774, 774,
+  774, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 896, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 896, 774, 774, 774,
+  774, 774, 774, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  896, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 896, 774,
+  774, 774, 774, 774, 774, 773, 774, 0, 0, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 13184,
+  13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184,
+  13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184,
+  13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184,
+  13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184,
+  13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184,
+  13184, 13184, 13184, 13184, 896, 896, 896, 896, 13184, 13184, 13184,
+  13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184,
+  13184, 13184, 13184, 13184, 13184, 896, 896, 896, 896, 896, 896, 896,
+  896, 13184, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 13184, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 13184, 13184, 13184, 13184, 13184, 0, 13184,
+  13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184,
+  13184, 13184, 13184, 13184, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 0, 4868, 4868, 4868, 4868,
+  4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 4868,
+  4868, 0, 0, 4868, 4868, 4868, 4868, 4868, 4868, 4868, 0, 4868, 4868, 0,
+  4868, 4868, 4868, 4868, 4868, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772, 0, 0, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 4992, 4992, 4992, 4992, 4992, 4992, 4992, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 773, 773, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774,
+  774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 774, 4992, 4992,
+  4992, 4868, 4992, 4992, 13184, 0, 0, 0, 0, 0, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 0, 0, 0, 0, 896, 896, 772, 772, 772, 772, 0,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 772,
+  772, 0, 772, 0, 0, 772, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 0, 772, 772, 772, 772, 0, 772, 0, 772, 0, 0, 0, 0, 0, 0, 772, 0, 0,
+  0, 0, 772, 0, 772, 0, 772, 0, 772, 772, 772, 0, 772, 772, 0, 772, 0, 0,
+  772, 0, 772, 0, 772, 0, 772, 0, 772, 0, 772, 772, 0, 772, 0, 0, 772,
+  772, 772, 772, 0, 772, 772, 772, 772, 772, 772, 772, 0, 772, 772, 772,
+  772, 0, 772, 772, 772, 772, 0, 772, 0, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 772, 772, 772, 0, 772,
+  772, 772, 772, 772, 0, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0,
+  0, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 0, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 0, 0, 0, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 896, 896, 896, 896, 896,
+  896, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 896,
+  896, 0, 0, 0, 0, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773, 773,
+  773, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 896, 896, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 896,
+  896, 896, 896, 896, 896, 896, 896, 0, 0, 0, 0, 0, 0, 0, 0, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 0, 896, 896, 896, 896, 896, 896, 896, 896,
+  0, 0, 0, 0, 0, 0, 0, 0, 896, 0, 0, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 0, 0, 0, 0, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 0, 772, 772, 772, 772, 772, 772, 772, 772,
+  772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 772, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 896, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 13184, 13184,
+  13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184, 13184,
+  13184, 13184, 13184, 13184, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896, 896,
+  896, 896, 0, 0,
+};
+
+static inline uint16_t
+unicode_ctype_classes_value (uint32_t wc)
+{
+  uint32_t index = unicode_ctype_classes_level1[wc >> 12];
+  index = unicode_ctype_classes_level2[(index << 7)
+    + ((wc >> 5) & 0x7F)];
+  return unicode_ctype_classes_level3[(index << 5) + (wc & 0x1F)];
+}
+
+static inline uint16_t
+unicode_ctype_classes (uint32_t wc)
+{
+  return wc <= 0x10FFFF ? unicode_ctype_classes_value (wc) : 0;
+}
+
+static inline int
+unicode_ctype_is (uint32_t wc, uint16_t flag)
+{
+  return (unicode_ctype_classes (wc) & flag) != 0;
+}
+
+static const uint8_t unicode_ctype_toupper_level1[272] =
+{
+  0, 1, 2, 3, 3, 3, 3, 3, 3, 3, 4, 3, 3, 3, 3, 5, 6, 7, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 8, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3,
+};
+
+static const uint8_t unicode_ctype_toupper_level2[1152] =
+{
+  0, 0, 0, 1, 0, 2, 0, 3, 4, 5, 6, 7, 8, 9, 10, 11, 4, 12, 13, 14, 15, 0,
+  0, 0, 0, 0, 16, 17, 0, 18, 19, 20, 0, 21, 22, 4, 23, 4, 24, 4, 4, 25, 0,
+  26, 27, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 28, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 29, 0, 0, 0, 0, 0,
+  0, 30, 0, 0, 0, 0, 4, 4, 4, 4, 31, 4, 4, 4, 32, 33, 34, 35, 33, 36, 37,
+  38, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 39, 40, 41, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 42, 43, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 44, 45, 46, 4, 4, 4, 47, 48, 49, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+  50, 51, 0, 0, 0, 0, 52, 4, 53, 54, 55, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 56, 57, 58, 58, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 59, 60, 0, 0, 0, 61, 62, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 63,
+  64, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 65,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 66, 67, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+};
+
+static const int32_t unicode_ctype_toupper_level3[2176] =
+{
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, -32, -32, -32, -32, -32, -32, -32, -32, -32,
+  -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32,
+  -32, -32, -32, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 743, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -32, -32, -32,
+  -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32,
+  -32, -32, -32, -32, -32, -32, 0, -32, -32, -32, -32, -32, -32, -32, 121,
+  0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, -1, 0, -1, 0, -1, 0, -232, 0, -1, 0, -1, 0, -1, 0, 0, -1, 0, -1,
+  0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, 0, -1, 0, -1, 0, -1, 0, -1,
+  0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, 0, -1, 0,
+  -1, 0, -1, -300, 195, 0, 0, -1, 0, -1, 0, 0, -1, 0, 0, 0, -1, 0, 0, 0,
+  0, 0, -1, 0, 0, 97, 0, 0, 0, -1, 163, 0, 0, 0, 130, 0, 0, -1, 0, -1, 0,
+  -1, 0, 0, -1, 0, 0, 0, 0, -1, 0, 0, -1, 0, 0, 0, -1, 0, -1, 0, 0, -1, 0,
+  0, 0, -1, 0, 56, 0, 0, 0, 0, 0, -1, -2, 0, -1, -2, 0, -1, -2, 0, -1, 0,
+  -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, -79, 0, -1, 0, -1, 0, -1,
+  0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, 0, -1, -2, 0, -1, 0, 0, 0,
+  -1, 0, -1, 0, -1, 0, -1, 0, 0, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1,
+  0, -1, 0, -1, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, 0, 10815, 10815, 0,
+  -1, 0, 0, 0, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 10783, 10780, 10782,
+  -210, -206, 0, -205, -205, 0, -202, 0, -203, 42319, 0, 0, 0, -205,
+  42315, 0, -207, 0, 42280, 42308, 0, -209, -211, 42308, 10743, 42305, 0,
+  0, -211, 0, 10749, -213, 0, 0, -214, 0, 0, 0, 0, 0, 0, 0, 10727, 0, 0,
+  -218, 0, 0, -218, 0, 0, 0, 42282, -218, -69, -217, -217, -71, 0, 0, 0,
+  0, 0, -219, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 42261, 42258, 0, 0, 0, 0, 0,
+  0, 84, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0,
+  -1, 0, 0, 0, -1, 0, 0, 0, 130, 130, 130, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, -38, -37, -37, -37, 0, -32, -32, -32, -32, -32, -32, -32,
+  -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -31, -32, -32, -32,
+  -32, -32, -32, -32, -32, -32, -64, -63, -63, 0, -62, -57, 0, 0, 0, -47,
+  -54, -8, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1,
+  0, -1, 0, -1, 0, -1, -86, -80, 7, -116, 0, -96, 0, 0, -1, 0, 0, -1, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -32, -32, -32,
+  -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32,
+  -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32,
+  -32, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80,
+  -80, -80, -80, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, 0, -1, 0, -1, 0,
+  -1, 0, -1, 0, -1, 0, -1, 0, -1, -15, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1,
+  0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -48, -48, -48,
+  -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48,
+  -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48,
+  -48, -48, -48, -48, -48, -48, -48, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -8, -8, -8, -8, -8, -8, 0, 0,
+  -6254, -6253, -6244, -6242, -6242, -6243, -6236, -6181, 35266, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 35332, 0,
+  0, 0, 3814, 0, 0, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, -1, 0, -1, 0, -1, 0, 0, 0, 0, 0, -59, 0, 0, 0, 0, 8, 8, 8, 8, 8,
+  8, 8, 8, 0, 0, 0, 0, 0, 0, 0, 0, 8, 8, 8, 8, 8, 8, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 8, 8, 8, 8, 8, 8, 8, 8, 0, 0, 0, 0, 0, 0, 0, 0, 8, 8, 8, 8, 8,
+  8, 8, 8, 0, 0, 0, 0, 0, 0, 0, 0, 8, 8, 8, 8, 8, 8, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 8, 0, 8, 0, 8, 0, 8, 0, 0, 0, 0, 0, 0, 0, 0, 8, 8, 8, 8, 8,
+  8, 8, 8, 0, 0, 0, 0, 0, 0, 0, 0, 74, 74, 86, 86, 86, 86, 100, 100, 128,
+  128, 112, 112, 126, 126, 0, 0, 8, 8, 8, 8, 8, 8, 8, 8, 0, 0, 0, 0, 0, 0,
+  0, 0, 8, 8, 0, 9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -7205, 0, 0, 0, 0, 9, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 8, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 8, 8, 0, 0, 0, 7, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, -28, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -16, -16, -16, -16, -16, -16, -16,
+  -16, -16, -16, -16, -16, -16, -16, -16, -16, 0, 0, 0, 0, -1, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -26, -26, -26, -26, -26,
+  -26, -26, -26, -26, -26, -26, -26, -26, -26, -26, -26, -26, -26, -26,
+  -26, -26, -26, -26, -26, -26, -26, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48,
+  -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48,
+  -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48,
+  -48, -48, -48, -48, -48, -48, 0, 0, -1, 0, 0, 0, -10795, -10792, 0, -1,
+  0, -1, 0, -1, 0, 0, 0, 0, 0, 0, -1, 0, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, -1, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, -1, 0, 0, 0, 0, -1, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -7264, -7264, -7264, -7264, -7264, -7264,
+  -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264,
+  -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264,
+  -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264,
+  -7264, -7264, 0, -7264, 0, 0, 0, 0, 0, -7264, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, -1,
+  0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, -1, 0, 0, 0, 0, 0, 0, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1,
+  0, -1, 0, 0, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, -1, 0, -1, 0, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, 0, 0, 0, -1, 0,
+  0, 0, 0, -1, 0, -1, 0, 0, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, -1, 0, -1, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, -1, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, -928, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, -38864, -38864, -38864, -38864, -38864, -38864,
+  -38864, -38864, -38864, -38864, -38864, -38864, -38864, -38864, -38864,
+  -38864, -38864, -38864, -38864, -38864, -38864, -38864, -38864, -38864,
+  -38864, -38864, -38864, -38864, -38864, -38864, -38864, -38864, -38864,
+  -38864, -38864, -38864, -38864, -38864, -38864, -38864, -38864, -38864,
+  -38864, -38864, -38864, -38864, -38864, -38864, 0, 0, 0, 0, 0, 0, 0, 0,
+  -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40,
+  -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40,
+  -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -40, -40, -40, -40, -40, -40, -40,
+  -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40,
+  -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40,
+  -40, 0, 0, 0, 0, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64,
+  -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64,
+  -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64,
+  -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, -32, -32, -32, -32, -32, -32, -32, -32, -32,
+  -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32,
+  -32, -32, -32, -32, -32, -32, -32, -32, -32, 0, 0, -34, -34, -34, -34,
+  -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, -34,
+  -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, -34,
+  -34, -34, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0,
+};
+
+static inline int32_t
+unicode_ctype_toupper_value (uint32_t wc)
+{
+  uint32_t index = unicode_ctype_toupper_level1[wc >> 12];
+  index = unicode_ctype_toupper_level2[(index << 7)
+    + ((wc >> 5) & 0x7F)];
+  return unicode_ctype_toupper_level3[(index << 5) + (wc & 0x1F)];
+}
+
+static inline uint32_t
+unicode_ctype_toupper (uint32_t wc)
+{
+  return wc <= 0x10FFFF ? wc + unicode_ctype_toupper_value (wc) : wc;
+}
+
+static const uint8_t unicode_ctype_tolower_level1[272] =
+{
+  0, 1, 2, 3, 3, 3, 3, 3, 3, 3, 4, 3, 3, 3, 3, 5, 6, 7, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 8, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3,
+};
+
+static const uint8_t unicode_ctype_tolower_level2[1152] =
+{
+  0, 0, 1, 0, 0, 0, 2, 0, 3, 4, 5, 6, 7, 8, 9, 10, 3, 11, 12, 0, 0, 0, 0,
+  0, 0, 0, 0, 13, 14, 15, 16, 17, 18, 19, 0, 3, 20, 3, 21, 3, 3, 22, 23,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24, 25, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 26, 26, 27, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 3, 3, 3, 3, 28, 3, 3, 3, 29, 30, 31, 32, 30, 33,
+  34, 35, 0, 0, 0, 0, 0, 0, 0, 0, 0, 36, 0, 37, 38, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 39, 40, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 41, 42, 0, 43, 3, 3, 3, 44, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  3, 45, 46, 0, 0, 0, 0, 47, 3, 48, 49, 50, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  51, 52, 0, 0, 0, 53, 54, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 55, 56,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 57,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 58, 59, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+};
+
+static const int32_t unicode_ctype_tolower_level3[1920] =
+{
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+  32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 0, 0, 0, 0,
+  0, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+  32, 32, 32, 32, 32, 32, 0, 32, 32, 32, 32, 32, 32, 32, 0, 1, 0, 1, 0, 1,
+  0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+  0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, -199, 0, 1, 0,
+  1, 0, 1, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 1, 0,
+  1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+  1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, -121, 1, 0,
+  1, 0, 1, 0, 0, 0, 210, 1, 0, 1, 0, 206, 1, 0, 205, 205, 1, 0, 0, 79,
+  202, 203, 1, 0, 205, 207, 0, 211, 209, 1, 0, 0, 0, 211, 213, 0, 214, 1,
+  0, 1, 0, 1, 0, 218, 1, 0, 218, 0, 0, 1, 0, 218, 1, 0, 217, 217, 1, 0, 1,
+  0, 219, 1, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 2, 1, 0, 2, 1, 0, 2, 1, 0,
+  1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 1, 0, 1, 0, 1, 0, 1,
+  0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 2, 1, 0, 1, 0, -97, -56, 1, 0, 1, 0,
+  1, 0, 1, 0, -130, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+  0, 0, 0, 0, 0, 0, 0, 10795, 1, 0, -163, 10792, 0, 0, 1, 0, -195, 69, 71,
+  1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 0, 0,
+  1, 0, 0, 0, 0, 0, 0, 0, 0, 116, 0, 0, 0, 0, 0, 0, 38, 0, 37, 37, 37, 0,
+  64, 0, 63, 63, 0, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+  32, 32, 32, 32, 0, 32, 32, 32, 32, 32, 32, 32, 32, 32, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 8, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+  1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, -60, 0, 0, 1, 0,
+  -7, 1, 0, 0, -130, -130, -130, 80, 80, 80, 80, 80, 80, 80, 80, 80, 80,
+  80, 80, 80, 80, 80, 80, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+  32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+  32, 32, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+  0, 1, 0, 15, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 1, 0, 1, 0, 1,
+  0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+  0, 1, 0, 0, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48,
+  48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48,
+  48, 48, 48, 48, 48, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7264, 7264, 7264, 7264,
+  7264, 7264, 7264, 7264, 7264, 7264, 7264, 7264, 7264, 7264, 7264, 7264,
+  7264, 7264, 7264, 7264, 7264, 7264, 7264, 7264, 7264, 7264, 7264, 7264,
+  7264, 7264, 7264, 7264, 7264, 7264, 7264, 7264, 7264, 7264, 0, 7264, 0,
+  0, 0, 0, 0, 7264, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  38864, 38864, 38864, 38864, 38864, 38864, 38864, 38864, 38864, 38864,
+  38864, 38864, 38864, 38864, 38864, 38864, 38864, 38864, 38864, 38864,
+  38864, 38864, 38864, 38864, 38864, 38864, 38864, 38864, 38864, 38864,
+  38864, 38864, 38864, 38864, 38864, 38864, 38864, 38864, 38864, 38864,
+  38864, 38864, 38864, 38864, 38864, 38864, 38864, 38864, 8, 8, 8, 8, 8,
+  8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+  0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, -7615, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, -8, -8, -8, -8, -8, -8, -8, -8, 0, 0, 0, 0, 0, 0, 0, 0, -8,
+  -8, -8, -8, -8, -8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -8, -8, -8, -8, -8,
+  -8, -8, -8, 0, 0, 0, 0, 0, 0, 0, 0, -8, -8, -8, -8, -8, -8, -8, -8, 0,
+  0, 0, 0, 0, 0, 0, 0, -8, -8, -8, -8, -8, -8, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, -8, 0, -8, 0, -8, 0, -8, 0, 0, 0, 0, 0, 0, 0, 0, -8, -8, -8, -8,
+  -8, -8, -8, -8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, -8, -8, -8, -8, -8, -8, -8, -8, 0, 0, 0, 0, 0, 0, 0, 0,
+  -8, -8, -74, -74, -9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -86, -86, -86,
+  -86, -9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -8, -8, -100, -100, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, -8, -8, -112, -112, -7, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, -128, -128, -126, -126, -9, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  -7517, 0, 0, 0, -8383, -8262, 0, 0, 0, 0, 0, 0, 28, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16, 16,
+  16, 16, 16, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
+  26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48,
+  48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48,
+  48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 48, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, -10743, -3814, -10727, 0,
+  0, 1, 0, 1, 0, 1, 0, -10780, -10749, -10783, -10782, 0, 1, 0, 0, 1, 0,
+  0, 0, 0, 0, 0, 0, 0, -10815, -10815, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 1,
+  0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0,
+  1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+  1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+  1, 0, 1, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0,
+  1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 1,
+  0, -35332, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 0, 0, 0, 1, 0, -42280, 0, 0, 1,
+  0, 1, 0, 0, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1,
+  0, -42308, -42319, -42315, -42305, -42308, 0, -42258, -42282, -42261,
+  928, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 40, 40, 40, 40, 40, 40, 40, 40,
+  40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40,
+  40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40,
+  40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40, 40,
+  40, 40, 40, 40, 40, 40, 40, 40, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 64,
+  64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64,
+  64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64,
+  64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+  32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
+  32, 32, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34,
+  34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34, 34,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0,
+};
+
+static inline int32_t
+unicode_ctype_tolower_value (uint32_t wc)
+{
+  uint32_t index = unicode_ctype_tolower_level1[wc >> 12];
+  index = unicode_ctype_tolower_level2[(index << 7)
+    + ((wc >> 5) & 0x7F)];
+  return unicode_ctype_tolower_level3[(index << 5) + (wc & 0x1F)];
+}
+
+static inline uint32_t
+unicode_ctype_tolower (uint32_t wc)
+{
+  return wc <= 0x10FFFF ? wc + unicode_ctype_tolower_value (wc) : wc;
+}
+
+static const uint8_t unicode_ctype_totitle_level1[272] =
+{
+  0, 1, 2, 3, 3, 3, 3, 3, 3, 3, 4, 3, 3, 3, 3, 5, 6, 7, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 8, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3,
+  3, 3, 3, 3, 3, 3, 3, 3,
+};
+
+static const uint8_t unicode_ctype_totitle_level2[1152] =
+{
+  0, 0, 0, 1, 0, 2, 0, 3, 4, 5, 6, 7, 8, 9, 10, 11, 4, 12, 13, 14, 15, 0,
+  0, 0, 0, 0, 16, 17, 0, 18, 19, 20, 0, 21, 22, 4, 23, 4, 24, 4, 4, 25, 0,
+  26, 27, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 28, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 29, 0, 0, 0, 0, 0,
+  0, 30, 0, 0, 0, 0, 4, 4, 4, 4, 31, 4, 4, 4, 32, 33, 34, 35, 33, 36, 37,
+  38, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 39, 40, 41, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 42, 43, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 44, 45, 46, 4, 4, 4, 47, 48, 49, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+  50, 51, 0, 0, 0, 0, 52, 4, 53, 54, 55, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 56, 57, 58, 58, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 59, 60, 0, 0, 0, 61, 62, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 63,
+  64, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 65,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 66, 67, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+};
+
+static const int32_t unicode_ctype_totitle_level3[2176] =
+{
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, -32, -32, -32, -32, -32, -32, -32, -32, -32,
+  -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32,
+  -32, -32, -32, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 743, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -32, -32, -32,
+  -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32,
+  -32, -32, -32, -32, -32, -32, 0, -32, -32, -32, -32, -32, -32, -32, 121,
+  0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, -1, 0, -1, 0, -1, 0, -232, 0, -1, 0, -1, 0, -1, 0, 0, -1, 0, -1,
+  0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, 0, -1, 0, -1, 0, -1, 0, -1,
+  0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, 0, -1, 0,
+  -1, 0, -1, -300, 195, 0, 0, -1, 0, -1, 0, 0, -1, 0, 0, 0, -1, 0, 0, 0,
+  0, 0, -1, 0, 0, 97, 0, 0, 0, -1, 163, 0, 0, 0, 130, 0, 0, -1, 0, -1, 0,
+  -1, 0, 0, -1, 0, 0, 0, 0, -1, 0, 0, -1, 0, 0, 0, -1, 0, -1, 0, 0, -1, 0,
+  0, 0, -1, 0, 56, 0, 0, 0, 0, 1, 0, -1, 1, 0, -1, 1, 0, -1, 0, -1, 0, -1,
+  0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, -79, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, 1, 0, -1, 0, -1, 0, 0, 0, -1,
+  0, -1, 0, -1, 0, -1, 0, 0, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, -1, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, 0, 10815, 10815, 0, -1,
+  0, 0, 0, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 10783, 10780, 10782, -210,
+  -206, 0, -205, -205, 0, -202, 0, -203, 42319, 0, 0, 0, -205, 42315, 0,
+  -207, 0, 42280, 42308, 0, -209, -211, 42308, 10743, 42305, 0, 0, -211,
+  0, 10749, -213, 0, 0, -214, 0, 0, 0, 0, 0, 0, 0, 10727, 0, 0, -218, 0,
+  0, -218, 0, 0, 0, 42282, -218, -69, -217, -217, -71, 0, 0, 0, 0, 0,
+  -219, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 42261, 42258, 0, 0, 0, 0, 0, 0, 84,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, -1, 0,
+  0, 0, -1, 0, 0, 0, 130, 130, 130, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, -38, -37, -37, -37, 0, -32, -32, -32, -32, -32, -32, -32, -32, -32,
+  -32, -32, -32, -32, -32, -32, -32, -32, -31, -32, -32, -32, -32, -32,
+  -32, -32, -32, -32, -64, -63, -63, 0, -62, -57, 0, 0, 0, -47, -54, -8,
+  0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, -1, -86, -80, 7, -116, 0, -96, 0, 0, -1, 0, 0, -1, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -32, -32, -32, -32, -32,
+  -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32,
+  -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -80,
+  -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80, -80,
+  -80, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1,
+  0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, 0, -1, 0, -1, 0, -1, 0, -1,
+  0, -1, 0, -1, 0, -1, -15, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -48, -48, -48, -48, -48,
+  -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48,
+  -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48,
+  -48, -48, -48, -48, -48, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, -8, -8, -8, -8, -8, -8, 0, 0, -6254, -6253,
+  -6244, -6242, -6242, -6243, -6236, -6181, 35266, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 35332, 0, 0, 0, 3814, 0,
+  0, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1,
+  0, -1, 0, 0, 0, 0, 0, -59, 0, 0, 0, 0, 8, 8, 8, 8, 8, 8, 8, 8, 0, 0, 0,
+  0, 0, 0, 0, 0, 8, 8, 8, 8, 8, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 8, 8, 8,
+  8, 8, 8, 8, 8, 0, 0, 0, 0, 0, 0, 0, 0, 8, 8, 8, 8, 8, 8, 8, 8, 0, 0, 0,
+  0, 0, 0, 0, 0, 8, 8, 8, 8, 8, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 8, 0,
+  8, 0, 8, 0, 8, 0, 0, 0, 0, 0, 0, 0, 0, 8, 8, 8, 8, 8, 8, 8, 8, 0, 0, 0,
+  0, 0, 0, 0, 0, 74, 74, 86, 86, 86, 86, 100, 100, 128, 128, 112, 112,
+  126, 126, 0, 0, 8, 8, 8, 8, 8, 8, 8, 8, 0, 0, 0, 0, 0, 0, 0, 0, 8, 8, 0,
+  9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -7205, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 8, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 8, 8,
+  0, 0, 0, 7, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -28, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, -16, -16, -16, -16, -16, -16, -16, -16, -16, -16,
+  -16, -16, -16, -16, -16, -16, 0, 0, 0, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -26, -26, -26, -26, -26, -26, -26, -26,
+  -26, -26, -26, -26, -26, -26, -26, -26, -26, -26, -26, -26, -26, -26,
+  -26, -26, -26, -26, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -48, -48,
+  -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48,
+  -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48,
+  -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48, -48,
+  -48, -48, -48, 0, 0, -1, 0, 0, 0, -10795, -10792, 0, -1, 0, -1, 0, -1,
+  0, 0, 0, 0, 0, 0, -1, 0, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, -1,
+  0, 0, 0, 0, 0, 0, 0, 0, -1, 0, -1, 0, 0, 0, 0, -1, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264,
+  -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264,
+  -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264,
+  -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264, -7264, 0,
+  -7264, 0, 0, 0, 0, 0, -7264, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, 0,
+  0, 0, 0, 0, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, 0, 0,
+  -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0,
+  -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, -1,
+  0, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, 0, 0, 0, -1, 0, 0, 0, 0, -1, 0,
+  -1, 0, 0, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1, 0, -1,
+  0, -1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -1, 0, -1, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, -928, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, -38864, -38864, -38864, -38864, -38864, -38864, -38864, -38864,
+  -38864, -38864, -38864, -38864, -38864, -38864, -38864, -38864, -38864,
+  -38864, -38864, -38864, -38864, -38864, -38864, -38864, -38864, -38864,
+  -38864, -38864, -38864, -38864, -38864, -38864, -38864, -38864, -38864,
+  -38864, -38864, -38864, -38864, -38864, -38864, -38864, -38864, -38864,
+  -38864, -38864, -38864, -38864, 0, 0, 0, 0, 0, 0, 0, 0, -40, -40, -40,
+  -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40,
+  -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40,
+  -40, -40, -40, -40, -40, -40, -40, -40, -40, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40,
+  -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40,
+  -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, -40, 0, 0, 0, 0,
+  -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64,
+  -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64,
+  -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64, -64,
+  -64, -64, -64, -64, -64, -64, -64, -64, -64, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0, 0, 0, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32,
+  -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32, -32,
+  -32, -32, -32, -32, -32, -32, 0, 0, -34, -34, -34, -34, -34, -34, -34,
+  -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, -34,
+  -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, -34, 0, 0,
+  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+  0, 0,
+};
+
+static inline int32_t
+unicode_ctype_totitle_value (uint32_t wc)
+{
+  uint32_t index = unicode_ctype_totitle_level1[wc >> 12];
+  index = unicode_ctype_totitle_level2[(index << 7)
+    + ((wc >> 5) & 0x7F)];
+  return unicode_ctype_totitle_level3[(index << 5) + (wc & 0x1F)];
+}
+
+static inline uint32_t
+unicode_ctype_totitle (uint32_t wc)
+{
+  return wc <= 0x10FFFF ? wc + unicode_ctype_totitle_value (wc) : wc;
+}
+
+#endif /* UNICODE_CTYPE_H */
@@ -0,0 +1,186 @@
+# Constant time queries of generated LC_CTYPE character classes.
+#
+# Copyright (C) 2014-2016 Free Software Foundation, Inc.
+# This file is part of the GNU C Library.
+#
+# The GNU C Library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# The GNU C Library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with the GNU C Library; if not, see
+# <http://www.gnu.org/licenses/>.
+
+'''
+This module answers questions like “is this code point alpha in the
+generated i18n file?” with a few list lookups, without parsing any
+Unicode data file.  It does not import unicode_utils, so it is quick
+to import and small in memory.
+
+The tables are written by “gen_unicode_ctype.py --ctype_tables” from
+the same character classes and case mappings it writes to LC_CTYPE:
+
+    tables = unicode_ctype.load('unicode_ctype.tables')
+    tables.has_class(0x00E4, 'alpha') → True
+    tables.classes(0x00E4) & tables.class_flags['lower'] → 2
+    tables.toupper(0x00E4) → 0x00C4
+
+See benchmark_unicode_ctype.py for its speed compared with unicodedata
+and the unicode_utils functions.
+'''
+
+import json
+
+# Format name and version of the tables file, increase the version
+# whenever the layout changes.
+TABLES_FORMAT = 'unicode_ctype'
+TABLES_VERSION = 2
+
+# Both stages of the tables are indexed by SHIFT bits of the code
+# point, the shift is stored in the tables file and checked by load().
+SHIFT = 8
+MASK = (1 << SHIFT) - 1
+
+# Highest code point in the Unicode code space.
+MAX_CODE_POINT = 0x10FFFF
+
+# The tables file is written by unicode_utils.write_snapshot(): this
+# magic string, the length of the JSON header as 8 byte little endian
+# integer, the JSON header with the metadata and the layout of the
+# arrays, and the arrays themselves.
+_MAGIC = b'UCDSNAP\n'
+
+# Names of the tables of the case mappings and the fields of
+# UnicodeData.txt they are made from.
+MAPPINGS = (('toupper', 'upper'), ('tolower', 'lower'), ('totitle', 'title'))
+
+def _read_tables_file(filename):
+    '''Returns (metadata, arrays) of a tables file, the arrays as lists
+    of integers, None if it is not a well-formed file'''
+    with open(filename, mode='rb') as tables_file:
+        data = memoryview(tables_file.read())
+    if data[:len(_MAGIC)] != _MAGIC:
+        return None
+    start = len(_MAGIC) + 8
+    header_length = int.from_bytes(data[start-8:start], 'little')
+    try:
+        header = json.loads(bytes(data[start:start+header_length]))
+        start += header_length
+        arrays = {}
+        for name, (typecode, offset, length) in header['layout'].items():
+            values = data[start+offset:start+offset+length]
+            if len(values) != length:
+                return None
+            arrays[name] = values.cast(typecode).tolist()
+        return (header['metadata'], arrays)
+    except (ValueError, KeyError, TypeError):
+        return None
+
+# The functions below return the queries of CtypeTables as closures,
+# which find the tables and constants in their cells instead of
+# looking them up as attributes or globals on every call.
+
+def _lookup(index, values, shift=SHIFT, mask=MASK,
+            max_code_point=MAX_CODE_POINT):
+    '''Returns a function looking up the value of a code point in a
+    two-stage table'''
+    def lookup(code_point):
+        if not 0 <= code_point <= max_code_point:
+            raise ValueError('invalid code point: %r' %code_point)
+        return values[(index[code_point >> shift] << shift)
+                      | (code_point & mask)]
+    return lookup
+
+def _class_lookup(index, values, class_flags, shift=SHIFT, mask=MASK,
+                  max_code_point=MAX_CODE_POINT):
+    '''Returns a function checking whether a code point is in a class,
+    looking up its class flags in a two-stage table'''
+    def class_lookup(code_point, class_name):
+        if not 0 <= code_point <= max_code_point:
+            raise ValueError('invalid code point: %r' %code_point)
+        return bool(values[(index[code_point >> shift] << shift)
+                           | (code_point & mask)]
+                    & class_flags[class_name])
+    return class_lookup
+
+def _flag_lookup(index, values, flag, shift=SHIFT, mask=MASK,
+                 max_code_point=MAX_CODE_POINT):
+    '''Returns a function checking whether a code point has a class
+    flag, looking up its class flags in a two-stage table'''
+    def flag_lookup(code_point):
+        if not 0 <= code_point <= max_code_point:
+            raise ValueError('invalid code point: %r' %code_point)
+        return bool(values[(index[code_point >> shift] << shift)
+                           | (code_point & mask)] & flag)
+    return flag_lookup
+
+def _case_lookup(index, values, shift=SHIFT, mask=MASK,
+                 max_code_point=MAX_CODE_POINT):
+    '''Returns a function looking up the case mapping of a code point
+    in a two-stage table of the deltas of the mapping'''
+    def case_lookup(code_point):
+        if not 0 <= code_point <= max_code_point:
+            raise ValueError('invalid code point: %r' %code_point)
+        return code_point + values[(index[code_point >> shift] << shift)
+                                   | (code_point & mask)]
+    return case_lookup
+
+class CtypeTables(object):
+    '''The character classes and case mappings of one tables file.
+
+    All queries take a code point from 0 to 0x10FFFF and do two list
+    lookups, they raise ValueError for other values:
+
+    classes(code_point) returns the flags of all classes of a code
+    point, see class_flags.
+    has_class(code_point, class_name) checks whether a code point is
+    in a class like 'alpha', see also class_predicate().
+    toupper(code_point), tolower(code_point) and totitle(code_point)
+    return the case mappings.
+
+    class_flags maps the class names to their flags in the value of
+    classes(), they are those of unicode_utils.CHARACTER_CLASSES when
+    the file was written.
+    '''
+    def __init__(self, metadata, arrays):
+        self.unicode_version = metadata['unicode_version']
+        self.locale = metadata['locale']
+        self.class_flags = dict(metadata['classes'])
+        self.classes = _lookup(arrays['classes_index'],
+                               arrays['classes_values'])
+        self.has_class = _class_lookup(arrays['classes_index'],
+                                       arrays['classes_values'],
+                                       self.class_flags)
+        for map_name, field in MAPPINGS:
+            setattr(self, map_name, _case_lookup(
+                arrays[map_name + '_index'], arrays[map_name + '_values']))
+        self._arrays = arrays
+
+    def class_predicate(self, class_name):
+        '''Returns a function checking whether a code point is in a
+        class like 'alpha', which is quicker than has_class() when the
+        same class is tested many times:
+
+        is_alpha = tables.class_predicate('alpha')
+        is_alpha(0x00E4) → True
+        '''
+        return _flag_lookup(self._arrays['classes_index'],
+                            self._arrays['classes_values'],
+                            self.class_flags[class_name])
+
+def load(filename):
+    '''Returns the CtypeTables of a file written by
+    “gen_unicode_ctype.py --ctype_tables”'''
+    tables = _read_tables_file(filename)
+    if (tables is None
+            or tables[0].get('format') != TABLES_FORMAT
+            or tables[0].get('version') != TABLES_VERSION
+            or tables[0].get('shift') != SHIFT):
+        raise ValueError('not a unicode_ctype tables file: %s' %filename)
+    return CtypeTables(*tables)
@@ -23,7 +23,22 @@ Unicode data for glibc from upstream Unicode data files.
 '''
 
 import sys
-import re
+import os
+import array
+import bisect
+import collections
+import collections.abc
+import concurrent.futures
+import contextlib
+import hashlib
+import json
+import mmap
+
+try:
+    import numpy
+except ImportError:
+    # NumPy is optional, see UCD.numpy_character_classes().
+    numpy = None
 
 
 # Common locale header.
@@ -36,85 +51,1330 @@ COMMENT_HEADER = """
 % otherwise be governed by that license.
 """
 
-# Dictionary holding the entire contents of the UnicodeData.txt file
-#
-# Contents of this dictionary look like this:
-#
-# {0: {'category': 'Cc',
-#      'title': None,
-#      'digit': '',
-#      'name': '<control>',
-#      'bidi': 'BN',
-#      'combining': '0',
-#      'comment': '',
-#      'oldname': 'NULL',
-#      'decomposition': '',
-#      'upper': None,
-#      'mirrored': 'N',
-#      'lower': None,
-#      'decdigit': '',
-#      'numeric': ''},
-#      …
-# }
-UNICODE_ATTRIBUTES = {}
+# Version of the loaders below.  It is part of the key of the snapshot
+# files, increase it whenever the layout of the parsed tables changes.
+LOADER_VERSION = 3
 
-# Dictionary holding the entire contents of the DerivedCoreProperties.txt file
-#
-# Contents of this dictionary look like this:
-#
-# {917504: ['Default_Ignorable_Code_Point'],
-#  917505: ['Case_Ignorable', 'Default_Ignorable_Code_Point'],
-#  …
-# }
-DERIVED_CORE_PROPERTIES = {}
+# Directory where the loaders keep binary snapshots of the parsed
+# Unicode data files, None to always parse the files.  “make clean”
+# removes it together with the compiled Python files.
+SNAPSHOT_DIRECTORY = os.environ.get(
+    'UNICODE_UTILS_SNAPSHOT_DIRECTORY',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                 '__pycache__')) or None
 
-# Dictionary holding the entire contents of the EastAsianWidths.txt file
-#
-# Contents of this dictionary look like this:
-#
-# {0: 'N', … , 45430: 'W', …}
-EAST_ASIAN_WIDTHS = {}
+# unicode_ctype.py reads the tables files written by write_snapshot()
+# without importing this module, keep its reader in sync with the
+# format.
+_SNAPSHOT_MAGIC = b'UCDSNAP\n'
 
-def fill_attribute(code_point, fields):
-    '''Stores in UNICODE_ATTRIBUTES[code_point] the values from the fields.
+def snapshot_path(kind, filename):
+    '''Returns the name of the snapshot file for the parsed contents
+    of filename, None if snapshots are disabled.
+
+    The name is the SHA-256 of kind, the loader version and the file
+    contents in hex digits, so a changed input file or a changed
+    loader never uses an old snapshot.
+    '''
+    if not SNAPSHOT_DIRECTORY:
+        return None
+    digest = hashlib.sha256(
+        '{:s} {:d}\n'.format(kind, LOADER_VERSION).encode('utf-8'))
+    with open(filename, mode='rb') as data_file:
+        digest.update(data_file.read())
+    return os.path.join(
+        SNAPSHOT_DIRECTORY, '{:s}.snapshot'.format(digest.hexdigest()))
 
-    One entry in the UNICODE_ATTRIBUTES dictionary represents one line
-    in the UnicodeData.txt file.
+def write_snapshot(path, metadata, arrays, ignore_errors=True):
+    '''Writes a snapshot file.
 
+    metadata is anything which can be stored as JSON, arrays is a
+    dictionary of typed arrays (or memoryviews) and strings.  Errors
+    are ignored by default, the snapshot is only an optimization.
     '''
-    UNICODE_ATTRIBUTES[code_point] =  {
-        'name': fields[1],          # Character name
-        'category': fields[2],      # General category
-        'combining': fields[3],     # Canonical combining classes
-        'bidi': fields[4],          # Bidirectional category
-        'decomposition': fields[5], # Character decomposition mapping
-        'decdigit': fields[6],      # Decimal digit value
-        'digit': fields[7],         # Digit value
-        'numeric': fields[8],       # Numeric value
-        'mirrored': fields[9],      # mirrored
-        'oldname': fields[10],      # Old Unicode 1.0 name
-        'comment': fields[11],      # comment
-        # Uppercase mapping
-        'upper': int(fields[12], 16) if fields[12] else None,
-        # Lowercase mapping
-        'lower': int(fields[13], 16) if fields[13] else None,
-        # Titlecase mapping
-        'title': int(fields[14], 16) if fields[14] else None,
-    }
-
-def fill_attributes(filename):
-    '''Stores the entire contents of the UnicodeData.txt file
-    in the UNICODE_ATTRIBUTES dictionary.
+    if not path:
+        return
+    layout = {}
+    chunks = []
+    offset = 0
+    for name in sorted(arrays):
+        values = arrays[name]
+        if isinstance(values, str):
+            typecode = 's'
+            data = values.encode('utf-8')
+        else:
+            typecode = getattr(values, 'typecode', None) or values.format
+            data = values.tobytes()
+        layout[name] = (typecode, offset, len(data))
+        chunks.append(data)
+        chunks.append(bytes(-len(data) % 8))
+        offset += len(data) + (-len(data) % 8)
+    header = json.dumps(
+        {'metadata': metadata, 'layout': layout}).encode('utf-8')
+    header += b' ' * (-len(header) % 8)
+    temporary_path = '{:s}.{:d}.tmp'.format(path, os.getpid())
+    try:
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temporary_path, mode='wb') as snapshot_file:
+            snapshot_file.write(_SNAPSHOT_MAGIC)
+            snapshot_file.write(len(header).to_bytes(8, 'little'))
+            snapshot_file.write(header)
+            for chunk in chunks:
+                snapshot_file.write(chunk)
+        os.replace(temporary_path, path)
+    except OSError:
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
+        if not ignore_errors:
+            raise
+
+def read_snapshot(path):
+    '''Reads a snapshot file written by write_snapshot().
+
+    Returns (metadata, arrays), the arrays are read-only memoryviews
+    into the memory mapped file, see close_snapshot().  Returns None if
+    there is no usable snapshot.
+    '''
+    if not path:
+        return None
+    try:
+        with open(path, mode='rb') as snapshot_file:
+            mapped = mmap.mmap(
+                snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        view = memoryview(mapped)
+        if view[:len(_SNAPSHOT_MAGIC)] != _SNAPSHOT_MAGIC:
+            return None
+        start = len(_SNAPSHOT_MAGIC) + 8
+        header_length = int.from_bytes(view[start-8:start], 'little')
+        header = json.loads(bytes(view[start:start+header_length]))
+        start += header_length
+        arrays = {}
+        for name, (typecode, offset, length) in header['layout'].items():
+            data = view[start+offset:start+offset+length]
+            if len(data) != length:
+                return None
+            if typecode == 's':
+                arrays[name] = str(data, 'utf-8')
+            else:
+                arrays[name] = data.cast(typecode)
+        return (header['metadata'], arrays)
+    except (ValueError, KeyError, TypeError):
+        return None
+
+def close_snapshot(arrays):
+    '''Releases the arrays returned by read_snapshot() and closes the
+    memory map behind them, the arrays cannot be used afterwards.
+
+    If other views of the map are still in use, like NumPy arrays,
+    the map is closed when the last of them is gone instead.
+    '''
+    mapped = None
+    try:
+        for values in arrays.values():
+            if isinstance(values, memoryview):
+                mapped = values.obj
+                values.release()
+        if mapped is not None:
+            mapped.close()
+    except BufferError:
+        pass
+
+# Highest code point in the Unicode code space.
+MAX_CODE_POINT = 0x10FFFF
+
+# General categories, in the order of the Unicode Standard Annex #44.
+# The empty string is used for code points which are not in the store.
+# The category column uses the positions in this tuple as its codes, see
+# UnicodeAttributes.category_code().
+GENERAL_CATEGORIES = (
+    '',
+    'Lu', 'Ll', 'Lt', 'Lm', 'Lo',
+    'Mn', 'Mc', 'Me',
+    'Nd', 'Nl', 'No',
+    'Pc', 'Pd', 'Ps', 'Pe', 'Pi', 'Pf', 'Po',
+    'Sm', 'Sc', 'Sk', 'So',
+    'Zs', 'Zl', 'Zp',
+    'Cc', 'Cf', 'Cs', 'Co', 'Cn',
+)
+
+# Bidirectional classes, in the order of the Unicode Standard Annex #44,
+# used the same way as GENERAL_CATEGORIES for the bidi column.
+BIDI_CLASSES = (
+    '',
+    'L', 'R', 'AL',
+    'EN', 'ES', 'ET', 'AN', 'CS', 'NSM', 'BN',
+    'B', 'S', 'WS', 'ON',
+    'LRE', 'LRO', 'RLE', 'RLO', 'PDF', 'LRI', 'RLI', 'FSI', 'PDI',
+)
+
+# Names of the fields of one line of UnicodeData.txt, in file order
+# (the first field, the code point itself, is not listed).
+UNICODE_DATA_FIELDS = (
+    'name',          # Character name
+    'category',      # General category
+    'combining',     # Canonical combining classes
+    'bidi',          # Bidirectional category
+    'decomposition', # Character decomposition mapping
+    'decdigit',      # Decimal digit value
+    'digit',         # Digit value
+    'numeric',       # Numeric value
+    'mirrored',      # mirrored
+    'oldname',       # Old Unicode 1.0 name
+    'comment',       # comment
+    'upper',         # Uppercase mapping
+    'lower',         # Lowercase mapping
+    'title',         # Titlecase mapping
+)
+
+class _EnumColumn(object):
+    '''A column of short strings with only a few distinct values.
+
+    Every distinct value is stored once in “values”, each row holds only
+    the index of its value in a typed array.  The known values given
+    when creating the column get the codes 0, 1, 2, … in this order,
+    whatever order they are found in.
+    '''
+    __slots__ = ('values', 'codes', '_value_index')
+
+    def __init__(self, typecode='B', known_values=()):
+        self.values = []
+        self.codes = array.array(typecode)
+        self._value_index = {}
+        for value in known_values:
+            self.intern(value)
+
+    def intern(self, value):
+        '''Returns the code of value, adding it to the values if needed'''
+        code = self._value_index.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._value_index[value] = code
+        return code
+
+    def code(self, value):
+        '''Returns the code of value, None if there is no such value'''
+        return self._value_index.get(value)
+
+    def append(self, value):
+        '''Adds a row'''
+        self.codes.append(self.intern(value))
+
+    def get(self, row):
+        '''Returns the value of a row'''
+        return self.values[self.codes[row]]
+
+    def snapshot(self, prefix, metadata, arrays):
+        '''Adds the contents of the column to a snapshot'''
+        metadata[prefix] = self.values
+        arrays[prefix] = self.codes
+
+    def restore(self, prefix, metadata, arrays):
+        '''Replaces the contents of the column by those of a snapshot'''
+        self.values[:] = metadata[prefix]
+        self._value_index = {
+            value: code for code, value in enumerate(self.values)}
+        self.codes = arrays[prefix]
+
+    def make_writable(self):
+        '''Copies restored read-only contents into a typed array'''
+        self.codes = array.array(self.codes.format, self.codes)
+
+class _BlobColumn(object):
+    '''A column of free text strings like names and decompositions.
+
+    All distinct strings are concatenated into one interned blob, each row
+    holds the index of its string, whose boundaries are kept in “starts”.
+    '''
+    __slots__ = ('ids', '_starts', '_blob', '_parts', '_value_index')
+
+    def __init__(self):
+        self.ids = array.array('I')
+        self._starts = array.array('I', [0])
+        self._blob = ''
+        self._parts = []
+        self._value_index = {}
+
+    def append(self, value):
+        '''Adds a row'''
+        if self._value_index is None:
+            self._thaw()
+        string_id = self._value_index.get(value)
+        if string_id is None:
+            string_id = len(self._starts) - 1
+            self._parts.append(value)
+            self._starts.append(self._starts[-1] + len(value))
+            self._value_index[value] = string_id
+        self.ids.append(string_id)
+
+    def freeze(self):
+        '''Joins the strings added so far into the blob and drops the
+        lookup table which is only needed while adding rows.
+        '''
+        if self._parts:
+            self._blob = ''.join([self._blob] + self._parts)
+            self._parts = []
+        self._value_index = None
+
+    def _thaw(self):
+        '''Rebuilds the lookup table to allow adding rows after freeze()'''
+        self._value_index = {}
+        for string_id in range(len(self._starts) - 1):
+            self._value_index[self._blob[
+                self._starts[string_id]:self._starts[string_id+1]]] = string_id
+
+    def get(self, row):
+        '''Returns the value of a row'''
+        if self._parts:
+            self.freeze()
+        string_id = self.ids[row]
+        return self._blob[self._starts[string_id]:self._starts[string_id+1]]
+
+    def snapshot(self, prefix, metadata, arrays):
+        '''Adds the contents of the column to a snapshot'''
+        self.freeze()
+        arrays[prefix + '.ids'] = self.ids
+        arrays[prefix + '.starts'] = self._starts
+        arrays[prefix + '.blob'] = self._blob
+
+    def restore(self, prefix, metadata, arrays):
+        '''Replaces the contents of the column by those of a snapshot'''
+        self.ids = arrays[prefix + '.ids']
+        self._starts = arrays[prefix + '.starts']
+        self._blob = arrays[prefix + '.blob']
+        self._parts = []
+        self._value_index = None
+
+    def make_writable(self):
+        '''Copies restored read-only contents into typed arrays'''
+        self.ids = array.array(self.ids.format, self.ids)
+        self._starts = array.array(self._starts.format, self._starts)
+
+class _CodePointColumn(object):
+    '''A column of optional code points like the case mappings.
+
+    0 is used to mark a missing value, U+0000 is never a case mapping.
+    '''
+    __slots__ = ('codes',)
+
+    def __init__(self):
+        self.codes = array.array('I')
+
+    def append(self, value):
+        '''Adds a row'''
+        self.codes.append(int(value, 16) if value else 0)
+
+    def get(self, row):
+        '''Returns the value of a row, None if there is no value'''
+        return self.codes[row] or None
+
+    def snapshot(self, prefix, metadata, arrays):
+        '''Adds the contents of the column to a snapshot'''
+        arrays[prefix] = self.codes
+
+    def restore(self, prefix, metadata, arrays):
+        '''Replaces the contents of the column by those of a snapshot'''
+        self.codes = arrays[prefix]
+
+    def make_writable(self):
+        '''Copies restored read-only contents into a typed array'''
+        self.codes = array.array(self.codes.format, self.codes)
+
+class _CombiningClassColumn(_CodePointColumn):
+    '''The canonical combining classes, each one fits into a byte.'''
+    __slots__ = ()
+
+    def __init__(self):
+        self.codes = array.array('B')
+
+    def append(self, value):
+        '''Adds a row'''
+        self.codes.append(int(value) if value else 0)
+
+    def get(self, row):
+        '''Returns the value of a row as the string found in the file'''
+        return str(self.codes[row])
+
+class _MissingColumn(object):
+    '''Stands in for a column left out by
+    UnicodeAttributes.select_fields(), every access raises KeyError.
+    '''
+    __slots__ = ('field',)
+
+    def __init__(self, field):
+        self.field = field
+
+    def get(self, row):
+        '''Raises KeyError, the column has not been loaded'''
+        raise KeyError(
+            'field "%s" of UnicodeData.txt has not been loaded' %self.field)
+
+    __getitem__ = get
+
+    @property
+    def values(self):
+        '''Stands in for the values of an _EnumColumn'''
+        return self
+
+    codes = values
+
+class UnicodeAttributeRecord(collections.abc.Mapping):
+    '''Read-only view on the attributes of one code point.
+
+    It behaves like the dictionaries which used to be stored per code
+    point, i.e. record['name'], record['upper'] etc. work as before.
+    '''
+    __slots__ = ('_columns', '_row')
+
+    def __init__(self, columns, row):
+        self._columns = columns
+        self._row = row
+
+    def __getitem__(self, field):
+        return self._columns[field].get(self._row)
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+class UnicodeAttributes(collections.abc.Mapping):
+    '''Column store for the contents of the UnicodeData.txt file.
+
+    Each line of UnicodeData.txt is one row in a set of typed columns.
+    The code points of a “First”/“Last” range are kept as one block
+    sharing one row, see runs() and block().  The store can be used
+    like the dictionary of dictionaries it replaces:
+
+    UNICODE_ATTRIBUTES[0x0041]['lower'] → 0x0061
+
+    The predicates in this module use the faster accessor methods
+    like category() instead.
+
+    A store can be restricted to some of the fields with
+    select_fields() before anything is added, the other fields are
+    then neither parsed nor stored.
+    '''
+    def __init__(self):
+        self.columns = {
+            'name': _BlobColumn(),
+            'category': _EnumColumn('B', GENERAL_CATEGORIES),
+            'combining': _CombiningClassColumn(),
+            'bidi': _EnumColumn('B', BIDI_CLASSES),
+            'decomposition': _BlobColumn(),
+            'decdigit': _EnumColumn('H'),
+            'digit': _EnumColumn('H'),
+            'numeric': _EnumColumn('H'),
+            'mirrored': _EnumColumn('B', ('', 'N', 'Y')),
+            'oldname': _BlobColumn(),
+            'comment': _BlobColumn(),
+            'upper': _CodePointColumn(),
+            'lower': _CodePointColumn(),
+            'title': _CodePointColumn(),
+        }
+        self._bind_shortcuts()
+        # Sorted array of the code points stored by single lines.
+        self._code_points = array.array('I')
+        # Code point ranges stored by “First”/“Last” pairs of lines,
+        # sorted by their first code point.  Their members are never
+        # stored one by one.
+        self._block_firsts = array.array('I')
+        self._block_lasts = array.array('I')
+        # Row number for each code point in the code space.  Row 0 is
+        # an empty row used for all code points not in the store.
+        self._rows = array.array('I', bytes(4 * (MAX_CODE_POINT + 1)))
+        self._row_count = 0
+        # Read-only array of all code points in ascending order, built
+        # by code_points() and dropped whenever the store changes.
+        self._sorted_code_points = None
+        # True after restore(), the arrays are read-only views into a
+        # snapshot file then, whose arrays are _snapshot_arrays.
+        self._restored = False
+        self._snapshot_arrays = None
+        self.add(None, None, [''] * 15)
+
+    def _bind_shortcuts(self):
+        '''Sets up the shortcuts used by add() and the accessor methods'''
+        # (index of the field in a line of UnicodeData.txt, column)
+        self._fields = [
+            (UNICODE_DATA_FIELDS.index(field) + 1, column)
+            for field, column in self.columns.items()]
+        columns = {field: self.columns.get(field, _MissingColumn(field))
+                   for field in UNICODE_DATA_FIELDS}
+        self._name = columns['name']
+        self._category_values = columns['category'].values
+        self._category_codes = columns['category'].codes
+        self._bidi_codes = columns['bidi'].codes
+        self._combining = columns['combining'].codes
+        self._decomposition = columns['decomposition']
+        self._upper = columns['upper'].codes
+        self._lower = columns['lower'].codes
+        self._title = columns['title'].codes
+
+    def select_fields(self, fields):
+        '''Restricts the store to the given fields of UNICODE_DATA_FIELDS.
+
+        Only these fields are stored by add(), asking for any other
+        field raises KeyError.  This is possible only while the store
+        is empty.
+        '''
+        if not self.is_empty():
+            raise ValueError('fields can only be selected in an empty store')
+        for field in fields:
+            if field not in UNICODE_DATA_FIELDS:
+                raise ValueError(
+                    'unknown UnicodeData.txt field: %s' %field)
+        self.columns = {field: column
+                        for field, column in self.columns.items()
+                        if field in fields}
+        self._bind_shortcuts()
+
+    def add(self, first, last, fields):
+        '''Stores one line of UnicodeData.txt for the code points
+        from first to last.
+
+        fields are the 15 strings found on that line.  If first and
+        last differ, the code points are stored as one block.
+        '''
+        if self._restored:
+            self._make_writable()
+        if first is not None:
+            if first != last and any(self._rows[first:last+1]):
+                raise ValueError(
+                    'block {:s} overlaps stored code points'.format(
+                        ucs_symbol_range(first, last)))
+            if self.block(first) is not None:
+                raise ValueError(
+                    'code point {:s} is already in a block'.format(
+                        ucs_symbol(first)))
+        row = self._row_count
+        self._row_count += 1
+        self._sorted_code_points = None
+        for index, column in self._fields:
+            column.append(fields[index])
+        if first is None:
+            return
+        if first == last:
+            if not self._rows[first]:
+                bisect.insort(self._code_points, first)
+            self._rows[first] = row
+            return
+        index = bisect.bisect(self._block_firsts, first)
+        self._block_firsts.insert(index, first)
+        self._block_lasts.insert(index, last)
+        self._rows[first:last+1] = array.array('I', [row]) * (last - first + 1)
+
+    def freeze(self):
+        '''Finishes loading, releases memory only needed while adding'''
+        for column in self.columns.values():
+            if isinstance(column, _BlobColumn):
+                column.freeze()
+
+    def is_empty(self):
+        '''Checks whether nothing has been added to the store yet'''
+        return self._row_count == 1
+
+    def snapshot(self):
+        '''Returns the contents of the store as (metadata, arrays)
+        for write_snapshot()'''
+        self.freeze()
+        metadata = {'row_count': self._row_count,
+                    'fields': list(self.columns)}
+        arrays = {
+            'code_points': self._code_points,
+            'block_firsts': self._block_firsts,
+            'block_lasts': self._block_lasts,
+            'rows': self._rows,
+        }
+        for field, column in self.columns.items():
+            column.snapshot(field, metadata, arrays)
+        return (metadata, arrays)
+
+    def restore(self, metadata, arrays):
+        '''Replaces the contents of the store by a snapshot returned
+        by read_snapshot()'''
+        if list(self.columns) != metadata['fields']:
+            self.select_fields(metadata['fields'])
+        for field, column in self.columns.items():
+            column.restore(field, metadata, arrays)
+        self._code_points = arrays['code_points']
+        self._block_firsts = arrays['block_firsts']
+        self._block_lasts = arrays['block_lasts']
+        self._rows = arrays['rows']
+        self._row_count = metadata['row_count']
+        self._restored = True
+        self._snapshot_arrays = arrays
+        self._sorted_code_points = None
+        self._bind_shortcuts()
+
+    def _make_writable(self):
+        '''Copies the read-only arrays of a restored snapshot'''
+        for column in self.columns.values():
+            column.make_writable()
+        self._code_points = array.array('I', self._code_points)
+        self._block_firsts = array.array('I', self._block_firsts)
+        self._block_lasts = array.array('I', self._block_lasts)
+        self._rows = array.array('I', self._rows)
+        self._restored = False
+        self._bind_shortcuts()
+        close_snapshot(self._snapshot_arrays)
+        self._snapshot_arrays = None
+
+    def release_snapshot(self):
+        '''Copies the arrays of a restored snapshot into memory and
+        closes the snapshot file'''
+        if self._restored:
+            self._make_writable()
+
+    def __getitem__(self, code_point):
+        if code_point not in self:
+            raise KeyError(code_point)
+        return UnicodeAttributeRecord(self.columns, self._rows[code_point])
+
+    def __contains__(self, code_point):
+        return (isinstance(code_point, int)
+                and 0 <= code_point <= MAX_CODE_POINT
+                and self._rows[code_point] != 0)
+
+    def __iter__(self):
+        return iter(self.code_points())
+
+    def __len__(self):
+        return len(self._code_points) + sum(
+            last - first + 1
+            for first, last in zip(self._block_firsts, self._block_lasts))
+
+    def runs(self):
+        '''Yields (first, last) tuples in ascending order for all single
+        code points (first == last) and all blocks in the store.
+
+        All code points of a block have the same attributes, so callers
+        can handle a block as one run without visiting its members.
+        '''
+        blocks = zip(self._block_firsts, self._block_lasts)
+        block = next(blocks, None)
+        for code_point in self._code_points:
+            while block and block[0] < code_point:
+                yield block
+                block = next(blocks, None)
+            yield (code_point, code_point)
+        while block:
+            yield block
+            block = next(blocks, None)
+
+    def code_points(self):
+        '''Returns all code points in the store, including the members
+        of blocks, in ascending order as a read-only memoryview.
+
+        The array is built once and shared by all callers until the
+        store changes, so there is no need to sort the store.
+        '''
+        if self._sorted_code_points is None:
+            code_points = array.array('I')
+            for first, last in self.runs():
+                if first == last:
+                    code_points.append(first)
+                else:
+                    code_points.extend(range(first, last + 1))
+            self._sorted_code_points = memoryview(code_points).toreadonly()
+        return self._sorted_code_points
+
+    def numpy_rows(self):
+        '''Returns the row number of every code point as a NumPy array
+        indexed by code point, 0 for code points not in the store'''
+        return numpy.asarray(self._rows)
+
+    def numpy_column(self, field, function=None):
+        '''Returns a NumPy array holding the value of a field for every
+        code point, indexed by code point.
+
+        The typed columns give the values returned by the accessor
+        methods, like category_code() or combining_class().  The text
+        columns need a function converting a value to a number or bool,
+        it is called once per row and not once per code point.
+        '''
+        column = self.columns[field]
+        if function is None:
+            values = numpy.asarray(column.codes)
+        else:
+            values = numpy.array([function(column.get(row))
+                                  for row in range(self._row_count)])
+        return values[self.numpy_rows()]
+
+    def block(self, code_point):
+        '''Returns (first, last) of the block containing code_point,
+        None if the code point is not in a block.'''
+        index = bisect.bisect(self._block_firsts, code_point) - 1
+        if index >= 0 and code_point <= self._block_lasts[index]:
+            return (self._block_firsts[index], self._block_lasts[index])
+        return None
+
+    # The accessors below are used on the hot paths of the predicates.
+    # They do not raise KeyError for code points which are not in the
+    # store but return the empty values of row 0 for them, i.e. no
+    # name, no category, combining class 0 and no case mappings.
+
+    def get_field(self, code_point, field):
+        '''Returns one attribute of a code point'''
+        return self.columns[field].get(self._rows[code_point])
+
+    def name(self, code_point):
+        '''Returns the name of a code point'''
+        return self._name.get(self._rows[code_point])
+
+    def category(self, code_point):
+        '''Returns the general category of a code point'''
+        return self._category_values[
+            self._category_codes[self._rows[code_point]]]
+
+    def category_code(self, code_point):
+        '''Returns the general category of a code point as its index
+        in GENERAL_CATEGORIES'''
+        return self._category_codes[self._rows[code_point]]
+
+    def bidi_code(self, code_point):
+        '''Returns the bidirectional class of a code point as its index
+        in BIDI_CLASSES'''
+        return self._bidi_codes[self._rows[code_point]]
+
+    def combining_class(self, code_point):
+        '''Returns the canonical combining class of a code point as int'''
+        return self._combining[self._rows[code_point]]
+
+    def decomposition(self, code_point):
+        '''Returns the decomposition mapping of a code point'''
+        return self._decomposition.get(self._rows[code_point])
+
+    def upper(self, code_point):
+        '''Returns the uppercase mapping of a code point, 0 if none'''
+        return self._upper[self._rows[code_point]]
+
+    def lower(self, code_point):
+        '''Returns the lowercase mapping of a code point, 0 if none'''
+        return self._lower[self._rows[code_point]]
+
+    def title(self, code_point):
+        '''Returns the titlecase mapping of a code point, 0 if none'''
+        return self._title[self._rows[code_point]]
+
+class PropertyBitmaps(collections.abc.Mapping):
+    '''Binary properties of code points, one bitmap over the whole code
+    space per property.
+
+    has_property() is a single bit probe.  For existing callers the
+    object can also be used like a dictionary which maps each code point
+    having at least one property to the list of its properties.
+    '''
+    _BITMAP_SIZE = (MAX_CODE_POINT + 1) // 8
+
+    def __init__(self):
+        # Property name → bitmap, in the order the properties were added.
+        self.bitmaps = {}
+
+    @staticmethod
+    def _masks(first, last):
+        '''Returns the byte indexes and bit masks of the first and the
+        last byte of the code points from first to last'''
+        first_byte = first >> 3
+        last_byte = last >> 3
+        first_mask = (0xFF << (first & 7)) & 0xFF
+        last_mask = 0xFF >> (7 - (last & 7))
+        if first_byte == last_byte:
+            first_mask = last_mask = first_mask & last_mask
+        return (first_byte, first_mask, last_byte, last_mask)
+
+    def add_range(self, first, last, prop):
+        '''Sets the property for all code points from first to last'''
+        bitmap = self.bitmaps.get(prop)
+        if bitmap is None:
+            bitmap = self.bitmaps[prop] = bytearray(self._BITMAP_SIZE)
+        (first_byte, first_mask, last_byte, last_mask) = self._masks(
+            first, last)
+        bitmap[first_byte] |= first_mask
+        bitmap[first_byte+1:last_byte] = b'\xff' * max(
+            0, last_byte - first_byte - 1)
+        bitmap[last_byte] |= last_mask
+
+    def has_property(self, code_point, prop):
+        '''Checks whether the code point has the property'''
+        bitmap = self.bitmaps.get(prop)
+        return (bitmap is not None
+                and (bitmap[code_point >> 3] >> (code_point & 7)) & 1 == 1)
+
+    def numpy_mask(self, prop):
+        '''Returns a NumPy array of bools indexed by code point which is
+        true for the code points having the property'''
+        bitmap = self.bitmaps.get(prop)
+        if bitmap is None:
+            return numpy.zeros(MAX_CODE_POINT + 1, dtype=bool)
+        return numpy.unpackbits(
+            numpy.frombuffer(bitmap, dtype=numpy.uint8),
+            bitorder='little').astype(bool)
+
+    def constant(self, first, last):
+        '''Checks whether all code points from first to last have the
+        same properties'''
+        (first_byte, first_mask, last_byte, last_mask) = self._masks(
+            first, last)
+        for bitmap in self.bitmaps.values():
+            if (bitmap[first_byte] >> (first & 7)) & 1:
+                if (bitmap[first_byte] & first_mask != first_mask
+                        or bitmap[last_byte] & last_mask != last_mask
+                        or bitmap[first_byte+1:last_byte].strip(b'\xff')):
+                    return False
+            elif (bitmap[first_byte] & first_mask
+                  or bitmap[last_byte] & last_mask
+                  or bitmap[first_byte+1:last_byte].strip(b'\x00')):
+                return False
+        return True
+
+    def _union(self):
+        '''Returns a bitmap of all code points having any property'''
+        union = 0
+        for bitmap in self.bitmaps.values():
+            union |= int.from_bytes(bitmap, 'little')
+        return union.to_bytes(self._BITMAP_SIZE, 'little')
+
+    def __getitem__(self, code_point):
+        if not isinstance(code_point, int) or not (
+                0 <= code_point <= MAX_CODE_POINT):
+            raise KeyError(code_point)
+        properties = [prop for prop, bitmap in self.bitmaps.items()
+                      if (bitmap[code_point >> 3] >> (code_point & 7)) & 1]
+        if not properties:
+            raise KeyError(code_point)
+        return properties
+
+    def __contains__(self, code_point):
+        return (isinstance(code_point, int)
+                and 0 <= code_point <= MAX_CODE_POINT
+                and any((bitmap[code_point >> 3] >> (code_point & 7)) & 1
+                        for bitmap in self.bitmaps.values()))
+
+    def __iter__(self):
+        union = self._union()
+        for index, byte in enumerate(union):
+            if byte:
+                for bit in range(8):
+                    if (byte >> bit) & 1:
+                        yield index * 8 + bit
+
+    def __len__(self):
+        return bin(int.from_bytes(self._union(), 'little')).count('1')
+
+class IntervalMap(collections.abc.Mapping):
+    '''Maps non-overlapping code point ranges to values.
+
+    Looking up a code point is a binary search over the ranges.  The
+    object can be used like a dictionary mapping each code point to its
+    value, ranges() iterates over the ranges themselves.
+    '''
+    def __init__(self):
+        self._firsts = array.array('I')
+        self._lasts = array.array('I')
+        self._values = _EnumColumn('H')
+
+    def add(self, first, last, value):
+        '''Maps all code points from first to last to value'''
+        index = bisect.bisect(self._firsts, first)
+        if ((index > 0 and self._lasts[index-1] >= first)
+                or (index < len(self._firsts)
+                    and self._firsts[index] <= last)):
+            raise ValueError('range {:s} overlaps an existing range'.format(
+                ucs_symbol_range(first, last)))
+        self._firsts.insert(index, first)
+        self._lasts.insert(index, last)
+        self._values.codes.insert(index, self._values.intern(value))
+
+    def _index(self, code_point):
+        '''Returns the index of the range containing the code point,
+        -1 if there is none'''
+        index = bisect.bisect(self._firsts, code_point) - 1
+        if index >= 0 and code_point <= self._lasts[index]:
+            return index
+        return -1
+
+    def __getitem__(self, code_point):
+        index = self._index(code_point)
+        if index < 0:
+            raise KeyError(code_point)
+        return self._values.get(index)
+
+    def __contains__(self, code_point):
+        return isinstance(code_point, int) and self._index(code_point) >= 0
+
+    def __iter__(self):
+        for first, last in zip(self._firsts, self._lasts):
+            yield from range(first, last + 1)
+
+    def __len__(self):
+        return sum(last - first + 1
+                   for first, last in zip(self._firsts, self._lasts))
+
+    def ranges(self, values=None):
+        '''Yields (first, last, value) for all ranges in ascending order.
+
+        If values is given, only the ranges mapped to one of these
+        values are returned, for example ranges(('W', 'F')) returns
+        all wide ranges of EAST_ASIAN_WIDTHS.
+        '''
+        codes = None
+        if values is not None:
+            codes = {self._values.code(value) for value in values}
+        for first, last, code in zip(
+                self._firsts, self._lasts, self._values.codes):
+            if codes is None or code in codes:
+                yield (first, last, self._values.values[code])
+
+class IntervalSet(object):
+    '''Immutable set of code points kept as sorted, disjoint and
+    non-adjacent (first, last) ranges.
+
+    The set operations work on the ranges, so their cost depends on
+    the number of ranges and not on the number of code points:
+
+    graph = IntervalSet([(0x0021, 0x007E), (0x00A1, 0x00AC)])
+    alpha = IntervalSet([(0x0041, 0x005A), (0x0061, 0x007A)])
+    list((graph - alpha).runs())
+    → [(0x0021, 0x0040), (0x005B, 0x0060), (0x007B, 0x007E), …]
+    '''
+    __slots__ = ('_firsts', '_lasts')
+
+    def __init__(self, ranges=()):
+        '''ranges is an iterable of (first, last) tuples in any order,
+        they may overlap or be adjacent'''
+        self._firsts = array.array('I')
+        self._lasts = array.array('I')
+        for first, last in sorted(ranges):
+            if self._lasts and first <= self._lasts[-1] + 1:
+                if last > self._lasts[-1]:
+                    self._lasts[-1] = last
+            else:
+                self._firsts.append(first)
+                self._lasts.append(last)
+
+    @classmethod
+    def _from_sorted(cls, firsts, lasts):
+        '''Creates a set from arrays of ranges which are already sorted,
+        disjoint and non-adjacent'''
+        interval_set = cls()
+        interval_set._firsts = firsts
+        interval_set._lasts = lasts
+        return interval_set
+
+    def runs(self):
+        '''Yields the (first, last) ranges of the set in ascending order'''
+        return zip(self._firsts, self._lasts)
+
+    def __iter__(self):
+        for first, last in self.runs():
+            yield from range(first, last + 1)
+
+    def __len__(self):
+        return sum(last - first + 1 for first, last in self.runs())
+
+    def __bool__(self):
+        return bool(self._firsts)
+
+    def __contains__(self, code_point):
+        index = bisect.bisect(self._firsts, code_point) - 1
+        return index >= 0 and code_point <= self._lasts[index]
+
+    def __eq__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self._firsts == other._firsts and self._lasts == other._lasts
+
+    def __repr__(self):
+        return 'IntervalSet([{:s}])'.format(', '.join(
+            '(0x{:04X}, 0x{:04X})'.format(first, last)
+            for first, last in self.runs()))
+
+    def _merge(self, other, keep):
+        '''Sweeps over the range boundaries of both sets and keeps the
+        code points for which keep(in_self, in_other) is true'''
+        boundaries = sorted(
+            [(first, 0) for first in self._firsts]
+            + [(last + 1, 0) for last in self._lasts]
+            + [(first, 1) for first in other._firsts]
+            + [(last + 1, 1) for last in other._lasts])
+        inside = [False, False]
+        firsts = array.array('I')
+        lasts = array.array('I')
+        kept_first = None
+        index = 0
+        while index < len(boundaries):
+            position = boundaries[index][0]
+            # Handle all boundaries at this position at once
+            while (index < len(boundaries)
+                   and boundaries[index][0] == position):
+                which = boundaries[index][1]
+                inside[which] = not inside[which]
+                index += 1
+            if keep(*inside):
+                if kept_first is None:
+                    kept_first = position
+            elif kept_first is not None:
+                firsts.append(kept_first)
+                lasts.append(position - 1)
+                kept_first = None
+        return IntervalSet._from_sorted(firsts, lasts)
+
+    def __or__(self, other):
+        return self._merge(other, lambda a, b: a or b)
+
+    def __and__(self, other):
+        return self._merge(other, lambda a, b: a and b)
+
+    def __sub__(self, other):
+        return self._merge(other, lambda a, b: a and not b)
+
+    def __xor__(self, other):
+        return self._merge(other, lambda a, b: a != b)
+
+    union = __or__
+    intersection = __and__
+    difference = __sub__
+    symmetric_difference = __xor__
+
+    def complement(self):
+        '''Returns the set of all code points up to MAX_CODE_POINT
+        which are not in this set'''
+        return IntervalSet([(0, MAX_CODE_POINT)]) - self
+
+def _numpy_interval_set(mask):
+    '''Returns the IntervalSet of the indexes where a NumPy array of
+    bools is true'''
+    edges = numpy.diff(mask.astype(numpy.int8), prepend=0, append=0)
+    firsts = numpy.flatnonzero(edges == 1)
+    lasts = numpy.flatnonzero(edges == -1) - 1
+    return IntervalSet._from_sorted(array.array('I', firsts.tolist()),
+                                    array.array('I', lasts.tolist()))
+
+class CaseMapping(object):
+    '''One of the simple case mappings of UnicodeData.txt, holding only
+    the code points which are mapped to a different code point.
+
+    The mapped code points are kept as two sorted typed arrays, an
+    index maps each of them to its position.  A locale tailoring is a
+    sparse overlay dictionary mapping code points to their tailored
+    mapping, it is looked up before the mapping of the store:
+
+    to_upper = ucd.case_mapping('upper', {0x0069: 0x0130})
+    to_upper(0x0069) → 0x0130
+    to_upper(0x0061) → 0x0041
+    to_upper(0x0031) → 0x0031
+    '''
+    __slots__ = ('_code_points', '_mapped', '_index', 'overlay')
+
+    def __init__(self, pairs=(), overlay=None):
+        '''pairs is an iterable of (code_point, mapped) tuples in
+        ascending order of the code points'''
+        self._code_points = array.array('I')
+        self._mapped = array.array('I')
+        for code_point, mapped in pairs:
+            if mapped != code_point:
+                self._code_points.append(code_point)
+                self._mapped.append(mapped)
+        self._index = {code_point: index for index, code_point
+                       in enumerate(self._code_points)}
+        self.overlay = overlay or {}
+
+    def tailored(self, overlay):
+        '''Returns the mapping with the overlay dictionary applied, it
+        shares the arrays of this mapping'''
+        mapping = CaseMapping()
+        mapping._code_points = self._code_points
+        mapping._mapped = self._mapped
+        mapping._index = self._index
+        mapping.overlay = dict(self.overlay)
+        mapping.overlay.update(overlay)
+        return mapping
+
+    def __call__(self, code_point):
+        '''Returns the code point code_point is mapped to, code_point
+        itself if it has no mapping'''
+        if code_point in self.overlay:
+            return self.overlay[code_point]
+        index = self._index.get(code_point)
+        if index is None:
+            return code_point
+        return self._mapped[index]
+
+    def items(self):
+        '''Yields the (code_point, mapped) tuples of all code points
+        mapped to a different code point, in ascending order'''
+        if not self.overlay:
+            return zip(self._code_points, self._mapped)
+        return ((code_point, self(code_point)) for code_point in sorted(
+            set(self._code_points).union(self.overlay))
+                if self(code_point) != code_point)
+
+    def __len__(self):
+        return sum(1 for pair in self.items())
+
+    def deltas(self):
+        '''Returns an array holding mapped - code_point for every code
+        point, indexed by code point, 0 for code points without
+        mapping'''
+        deltas = array.array('i', bytes(4 * (MAX_CODE_POINT + 1)))
+        for code_point, mapped in self.items():
+            deltas[code_point] = mapped - code_point
+        return deltas
+
+# Directory of the locale tailoring files found by locale_tailoring()
+TAILORING_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'tailorings')
+
+class LocaleTailoring(object):
+    '''The tailoring of the LC_CTYPE category for one locale, see
+    read_locale_tailoring().
+
+    name is the name of the locale and conventions the name of the
+    conventions its case mappings reflect, for the comments in the
+    generated files, or None.  overlays maps 'upper', 'lower' and
+    'title' to the overlay dictionaries of the case mappings, see
+    CaseMapping.  added and removed map names in CHARACTER_CLASSES to
+    the IntervalSets of the code points added to or removed from the
+    class, see UCD.tailored_character_classes().
+    '''
+    def __init__(self, name):
+        self.name = name
+        self.conventions = None
+        self.overlays = {'upper': {}, 'lower': {}, 'title': {}}
+        self.added = {}
+        self.removed = {}
+
+def read_locale_tailoring(filename):
+    '''Reads a locale tailoring file and returns its LocaleTailoring,
+    named after the file without the “.txt” extension.
+
+    Lines have fields separated by “;” like the UCD property files,
+    “#” starts a comment:
+
+    conventions ; Turkish
+    upper       ; 0069 ; 0130 # LATIN SMALL LETTER I
+    add         ; alpha ; 02B0..02C1
+    remove      ; punct ; 00A7
+
+    conventions gives the name of the conventions.  upper, lower and
+    title map a code point to its tailored case mapping.  add and
+    remove add a code point or a range of code points to a class of
+    CHARACTER_CLASSES or remove it from the class.
+    '''
+    tailoring = LocaleTailoring(
+        os.path.splitext(os.path.basename(filename))[0])
+    added = collections.defaultdict(list)
+    removed = collections.defaultdict(list)
+    with open(filename, mode='r') as tailoring_file:
+        for line in tailoring_file:
+            fields = [field.strip()
+                      for field in line.partition('#')[0].split(';')]
+            if fields == ['']:
+                continue
+            try:
+                if fields[0] == 'conventions' and len(fields) == 2:
+                    tailoring.conventions = fields[1]
+                    continue
+                if fields[0] in tailoring.overlays and len(fields) == 3:
+                    code_point = int(fields[1], 16)
+                    mapped = int(fields[2], 16)
+                    if max(code_point, mapped) <= MAX_CODE_POINT:
+                        tailoring.overlays[fields[0]][code_point] = mapped
+                        continue
+                elif (fields[0] in ('add', 'remove') and len(fields) == 3
+                      and fields[1] in CHARACTER_CLASSES):
+                    (first, _, last) = fields[2].partition('..')
+                    first = int(first, 16)
+                    last = int(last, 16) if last else first
+                    if first <= last <= MAX_CODE_POINT:
+                        ranges = added if fields[0] == 'add' else removed
+                        ranges[fields[1]].append((first, last))
+                        continue
+            except ValueError:
+                pass
+            sys.stderr.write(
+                'broken line in file "%(f)s": %(l)s\n' %{
+                    'f': filename, 'l': line})
+            exit(1)
+    tailoring.added = {name: IntervalSet(ranges)
+                       for name, ranges in added.items()}
+    tailoring.removed = {name: IntervalSet(ranges)
+                         for name, ranges in removed.items()}
+    return tailoring
+
+# Tailorings read by locale_tailoring(), by file name
+_LOCALE_TAILORINGS = {}
+
+def locale_tailoring(name):
+    '''Returns the LocaleTailoring of a locale like 'tr_TR', read from
+    the file “tr_TR.txt” in TAILORING_DIRECTORY on the first call.
+
+    A name containing a directory or ending in “.txt” is the name of
+    a tailoring file instead, like 'tailorings/az_AZ.txt'.
+    '''
+    filename = name
+    if not (os.path.dirname(name) or name.endswith('.txt')):
+        filename = os.path.join(TAILORING_DIRECTORY, name + '.txt')
+    tailoring = _LOCALE_TAILORINGS.get(filename)
+    if tailoring is None:
+        tailoring = _LOCALE_TAILORINGS[filename] = read_locale_tailoring(
+            filename)
+    return tailoring
+
+def _smallest_typecode(maximum):
+    '''Returns the typecode of the smallest unsigned array type which
+    holds values up to maximum'''
+    for typecode in ('B', 'H', 'I'):
+        if maximum < 1 << (8 * array.array(typecode).itemsize):
+            return typecode
+    return 'L'
+
+class TrieTable(object):
+    '''Multi-level lookup table holding a value for every code point.
+
+    The code points are split into bit fields at the given shifts, each
+    field indexes one level of the table.  The blocks of a level are
+    stored only once if they occur several times, which makes the table
+    small because most blocks of the code space are alike.  With the
+    default shifts (12, 5) the levels are indexed by bits 20…12, 11…5
+    and 4…0 of the code point:
+
+    index = tables[0][code_point >> 12]
+    index = tables[1][(index << 7) + ((code_point >> 5) & 0x7F)]
+    value = tables[2][(index << 5) + (code_point & 0x1F)]
+    '''
+    __slots__ = ('shifts', 'tables')
+
+    def __init__(self, values, shifts=(12, 5)):
+        '''values is a typed array holding the value of every code
+        point, indexed by code point.  shifts are in descending order.
+        '''
+        self.shifts = tuple(shifts)
+        self.tables = []
+        bits_below = 0
+        for shift in reversed(self.shifts):
+            (blocks, values) = self._deduplicate(
+                values, 1 << (shift - bits_below))
+            self.tables.insert(0, blocks)
+            bits_below = shift
+        self.tables.insert(0, values)
+
+    @staticmethod
+    def _deduplicate(values, size):
+        '''Cuts the array values into blocks of size values, returns
+        an array of the distinct blocks and an array holding the number
+        of the block in it for each block of values'''
+        blocks = array.array(values.typecode)
+        block_numbers = {}
+        numbers = []
+        for start in range(0, len(values), size):
+            block = values[start:start+size]
+            key = block.tobytes()
+            number = block_numbers.get(key)
+            if number is None:
+                number = block_numbers[key] = len(block_numbers)
+                blocks.extend(block)
+            numbers.append(number)
+        return (blocks,
+                array.array(_smallest_typecode(len(block_numbers) - 1),
+                            numbers))
+
+    def __getitem__(self, code_point):
+        tables = self.tables
+        shifts = self.shifts
+        index = tables[0][code_point >> shifts[0]]
+        for level in range(1, len(shifts)):
+            bits = shifts[level-1] - shifts[level]
+            index = tables[level][
+                (index << bits)
+                + ((code_point >> shifts[level]) & ((1 << bits) - 1))]
+        return tables[-1][
+            (index << shifts[-1]) + (code_point & ((1 << shifts[-1]) - 1))]
+
+    def size(self):
+        '''Returns the size of all levels of the table in bytes'''
+        return sum(len(table) * table.itemsize for table in self.tables)
+
+class NameIndex(object):
+    '''Index over the character names of a UnicodeAttributes store to
+    find all code points whose name contains a substring.
+
+    All names are joined into one text, each one preceded by a newline,
+    so a query is a few str.find() calls over that text instead of a
+    Python loop over all names.  A block of code points shares one
+    name, all its members are found by a query matching that name.
+    The results are cached, build the index only after the store has
+    been filled.
+    '''
+    def __init__(self, attributes):
+        parts = []
+        self._starts = array.array('I')
+        self._firsts = array.array('I')
+        self._lasts = array.array('I')
+        length = 0
+        for first, last in attributes.runs():
+            name = attributes.name(first)
+            self._starts.append(length)
+            self._firsts.append(first)
+            self._lasts.append(last)
+            parts.append('\n' + name)
+            length += len(name) + 1
+        self._text = ''.join(parts)
+        self._cache = {}
+
+    def _find(self, pattern):
+        '''Returns the code points of all names containing pattern'''
+        code_points = set()
+        position = self._text.find(pattern)
+        while position >= 0:
+            index = bisect.bisect(self._starts, position) - 1
+            code_points.update(
+                range(self._firsts[index], self._lasts[index] + 1))
+            if index + 1 >= len(self._starts):
+                break
+            position = self._text.find(pattern, self._starts[index + 1])
+        return code_points
+
+    def search(self, *substrings):
+        '''Returns a frozenset of the code points whose name contains
+        at least one of the substrings.
+
+        Example:
 
-    A typical line for a single code point in UnicodeData.txt looks
-    like this:
+        search('LIGATURE') → frozenset({0x0132, 0x0133, 0x0152, …})
+        '''
+        result = self._cache.get(substrings)
+        if result is None:
+            code_points = set()
+            for substring in substrings:
+                code_points.update(self._find(substring))
+            result = self._cache[substrings] = frozenset(code_points)
+        return result
 
-    0041;LATIN CAPITAL LETTER A;Lu;0;L;;;;;N;;;;0061;
+    def search_prefix(self, prefix):
+        '''Returns a frozenset of the code points whose name starts
+        with prefix'''
+        return self.search('\n' + prefix)
 
-    Code point ranges are indicated by pairs of lines like this:
+def read_unicode_data(filename):
+    '''Yields the lines of the UnicodeData.txt file as
+    (first, last, fields) tuples in file order.
 
-    4E00;<CJK Ideograph, First>;Lo;0;L;;;;;N;;;;;
-    9FCC;<CJK Ideograph, Last>;Lo;0;L;;;;;N;;;;;
+    fields are the 15 strings found on a line.  A single code point
+    has first == last, a “First”/“Last” pair of lines is yielded once
+    for the whole range with the name stripped down to the name of
+    the range, for example “CJK Ideograph”.  Surrogates are skipped.
     '''
     with open(filename, mode='r') as unicode_data_file:
         fields_start = []
@@ -141,21 +1401,86 @@ def fill_attributes(filename):
                         'broken code point range in file "%(f)s": %(l)s\n' %{
                             'f': filename, 'l': line})
                     exit(1)
-                for code_point in range(
-                        int(fields_start[0], 16),
-                        int(fields[0], 16)+1):
-                    fill_attribute(code_point, fields)
+                yield (int(fields_start[0], 16), int(fields[0], 16), fields)
                 fields_start = []
                 continue
-            fill_attribute(int(fields[0], 16), fields)
+            code_point = int(fields[0], 16)
+            yield (code_point, code_point, fields)
             fields_start = []
 
-def fill_derived_core_properties(filename):
-    '''Stores the entire contents of the DerivedCoreProperties.txt file
-    in the DERIVED_CORE_PROPERTIES dictionary.
+def _parse_unicode_data(filename, fields):
+    '''Parses UnicodeData.txt into a new store in a worker process of
+    fill_all() and returns its contents as (metadata, arrays)'''
+    store = UnicodeAttributes()
+    if fields is not None:
+        store.select_fields(fields)
+    for first, last, values in read_unicode_data(filename):
+        store.add(first, last, values)
+    return store.snapshot()
 
-    Lines in DerivedCoreProperties.txt are either a code point range like
-    this:
+class UnicodeDataRecord(object):
+    '''One line of UnicodeData.txt as returned by iter_records().
+
+    first and last are the code points covered by the record, they
+    differ only for a “First”/“Last” range.  The other attributes are
+    named like the fields in UNICODE_DATA_FIELDS and hold the same
+    values as UNICODE_ATTRIBUTES[code_point][field], i.e. strings
+    except for upper, lower and title which are code points or None.
+    Fields which were not asked for are not set.
+    '''
+    __slots__ = ('first', 'last') + UNICODE_DATA_FIELDS
+
+    def __init__(self, first, last):
+        self.first = first
+        self.last = last
+
+    def __repr__(self):
+        return 'UnicodeDataRecord({:s}, {{{:s}}})'.format(
+            ucs_symbol_range(self.first, self.last)
+            if self.first != self.last else ucs_symbol(self.first),
+            ', '.join('{!r}: {!r}'.format(field, getattr(self, field))
+                      for field in UNICODE_DATA_FIELDS
+                      if hasattr(self, field)))
+
+def iter_records(filename, fields=None):
+    '''Yields the lines of the UnicodeData.txt file one at a time
+    as UnicodeDataRecord objects, without storing anything in
+    UNICODE_ATTRIBUTES.
+
+    fields is a sequence of names from UNICODE_DATA_FIELDS, only these
+    attributes are set in the records.  All fields are set if it is
+    None.  A “First”/“Last” range is yielded as one record.
+
+    Example:
+
+    for record in iter_records('UnicodeData.txt', fields=('name',)):
+        print(record.first, record.last, record.name)
+    '''
+    if fields is None:
+        fields = UNICODE_DATA_FIELDS
+    columns = []
+    for field in fields:
+        if field not in UNICODE_DATA_FIELDS:
+            raise ValueError('unknown UnicodeData.txt field: %s' %field)
+        columns.append(
+            (field, UNICODE_DATA_FIELDS.index(field) + 1,
+             field in ('upper', 'lower', 'title')))
+    for first, last, values in read_unicode_data(filename):
+        record = UnicodeDataRecord(first, last)
+        for field, index, is_code_point in columns:
+            value = values[index]
+            if is_code_point:
+                value = int(value, 16) if value else None
+            setattr(record, field, value)
+        yield record
+
+def parse_property_ranges(filename):
+    '''Yields the code point ranges of a file using the common format
+    of the UCD property files like DerivedCoreProperties.txt,
+    EastAsianWidth.txt, PropList.txt, Scripts.txt or LineBreak.txt as
+    (first, last, property) tuples in file order.
+
+    Lines in these files are either a code point range like this:
 
     0061..007A    ; Lowercase # L&  [26] LATIN SMALL LETTER A..LATIN SMALL LETTER Z
 
@@ -163,248 +1488,1085 @@ def fill_derived_core_properties(filename):
 
     00AA          ; Lowercase # Lo       FEMININE ORDINAL INDICATOR
 
+    The property is the first field after the code points, further
+    fields are ignored.  Empty lines and comments are skipped.
     '''
-    with open(filename, mode='r') as derived_core_properties_file:
-        for line in derived_core_properties_file:
-            match = re.match(
-                r'^(?P<codepoint1>[0-9A-F]{4,6})'
-                + r'(?:\.\.(?P<codepoint2>[0-9A-F]{4,6}))?'
-                + r'\s*;\s*(?P<property>[a-zA-Z_]+)',
-                line)
-            if not match:
+    with open(filename, mode='r') as property_file:
+        for line in property_file:
+            if line[0] in '#\n':
                 continue
-            start = match.group('codepoint1')
-            end = match.group('codepoint2')
-            if not end:
-                end = start
-            for code_point in range(int(start, 16), int(end, 16)+1):
-                prop = match.group('property')
-                if code_point in DERIVED_CORE_PROPERTIES:
-                    DERIVED_CORE_PROPERTIES[code_point].append(prop)
-                else:
-                    DERIVED_CORE_PROPERTIES[code_point] = [prop]
+            (code_points, separator, fields) = line.partition(';')
+            (first, _, last) = code_points.partition('..')
+            try:
+                first = int(first, 16)
+                last = int(last, 16) if last else first
+            except ValueError:
+                if line.lstrip().startswith('#') or line.isspace():
+                    continue
+                sys.stderr.write(
+                    'broken code point range in file "%(f)s": %(l)s\n' %{
+                        'f': filename, 'l': line})
+                exit(1)
+            if not separator:
+                sys.stderr.write(
+                    'short line in file "%(f)s": %(l)s\n' %{
+                        'f': filename, 'l': line})
+                exit(1)
+            yield (first, last,
+                   fields.partition('#')[0].partition(';')[0].strip())
 
-def fill_east_asian_widths(filename):
-    '''Stores the entire contents of the EastAsianWidths.txt file
-    in the EAST_ASIAN_WIDTHS dictionary.
+def read_property_ranges(filename, kind='PropertyRanges'):
+    '''Returns the code point ranges of a UCD property file as a list
+    of (first, last, property) tuples in file order, see
+    parse_property_ranges().
 
-    Lines in EastAsianWidths.txt are either a code point range like
-    this:
+    The parsed ranges are kept in a snapshot file named after kind,
+    later calls for the same file read the snapshot instead.
+    '''
+    path = snapshot_path(kind, filename)
+    snapshot = read_snapshot(path)
+    if snapshot:
+        (properties, arrays) = snapshot
+        ranges = list(zip(arrays['firsts'], arrays['lasts'],
+                          [properties[code] for code in arrays['codes']]))
+        close_snapshot(arrays)
+        return ranges
+    ranges = list(parse_property_ranges(filename))
+    properties = _EnumColumn('H')
+    for (first, last, prop) in ranges:
+        properties.append(prop)
+    write_snapshot(path, properties.values, {
+        'firsts': array.array('I', [first for first, _, _ in ranges]),
+        'lasts': array.array('I', [last for _, last, _ in ranges]),
+        'codes': properties.codes})
+    return ranges
 
-    9FCD..9FFF;W     # Cn    [51] <reserved-9FCD>..<reserved-9FFF>
+def read_property_sets(filename, kind='PropertyRanges'):
+    '''Returns the contents of a UCD property file as a dictionary
+    mapping each property value to the IntervalSet of its code points,
+    in the order the values first occur in the file:
 
-    or a single code point like this:
+    read_property_sets('PropList.txt')['White_Space']
+    → IntervalSet([(0x0009, 0x000D), (0x0020, 0x0020), …])
+
+    Adjacent ranges of a value are merged.  The ranges are read with
+    read_property_ranges(), so they are kept in a snapshot file as
+    well.  Use this for new property files like Scripts.txt, it is
+    what fill_derived_core_properties() uses.
+    '''
+    ranges = {}
+    for (first, last, prop) in read_property_ranges(filename, kind):
+        ranges.setdefault(prop, []).append((first, last))
+    return {prop: IntervalSet(prop_ranges)
+            for prop, prop_ranges in ranges.items()}
+
+# General categories as codes for the predicates below, comparing these
+# small integers is faster than comparing the category strings.
+_CATEGORY_ND = GENERAL_CATEGORIES.index('Nd')
+_CATEGORY_ZS = GENERAL_CATEGORIES.index('Zs')
+_CATEGORIES_ZL_ZP = (GENERAL_CATEGORIES.index('Zl'),
+                     GENERAL_CATEGORIES.index('Zp'))
+_CATEGORIES_MN_MC_ME = (GENERAL_CATEGORIES.index('Mn'),
+                        GENERAL_CATEGORIES.index('Mc'),
+                        GENERAL_CATEGORIES.index('Me'))
+
+# Flags for the character classes of the LC_CTYPE category, see
+# class_flags().
+CLASS_UPPER = 0x0001
+CLASS_LOWER = 0x0002
+CLASS_ALPHA = 0x0004
+CLASS_DIGIT = 0x0008
+CLASS_OUTDIGIT = 0x0010
+CLASS_SPACE = 0x0020
+CLASS_CNTRL = 0x0040
+CLASS_PUNCT = 0x0080
+CLASS_GRAPH = 0x0100
+CLASS_PRINT = 0x0200
+CLASS_XDIGIT = 0x0400
+CLASS_BLANK = 0x0800
+CLASS_COMBINING = 0x1000
+CLASS_COMBINING_LEVEL3 = 0x2000
+
+# Names of the character classes and their flags
+CHARACTER_CLASSES = {
+    'upper': CLASS_UPPER,
+    'lower': CLASS_LOWER,
+    'alpha': CLASS_ALPHA,
+    'digit': CLASS_DIGIT,
+    'outdigit': CLASS_OUTDIGIT,
+    'space': CLASS_SPACE,
+    'cntrl': CLASS_CNTRL,
+    'punct': CLASS_PUNCT,
+    'graph': CLASS_GRAPH,
+    'print': CLASS_PRINT,
+    'xdigit': CLASS_XDIGIT,
+    'blank': CLASS_BLANK,
+    'combining': CLASS_COMBINING,
+    'combining_level3': CLASS_COMBINING_LEVEL3,
+}
 
-    A015;W           # Lm         YI SYLLABLE WU
+def class_flags(classes):
+    '''Returns an array holding a word of CLASS_* flags for every code
+    point, indexed by code point, from a dictionary mapping names in
+    CHARACTER_CLASSES to IntervalSets like UCD.character_classes()'''
+    # The flags toggled at each range boundary
+    toggles = collections.defaultdict(int)
+    for name, code_point_set in classes.items():
+        flag = CHARACTER_CLASSES[name]
+        for first, last in code_point_set.runs():
+            toggles[first] ^= flag
+            toggles[last + 1] ^= flag
+    flags = array.array('H', bytes(2 * (MAX_CODE_POINT + 1)))
+    word = 0
+    start = 0
+    for position in sorted(toggles):
+        if word:
+            flags[start:position] = array.array(
+                'H', [word]) * (position - start)
+        word ^= toggles[position]
+        start = position
+    return flags
+
+class ClassViolation(collections.namedtuple(
+        'ClassViolation', ('code_point', 'description', 'mapping', 'order'))):
+    '''A code point violating one of the POSIX restrictions on the
+    character classes.
+
+    description is the description of the restriction in
+    CLASS_RESTRICTIONS, order its index there.  mapping is the case
+    mapping of the code point for the restrictions on toupper and
+    tolower, None otherwise.  str() gives the message written by
+    UCD.verifications().
     '''
-    with open(filename, mode='r') as east_asian_widths_file:
-        for line in east_asian_widths_file:
-            match = re.match(
-                r'^(?P<codepoint1>[0-9A-F]{4,6})'
-                +r'(?:\.\.(?P<codepoint2>[0-9A-F]{4,6}))?'
-                +r'\s*;\s*(?P<property>[a-zA-Z]+)',
-                line)
-            if not match:
+    __slots__ = ()
+
+    def __str__(self):
+        if self.mapping is None:
+            return '{:s} {:s}'.format(
+                ucs_symbol(self.code_point), self.description)
+        return '{:s} {:s}(0x{:04X}) = 0x{:04X}'.format(
+            ucs_symbol(self.code_point), self.description,
+            self.code_point, self.mapping)
+
+# The POSIX restrictions on the character classes as (description,
+# mapping, function) triples.  The function gets the sets of
+# UCD.character_classes() together with the sets of the code points
+# changed by 'toupper' and 'tolower' and the '<space>' character and
+# returns the set of code points violating the restriction.  mapping
+# is 'toupper' or 'tolower' if the case mapping of the code points
+# is reported with the violation, None otherwise.
+CLASS_RESTRICTIONS = (
+    # toupper restriction: "Only characters specified for the keywords
+    # lower and upper shall be specified.
+    ('is not upper|lower but toupper', 'toupper',
+     lambda sets: sets['toupper'] - (sets['lower'] | sets['upper'])),
+    # tolower restriction: "Only characters specified for the keywords
+    # lower and upper shall be specified.
+    ('is not upper|lower but tolower', 'tolower',
+     lambda sets: sets['tolower'] - (sets['lower'] | sets['upper'])),
+    # alpha restriction: "Characters classified as either upper or
+    # lower shall automatically belong to this class.
+    ('is upper|lower but not alpha', None,
+     lambda sets: (sets['lower'] | sets['upper']) - sets['alpha']),
+    # alpha restriction: “No character specified for the keywords
+    # cntrl, digit, punct or space shall be specified.”
+    ('is alpha and cntrl', None,
+     lambda sets: sets['alpha'] & sets['cntrl']),
+    ('is alpha and digit', None,
+     lambda sets: sets['alpha'] & sets['digit']),
+    ('is alpha and punct', None,
+     lambda sets: sets['alpha'] & sets['punct']),
+    ('is alpha and space', None,
+     lambda sets: sets['alpha'] & sets['space']),
+    # space restriction: “No character specified for the keywords
+    # upper, lower, alpha, digit, graph or xdigit shall be specified.”
+    # upper, lower, alpha already checked above.
+    ('is space and digit', None,
+     lambda sets: sets['space'] & sets['digit']),
+    ('is space and graph', None,
+     lambda sets: sets['space'] & sets['graph']),
+    ('is space and xdigit', None,
+     lambda sets: sets['space'] & sets['xdigit']),
+    # cntrl restriction: “No character specified for the keywords
+    # upper, lower, alpha, digit, punct, graph, print or xdigit shall
+    # be specified.”  upper, lower, alpha already checked above.
+    ('is cntrl and digit', None,
+     lambda sets: sets['cntrl'] & sets['digit']),
+    ('is cntrl and punct', None,
+     lambda sets: sets['cntrl'] & sets['punct']),
+    ('is cntrl and graph', None,
+     lambda sets: sets['cntrl'] & sets['graph']),
+    ('is cntrl and print', None,
+     lambda sets: sets['cntrl'] & sets['print']),
+    ('is cntrl and xdigit', None,
+     lambda sets: sets['cntrl'] & sets['xdigit']),
+    # punct restriction: “No character specified for the keywords
+    # upper, lower, alpha, digit, cntrl, xdigit or as the <space>
+    # character shall be specified.”  upper, lower, alpha, cntrl
+    # already checked above.
+    ('is punct and digit', None,
+     lambda sets: sets['punct'] & sets['digit']),
+    ('is punct and xdigit', None,
+     lambda sets: sets['punct'] & sets['xdigit']),
+    ('is punct', None,
+     lambda sets: sets['punct'] & sets['<space>']),
+    # graph restriction: “No character specified for the keyword cntrl
+    # shall be specified.”  Already checked above.
+
+    # print restriction: “No character specified for the keyword cntrl
+    # shall be specified.”  Already checked above.
+
+    # graph - print relation: differ only in the <space> character.
+    # How is this possible if there are more than one space character?!
+    # I think susv2/xbd/locale.html should speak of “space characters”,
+    # not “space character”.
+    ('is print but not graph|<space>', None,
+     lambda sets: sets['print'] - (sets['graph'] | sets['space'])),
+    ('is graph|<space> but not print', None,
+     lambda sets: (sets['graph'] | sets['<space>']) - sets['print']),
+)
+
+class UCD(object):
+    '''The tables of one version of the Unicode Character Database
+    together with the predicates and case mappings computed from them.
+
+    Each UCD object owns its tables, so several versions can be loaded
+    into one process and compared:
+
+    old = UCD()
+    old.fill_attributes('unicode7-0/UnicodeData.txt')
+    new = UCD()
+    new.fill_attributes('UnicodeData.txt')
+    [cp for cp in new.attributes if new.is_alpha(cp) != old.is_alpha(cp)]
+
+    The category, bidi and mirrored values are interned in the same
+    fixed tables (GENERAL_CATEGORIES, BIDI_CLASSES) for all versions.
+    The module level functions and tables like is_alpha() and
+    UNICODE_ATTRIBUTES are those of DEFAULT_UCD.
+    '''
+    def __init__(self):
+        self.attributes = UnicodeAttributes()
+        self.derived_core_properties = PropertyBitmaps()
+        self.east_asian_widths = IntervalMap()
+        self._name_index = None
+        self._base_classification = None
+        self._character_classes = None
+        self._case_mappings = {}
+
+    def name_index(self):
+        '''Returns the NameIndex of the names in the attributes store,
+        it is built on the first call'''
+        if self._name_index is None:
+            self._name_index = NameIndex(self.attributes)
+        return self._name_index
+
+    def fill_attribute(self, code_point, fields):
+        '''Stores in attributes[code_point] the values from the fields.
+
+        One entry in the attributes store represents one line
+        in the UnicodeData.txt file.
+
+        '''
+        self.attributes.add(code_point, code_point, fields)
+
+    def fill_attributes(self, filename, fields=None):
+        '''Stores the entire contents of the UnicodeData.txt file
+        in the attributes store.
+
+        fields is a sequence of names from UNICODE_DATA_FIELDS.  If it is
+        given, only these fields are parsed and stored, which saves time
+        and memory for scripts which need only a few of them.  It is
+        ignored if the store has been filled before.
+
+        A typical line for a single code point in UnicodeData.txt looks
+        like this:
+
+        0041;LATIN CAPITAL LETTER A;Lu;0;L;;;;;N;;;;0061;
+
+        Code point ranges are indicated by pairs of lines like this:
+
+        4E00;<CJK Ideograph, First>;Lo;0;L;;;;;N;;;;;
+        9FCC;<CJK Ideograph, Last>;Lo;0;L;;;;;N;;;;;
+
+        The parsed contents are kept in a snapshot file, later calls for
+        the same file read the snapshot instead of parsing the file again.
+        '''
+        path = None
+        if self.attributes.is_empty():
+            path = self._unicode_data_snapshot_path(filename, fields)
+            snapshot = read_snapshot(path)
+            if snapshot:
+                self.attributes.restore(*snapshot)
+                return
+        for first, last, fields in read_unicode_data(filename):
+            if first == last:
+                self.fill_attribute(first, fields)
+            else:
+                self.attributes.add(first, last, fields)
+        self.attributes.freeze()
+        write_snapshot(path, *self.attributes.snapshot())
+
+    def _unicode_data_snapshot_path(self, filename, fields):
+        '''Selects the fields to load in the still empty attributes
+        store and returns the path of the matching snapshot file'''
+        kind = 'UnicodeData'
+        if fields is not None:
+            self.attributes.select_fields(fields)
+            kind += ':' + ','.join(self.attributes.columns)
+        return snapshot_path(kind, filename)
+
+    def fill_derived_core_properties(self, filename):
+        '''Stores the entire contents of the DerivedCoreProperties.txt file
+        in the derived_core_properties bitmaps.
+
+        Lines in DerivedCoreProperties.txt are either a code point range like
+        this:
+
+        0061..007A    ; Lowercase # L&  [26] LATIN SMALL LETTER A..LATIN SMALL LETTER Z
+
+        or a single code point like this:
+
+        00AA          ; Lowercase # Lo       FEMININE ORDINAL INDICATOR
+
+        '''
+        self._add_derived_core_properties(
+            read_property_sets(filename, 'DerivedCoreProperties'))
+
+    def _add_derived_core_properties(self, property_sets):
+        '''Adds the IntervalSets returned by read_property_sets() to the
+        derived_core_properties bitmaps'''
+        for prop, code_point_set in property_sets.items():
+            for (start, end) in code_point_set.runs():
+                self.derived_core_properties.add_range(start, end, prop)
+
+    def derived_core_properties_constant(self, first, last):
+        '''Checks whether all code points from first to last have the same
+        derived core properties'''
+        return self.derived_core_properties.constant(first, last)
+
+    def fill_east_asian_widths(self, filename):
+        '''Stores the entire contents of the EastAsianWidths.txt file
+        in the east_asian_widths interval map.
+
+        Lines in EastAsianWidths.txt are either a code point range like
+        this:
+
+        9FCD..9FFF;W     # Cn    [51] <reserved-9FCD>..<reserved-9FFF>
+
+        or a single code point like this:
+
+        A015;W           # Lm         YI SYLLABLE WU
+
+        The ranges are stored as they are found in the file and not
+        merged like those of read_property_sets(), utf8_gen.py tells
+        reserved ranges from assigned ones by them.
+        '''
+        self._add_east_asian_widths(
+            read_property_ranges(filename, 'EastAsianWidth'))
+
+    def _add_east_asian_widths(self, ranges):
+        '''Adds the ranges returned by read_property_ranges() to the
+        east_asian_widths interval map'''
+        for (start, end, prop) in ranges:
+            self.east_asian_widths.add(start, end, prop)
+
+    def fill_all(self, unicode_data_file=None,
+                 derived_core_properties_file=None,
+                 east_asian_widths_file=None, fields=None):
+        '''Loads the given UCD files like fill_attributes(),
+        fill_derived_core_properties() and fill_east_asian_widths() do.
+
+        Files which have no snapshot yet are parsed at the same time, the
+        first one in this process and the others in a pool of worker
+        processes, so loading takes about as long as parsing the largest
+        file, which is UnicodeData.txt.  The results are merged into the
+        tables of this context and written to snapshot files.
+        '''
+        jobs = {}
+        path = None
+        if unicode_data_file and self.attributes.is_empty():
+            path = self._unicode_data_snapshot_path(unicode_data_file, fields)
+            snapshot = read_snapshot(path)
+            if snapshot:
+                self.attributes.restore(*snapshot)
+            else:
+                jobs['UnicodeData'] = (
+                    _parse_unicode_data, unicode_data_file, fields)
+        elif unicode_data_file:
+            self.fill_attributes(unicode_data_file, fields)
+        property_files = (
+            (derived_core_properties_file, 'DerivedCoreProperties',
+             read_property_sets, self._add_derived_core_properties),
+            (east_asian_widths_file, 'EastAsianWidth',
+             read_property_ranges, self._add_east_asian_widths))
+        for (filename, kind, read, add) in property_files:
+            if not filename:
+                continue
+            snapshot = read_snapshot(snapshot_path(kind, filename))
+            if snapshot:
+                close_snapshot(snapshot[1])
+            else:
+                jobs[kind] = (read, filename, kind)
+        results = {}
+        if len(jobs) > 1:
+            kinds = list(jobs)
+            with concurrent.futures.ProcessPoolExecutor(
+                    len(jobs) - 1) as executor:
+                futures = {kind: executor.submit(*jobs[kind])
+                           for kind in kinds[1:]}
+                (function, *args) = jobs[kinds[0]]
+                results[kinds[0]] = function(*args)
+                for kind, future in futures.items():
+                    results[kind] = future.result()
+        if 'UnicodeData' in results:
+            self.attributes.restore(*results['UnicodeData'])
+            write_snapshot(path, *results['UnicodeData'])
+        elif 'UnicodeData' in jobs:
+            self.fill_attributes(unicode_data_file, fields)
+        for (filename, kind, read, add) in property_files:
+            if not filename:
                 continue
-            start = match.group('codepoint1')
-            end = match.group('codepoint2')
-            if not end:
-                end = start
-            for code_point in range(int(start, 16), int(end, 16)+1):
-                EAST_ASIAN_WIDTHS[code_point] = match.group('property')
+            contents = results.get(kind)
+            if contents is None:
+                contents = read(filename, kind)
+            add(contents)
+
+    def case_mapping(self, field, overlay=None):
+        '''Returns the CaseMapping of the 'upper', 'lower' or 'title'
+        field of the attributes store, tailored by the overlay
+        dictionary if one is given.
+
+        The mapping is built on the first call, so load the attributes
+        before calling it.
+        '''
+        mapping = self._case_mappings.get(field)
+        if mapping is None:
+            mapping = self._case_mappings[field] = CaseMapping(
+                self._case_pairs(getattr(self.attributes, field)))
+        if overlay:
+            return mapping.tailored(overlay)
+        return mapping
+
+    def _case_pairs(self, accessor):
+        '''Yields (code_point, mapped) for all code points in the store
+        having a mapping, accessor is one of the case mapping accessors
+        of the store like UnicodeAttributes.upper()'''
+        for first, last in self.attributes.runs():
+            mapped = accessor(first)
+            if not mapped:
+                continue
+            # The code points of a block share their row.
+            for code_point in range(first, last + 1):
+                yield (code_point, mapped)
+
+    def to_upper(self, code_point):
+        '''Returns the code point of the uppercase version
+        of the given code point'''
+        return self.case_mapping('upper')(code_point)
+
+    def to_lower(self, code_point):
+        '''Returns the code point of the lowercase version
+        of the given code point'''
+        return self.case_mapping('lower')(code_point)
+
+    def to_upper_turkish(self, code_point):
+        '''Returns the code point of the Turkish uppercase version
+        of the given code point'''
+        return self.tailored_case_mapping(
+            'upper', locale_tailoring('tr_TR'))(code_point)
+
+    def to_lower_turkish(self, code_point):
+        '''Returns the code point of the Turkish lowercase version
+        of the given code point'''
+        return self.tailored_case_mapping(
+            'lower', locale_tailoring('tr_TR'))(code_point)
+
+    def tailored_case_mapping(self, field, tailoring):
+        '''Returns the CaseMapping of a field with the overlay of a
+        LocaleTailoring applied, it is built on the first call.
+        Without a tailoring or an overlay for the field this is the
+        untailored mapping.'''
+        if tailoring is None or not tailoring.overlays[field]:
+            return self.case_mapping(field)
+        key = (field, tailoring)
+        mapping = self._case_mappings.get(key)
+        if mapping is None:
+            mapping = self._case_mappings[key] = self.case_mapping(
+                field, tailoring.overlays[field])
+        return mapping
+
+    def to_title(self, code_point):
+        '''Returns the code point of the titlecase version
+        of the given code point'''
+        return self.case_mapping('title')(code_point)
+
+    def is_upper(self, code_point):
+        '''Checks whether the character with this code point is uppercase'''
+        return (self.to_lower(code_point) != code_point
+                or self.derived_core_properties.has_property(
+                    code_point, 'Uppercase'))
+
+    def is_lower(self, code_point):
+        '''Checks whether the character with this code point is lowercase'''
+        # Some characters are defined as “Lowercase” in
+        # DerivedCoreProperties.txt but do not have a mapping to upper
+        # case. For example, ꜰ U+A72F “LATIN LETTER SMALL CAPITAL F” is
+        # one of these.
+        return (self.to_upper(code_point) != code_point
+                # <U00DF> is lowercase, but without simple to_upper mapping.
+                or code_point == 0x00DF
+                or self.derived_core_properties.has_property(
+                    code_point, 'Lowercase'))
+
+    def is_alpha(self, code_point):
+        '''Checks whether the character with this code point is alphabetic'''
+        return (self.derived_core_properties.has_property(
+            code_point, 'Alphabetic')
+                or
+                # Consider all the non-ASCII digits as alphabetic.
+                # ISO C 99 forbids us to have them in category “digit”,
+                # but we want iswalnum to return true on them.
+                (self.attributes.category_code(code_point) == _CATEGORY_ND
+                 and not (code_point >= 0x0030 and code_point <= 0x0039)))
+
+    def is_digit(self, code_point):
+        '''Checks whether the character with this code point is a digit'''
+        if False:
+            return (self.attributes[code_point]['name']
+                    and self.attributes[code_point]['category'] == 'Nd')
+            # Note: U+0BE7..U+0BEF and U+1369..U+1371 are digit systems without
+            # a zero.  Must add <0> in front of them by hand.
+        else:
+            # SUSV2 gives us some freedom for the "digit" category, but
+            # ISO C 99 takes it away:
+            # 7.25.2.1.5:
+            #    The iswdigit function tests for any wide character that
+            #    corresponds to a decimal-digit character (as defined
+            #    in 5.2.1).
+            # 5.2.1:
+            #    the 10 decimal digits 0 1 2 3 4 5 6 7 8 9
+            return (code_point >= 0x0030 and code_point <= 0x0039)
+
+    def is_outdigit(self, code_point):
+        '''Checks whether the character with this code point is outdigit'''
+        return (code_point >= 0x0030 and code_point <= 0x0039)
+
+    def is_blank(self, code_point):
+        '''Checks whether the character with this code point is blank'''
+        return (code_point == 0x0009 # '\t'
+                # Category Zs without mention of '<noBreak>'
+                or (self.attributes.category_code(code_point) == _CATEGORY_ZS
+                    and '<noBreak>' not in
+                    self.attributes.decomposition(code_point)))
+
+    def is_space(self, code_point):
+        '''Checks whether the character with this code point is a space'''
+        # Don’t make U+00A0 a space. Non-breaking space means that all programs
+        # should treat it like a punctuation character, not like a space.
+        return (code_point == 0x0020 # ' '
+                or code_point == 0x000C # '\f'
+                or code_point == 0x000A # '\n'
+                or code_point == 0x000D # '\r'
+                or code_point == 0x0009 # '\t'
+                or code_point == 0x000B # '\v'
+                # Categories Zl, Zp, and Zs without mention of "<noBreak>"
+                or self.attributes.category_code(code_point)
+                in _CATEGORIES_ZL_ZP
+                or (self.attributes.category_code(code_point) == _CATEGORY_ZS
+                    and
+                    '<noBreak>' not in
+                    self.attributes.decomposition(code_point)))
+
+    def is_cntrl(self, code_point):
+        '''Checks whether the character with this code point is
+        a control character'''
+        return (self.attributes.name(code_point) == '<control>'
+                or self.attributes.category_code(code_point)
+                in _CATEGORIES_ZL_ZP)
+
+    def is_xdigit(self, code_point):
+        '''Checks whether the character with this code point is
+        a hexadecimal digit'''
+        if False:
+            return (self.is_digit(code_point)
+                    or (code_point >= 0x0041 and code_point <= 0x0046)
+                    or (code_point >= 0x0061 and code_point <= 0x0066))
+        else:
+            # SUSV2 gives us some freedom for the "xdigit" category, but
+            # ISO C 99 takes it away:
+            # 7.25.2.1.12:
+            #    The iswxdigit function tests for any wide character that
+            #    corresponds to a hexadecimal-digit character (as defined
+            #    in 6.4.4.1).
+            # 6.4.4.1:
+            #    hexadecimal-digit: one of
+            #    0 1 2 3 4 5 6 7 8 9 a b c d e f A B C D E F
+            return ((code_point >= 0x0030 and code_point  <= 0x0039)
+                    or (code_point >= 0x0041 and code_point <= 0x0046)
+                    or (code_point >= 0x0061 and code_point <= 0x0066))
+
+    def is_graph(self, code_point):
+        '''Checks whether the character with this code point is
+        a graphical character'''
+        return (code_point in self.attributes
+                and self.attributes.name(code_point) != '<control>'
+                and not self.is_space(code_point))
+
+    def is_print(self, code_point):
+        '''Checks whether the character with this code point is printable'''
+        return (code_point in self.attributes
+                and self.attributes.name(code_point) != '<control>'
+                and self.attributes.category_code(code_point)
+                not in _CATEGORIES_ZL_ZP)
+
+    def is_punct(self, code_point):
+        '''Checks whether the character with this code point is punctuation'''
+        if False:
+            return (self.attributes[code_point]['name']
+                    and self.attributes[code_point]['category'].startswith(
+                        'P'))
+        else:
+            # The traditional POSIX definition of punctuation is every graphic,
+            # non-alphanumeric character.
+            return (self.is_graph(code_point)
+                    and not self.is_alpha(code_point)
+                    and not self.is_digit(code_point))
+
+    def is_combining(self, code_point):
+        '''Checks whether the character with this code point is
+        a combining character'''
+        # Up to Unicode 3.0.1 we took the Combining property from the
+        # PropList.txt file. In 3.0.1 it was identical to the union of the
+        # general categories "Mn", "Mc", "Me". In Unicode 3.1 this property has
+        # been dropped from the PropList.txt file, so we take the latter
+        # definition.
+        return (self.attributes.category_code(code_point)
+                in _CATEGORIES_MN_MC_ME)
+
+    def is_combining_level3(self, code_point):
+        '''Checks whether the character with this code point is
+        a combining level3 character'''
+        return (self.is_combining(code_point)
+                and
+                self.attributes.combining_class(code_point) < 200)
+
+    def _classify(self):
+        '''Returns an array holding a word of CLASS_* flags for every
+        code point, indexed by code point, with the flags of all classes
+        which are not derived from other classes in character_classes().
+
+        It is computed on the first call in one pass over the
+        attributes store, so load all tables before calling it.  Code
+        points which are not in the store have no flags.  The code
+        points of a block share their flags if they share their derived
+        core properties.
+        '''
+        if self._base_classification is None:
+            flags = array.array('H', bytes(2 * (MAX_CODE_POINT + 1)))
+            for first, last in self.attributes.runs():
+                if (first != last
+                        and self.derived_core_properties_constant(
+                            first, last)):
+                    flags[first:last+1] = array.array(
+                        'H', [self._base_class_flags(first)]) * (
+                            last - first + 1)
+                    continue
+                for code_point in range(first, last + 1):
+                    flags[code_point] = self._base_class_flags(code_point)
+            self._base_classification = flags
+        return self._base_classification
+
+    def _base_class_flags(self, code_point):
+        '''Returns the CLASS_* flags of a code point for the classes
+        which are not derived from other classes'''
+        flags = 0
+        if self.is_upper(code_point):
+            flags |= CLASS_UPPER
+        if self.is_lower(code_point):
+            flags |= CLASS_LOWER
+        if self.is_alpha(code_point):
+            flags |= CLASS_ALPHA
+        if self.is_digit(code_point):
+            flags |= CLASS_DIGIT
+        if self.is_outdigit(code_point):
+            flags |= CLASS_OUTDIGIT
+        if self.is_space(code_point):
+            flags |= CLASS_SPACE
+        if self.is_cntrl(code_point):
+            flags |= CLASS_CNTRL
+        if self.is_graph(code_point):
+            flags |= CLASS_GRAPH
+        if self.is_xdigit(code_point):
+            flags |= CLASS_XDIGIT
+        if self.is_blank(code_point):
+            flags |= CLASS_BLANK
+        if self.is_combining(code_point):
+            flags |= CLASS_COMBINING
+            if self.is_combining_level3(code_point):
+                flags |= CLASS_COMBINING_LEVEL3
+        return flags
+
+    def _class_sets(self, flags, class_flags):
+        '''Returns a dictionary mapping each of the class_flags to the
+        IntervalSet of the code points in the store which have the flag
+        in the array of flags returned by _classify()'''
+        ranges = {flag: [] for flag in class_flags}
+        for first, last in self.attributes.runs():
+            if (first != last
+                    and self.derived_core_properties_constant(first, last)):
+                runs = ((first, last),)
+            else:
+                runs = ((code_point, code_point)
+                        for code_point in range(first, last + 1))
+            for run in runs:
+                run_flags = flags[run[0]]
+                for flag in class_flags:
+                    if run_flags & flag:
+                        ranges[flag].append(run)
+        return {flag: IntervalSet(ranges[flag]) for flag in class_flags}
+
+    def character_classes(self):
+        '''Returns a dictionary mapping the names in CHARACTER_CLASSES to
+        the IntervalSet of the code points in each class.
+
+        The classes defined in terms of other classes are computed with
+        set operations on these sets instead of being evaluated for
+        each code point.
+        '''
+        if self._character_classes is None:
+            names = [name for name in CHARACTER_CLASSES
+                     if name not in ('punct', 'print')]
+            sets = self._class_sets(
+                self._classify(),
+                [CHARACTER_CLASSES[name] for name in names])
+            classes = {name: sets[CHARACTER_CLASSES[name]]
+                       for name in names}
+            # The traditional POSIX definition of punctuation is every
+            # graphic, non-alphanumeric character, see is_punct().
+            classes['punct'] = (
+                classes['graph'] - classes['alpha'] - classes['digit'])
+            # Every character which is not a control character is
+            # printable, see is_print() and is_cntrl().
+            classes['print'] = (
+                IntervalSet(self.attributes.runs()) - classes['cntrl'])
+            self._character_classes = {
+                name: classes[name] for name in CHARACTER_CLASSES}
+        return self._character_classes
+
+    def tailored_character_classes(self, tailoring, classes=None):
+        '''Returns the dictionary of character_classes() with the class
+        deltas of a LocaleTailoring applied.
+
+        classes is the untailored dictionary to start from, by default
+        character_classes().  Only the tailored classes are computed,
+        the others are shared with the untailored dictionary.
+        '''
+        if classes is None:
+            classes = self.character_classes()
+        if tailoring is None:
+            return classes
+        classes = dict(classes)
+        for name, code_point_set in tailoring.added.items():
+            classes[name] = classes[name] | code_point_set
+        for name, code_point_set in tailoring.removed.items():
+            classes[name] = classes[name] - code_point_set
+        return classes
+
+    def numpy_character_classes(self):
+        '''Returns the same dictionary as character_classes(), computed
+        with NumPy if it is installed.
+
+        The columns of the attributes store and the derived core
+        properties are expanded to arrays over the whole code space,
+        each class is a boolean mask computed from them with vectorized
+        operations and the runs of the masks are found with
+        numpy.diff().  The is_* methods stay the reference, see
+        check_numpy_character_classes().  Without NumPy this returns
+        character_classes().
+        '''
+        if numpy is None:
+            return self.character_classes()
+        attributes = self.attributes
+        code_points = numpy.arange(MAX_CODE_POINT + 1)
+        def between(low, high):
+            return (code_points >= low) & (code_points <= high)
+        category = attributes.numpy_column('category')
+        upper_mapping = attributes.numpy_column('upper')
+        lower_mapping = attributes.numpy_column('lower')
+        control = attributes.numpy_column(
+            'name', lambda name: name == '<control>')
+        no_break = attributes.numpy_column(
+            'decomposition',
+            lambda decomposition: '<noBreak>' in decomposition)
+        has_property = self.derived_core_properties.numpy_mask
+        zl_zp = numpy.isin(category, _CATEGORIES_ZL_ZP)
+        zs = (category == _CATEGORY_ZS) & ~no_break
+        digit = between(0x0030, 0x0039)
+        masks = {}
+        masks['upper'] = (
+            ((lower_mapping != 0) & (lower_mapping != code_points))
+            | has_property('Uppercase'))
+        masks['lower'] = (
+            ((upper_mapping != 0) & (upper_mapping != code_points))
+            | (code_points == 0x00DF)
+            | has_property('Lowercase'))
+        masks['alpha'] = (
+            has_property('Alphabetic')
+            | ((category == _CATEGORY_ND) & ~digit))
+        masks['digit'] = digit
+        masks['outdigit'] = digit
+        masks['space'] = (
+            numpy.isin(code_points,
+                       (0x0020, 0x000C, 0x000A, 0x000D, 0x0009, 0x000B))
+            | zl_zp | zs)
+        masks['cntrl'] = control | zl_zp
+        masks['graph'] = ~control & ~masks['space']
+        masks['punct'] = masks['graph'] & ~masks['alpha'] & ~digit
+        masks['print'] = ~control & ~zl_zp
+        masks['xdigit'] = (
+            digit | between(0x0041, 0x0046) | between(0x0061, 0x0066))
+        masks['blank'] = (code_points == 0x0009) | zs
+        masks['combining'] = numpy.isin(category, _CATEGORIES_MN_MC_ME)
+        masks['combining_level3'] = (
+            masks['combining']
+            & (attributes.numpy_column('combining') < 200))
+        in_store = attributes.numpy_rows() != 0
+        return {name: _numpy_interval_set(masks[name] & in_store)
+                for name in CHARACTER_CLASSES}
+
+    def check_numpy_character_classes(self):
+        '''Returns the names of the classes for which
+        numpy_character_classes() and character_classes() differ,
+        an empty list if they agree or if NumPy is not installed'''
+        numpy_classes = self.numpy_character_classes()
+        classes = self.character_classes()
+        return [name for name in CHARACTER_CLASSES
+                if numpy_classes[name] != classes[name]]
+
+    def _case_mapped(self, to_case):
+        '''Returns the IntervalSet of the code points in the store which
+        to_case maps to a different code point'''
+        ranges = []
+        for first, last in self.attributes.runs():
+            for code_point in range(first, last + 1):
+                if to_case(code_point) != code_point:
+                    ranges.append((code_point, code_point))
+                elif first != last:
+                    # The code points of a block share their case
+                    # mappings, without a mapping all of them map to
+                    # themselves.
+                    break
+        return IntervalSet(ranges)
+
+    def class_violations(self):
+        '''Returns the list of ClassViolation records of all code points in
+        the store violating one of the POSIX restrictions in
+        CLASS_RESTRICTIONS, sorted by code point.
+
+        Each restriction is checked once for the whole code space with
+        set operations on the sets of character_classes().
+        '''
+        sets = dict(self.character_classes())
+        sets['toupper'] = self._case_mapped(self.to_upper)
+        sets['tolower'] = self._case_mapped(self.to_lower)
+        sets['<space>'] = IntervalSet(
+            [(0x0020, 0x0020)]) & IntervalSet(self.attributes.runs())
+        mappings = {'toupper': self.to_upper, 'tolower': self.to_lower}
+        violations = []
+        for order, (description, mapping, restriction) in enumerate(
+                CLASS_RESTRICTIONS):
+            to_case = mappings[mapping] if mapping else None
+            for code_point in restriction(sets):
+                violations.append(ClassViolation(
+                    code_point, description,
+                    to_case(code_point) if to_case else None, order))
+        violations.sort(key=lambda violation: (violation.code_point,
+                                               violation.order))
+        return violations
+
+    def verifications(self):
+        '''Tests whether the is_* functions observe the known restrictions
+
+        Writes one line to stderr for each violation and returns the
+        list of ClassViolation records, see class_violations().
+        '''
+        violations = self.class_violations()
+        for violation in violations:
+            sys.stderr.write(str(violation) + '\n')
+        return violations
+
+# The UCD context used by the module level functions below.
+DEFAULT_UCD = UCD()
+
+# Column store holding the entire contents of the UnicodeData.txt file
+#
+# It is used like a dictionary of dictionaries, the contents look like
+# this:
+#
+# {0: {'category': 'Cc',
+#      'title': None,
+#      'digit': '',
+#      'name': '<control>',
+#      'bidi': 'BN',
+#      'combining': '0',
+#      'comment': '',
+#      'oldname': 'NULL',
+#      'decomposition': '',
+#      'upper': None,
+#      'mirrored': 'N',
+#      'lower': None,
+#      'decdigit': '',
+#      'numeric': ''},
+#      …
+# }
+UNICODE_ATTRIBUTES = DEFAULT_UCD.attributes
+
+# Bitmaps holding the entire contents of the DerivedCoreProperties.txt file
+#
+# Used like a dictionary, its contents look like this:
+#
+# {917504: ['Default_Ignorable_Code_Point'],
+#  917505: ['Case_Ignorable', 'Default_Ignorable_Code_Point'],
+#  …
+# }
+#
+# Use DERIVED_CORE_PROPERTIES.has_property(code_point, 'Alphabetic') to
+# test a single property.
+DERIVED_CORE_PROPERTIES = DEFAULT_UCD.derived_core_properties
+
+# Interval map holding the entire contents of the EastAsianWidths.txt file
+#
+# Used like a dictionary, its contents look like this:
+#
+# {0: 'N', … , 45430: 'W', …}
+#
+# The ranges are kept as in the file, see IntervalMap.ranges().
+EAST_ASIAN_WIDTHS = DEFAULT_UCD.east_asian_widths
+
+def fill_attribute(code_point, fields):
+    '''Stores in UNICODE_ATTRIBUTES[code_point] the values from the fields.'''
+    DEFAULT_UCD.fill_attribute(code_point, fields)
+
+def fill_attributes(filename, fields=None):
+    '''Stores the entire contents of the UnicodeData.txt file
+    in the UNICODE_ATTRIBUTES store.'''
+    DEFAULT_UCD.fill_attributes(filename, fields)
+
+def name_index():
+    '''Returns the NameIndex of the names in UNICODE_ATTRIBUTES'''
+    return DEFAULT_UCD.name_index()
+
+def fill_derived_core_properties(filename):
+    '''Stores the entire contents of the DerivedCoreProperties.txt file
+    in the DERIVED_CORE_PROPERTIES bitmaps.'''
+    DEFAULT_UCD.fill_derived_core_properties(filename)
+
+def derived_core_properties_constant(first, last):
+    '''Checks whether all code points from first to last have the same
+    derived core properties'''
+    return DEFAULT_UCD.derived_core_properties_constant(first, last)
+
+def fill_east_asian_widths(filename):
+    '''Stores the entire contents of the EastAsianWidths.txt file
+    in the EAST_ASIAN_WIDTHS interval map.'''
+    DEFAULT_UCD.fill_east_asian_widths(filename)
+
+def fill_all(unicode_data_file=None, derived_core_properties_file=None,
+             east_asian_widths_file=None, fields=None):
+    '''Loads the given UCD files like fill_attributes(),
+    fill_derived_core_properties() and fill_east_asian_widths() do.'''
+    DEFAULT_UCD.fill_all(unicode_data_file, derived_core_properties_file,
+                         east_asian_widths_file, fields)
 
 def to_upper(code_point):
     '''Returns the code point of the uppercase version
     of the given code point'''
-    if (UNICODE_ATTRIBUTES[code_point]['name']
-        and UNICODE_ATTRIBUTES[code_point]['upper']):
-        return UNICODE_ATTRIBUTES[code_point]['upper']
-    else:
-        return code_point
+    return DEFAULT_UCD.to_upper(code_point)
 
 def to_lower(code_point):
     '''Returns the code point of the lowercase version
     of the given code point'''
-    if (UNICODE_ATTRIBUTES[code_point]['name']
-        and UNICODE_ATTRIBUTES[code_point]['lower']):
-        return UNICODE_ATTRIBUTES[code_point]['lower']
-    else:
-        return code_point
+    return DEFAULT_UCD.to_lower(code_point)
 
 def to_upper_turkish(code_point):
     '''Returns the code point of the Turkish uppercase version
     of the given code point'''
-    if code_point == 0x0069:
-        return 0x0130
-    return to_upper(code_point)
+    return DEFAULT_UCD.to_upper_turkish(code_point)
 
 def to_lower_turkish(code_point):
     '''Returns the code point of the Turkish lowercase version
     of the given code point'''
-    if code_point == 0x0049:
-        return 0x0131
-    return to_lower(code_point)
+    return DEFAULT_UCD.to_lower_turkish(code_point)
 
 def to_title(code_point):
     '''Returns the code point of the titlecase version
     of the given code point'''
-    if (UNICODE_ATTRIBUTES[code_point]['name']
-        and UNICODE_ATTRIBUTES[code_point]['title']):
-        return UNICODE_ATTRIBUTES[code_point]['title']
-    else:
-        return code_point
+    return DEFAULT_UCD.to_title(code_point)
 
 def is_upper(code_point):
     '''Checks whether the character with this code point is uppercase'''
-    return (to_lower(code_point) != code_point
-            or (code_point in DERIVED_CORE_PROPERTIES
-                and 'Uppercase' in DERIVED_CORE_PROPERTIES[code_point]))
+    return DEFAULT_UCD.is_upper(code_point)
 
 def is_lower(code_point):
     '''Checks whether the character with this code point is lowercase'''
-    # Some characters are defined as “Lowercase” in
-    # DerivedCoreProperties.txt but do not have a mapping to upper
-    # case. For example, ꜰ U+A72F “LATIN LETTER SMALL CAPITAL F” is
-    # one of these.
-    return (to_upper(code_point) != code_point
-            # <U00DF> is lowercase, but without simple to_upper mapping.
-            or code_point == 0x00DF
-            or (code_point in DERIVED_CORE_PROPERTIES
-                and 'Lowercase' in DERIVED_CORE_PROPERTIES[code_point]))
+    return DEFAULT_UCD.is_lower(code_point)
 
 def is_alpha(code_point):
     '''Checks whether the character with this code point is alphabetic'''
-    return ((code_point in DERIVED_CORE_PROPERTIES
-             and
-             'Alphabetic' in DERIVED_CORE_PROPERTIES[code_point])
-            or
-            # Consider all the non-ASCII digits as alphabetic.
-            # ISO C 99 forbids us to have them in category “digit”,
-            # but we want iswalnum to return true on them.
-            (UNICODE_ATTRIBUTES[code_point]['category'] == 'Nd'
-             and not (code_point >= 0x0030 and code_point <= 0x0039)))
+    return DEFAULT_UCD.is_alpha(code_point)
 
 def is_digit(code_point):
     '''Checks whether the character with this code point is a digit'''
-    if False:
-        return (UNICODE_ATTRIBUTES[code_point]['name']
-                and UNICODE_ATTRIBUTES[code_point]['category'] == 'Nd')
-        # Note: U+0BE7..U+0BEF and U+1369..U+1371 are digit systems without
-        # a zero.  Must add <0> in front of them by hand.
-    else:
-        # SUSV2 gives us some freedom for the "digit" category, but ISO C 99
-        # takes it away:
-        # 7.25.2.1.5:
-        #    The iswdigit function tests for any wide character that
-        #    corresponds to a decimal-digit character (as defined in 5.2.1).
-        # 5.2.1:
-        #    the 10 decimal digits 0 1 2 3 4 5 6 7 8 9
-        return (code_point >= 0x0030 and code_point <= 0x0039)
+    return DEFAULT_UCD.is_digit(code_point)
 
 def is_outdigit(code_point):
     '''Checks whether the character with this code point is outdigit'''
-    return (code_point >= 0x0030 and code_point <= 0x0039)
+    return DEFAULT_UCD.is_outdigit(code_point)
 
 def is_blank(code_point):
     '''Checks whether the character with this code point is blank'''
-    return (code_point == 0x0009 # '\t'
-            # Category Zs without mention of '<noBreak>'
-            or (UNICODE_ATTRIBUTES[code_point]['name']
-                and UNICODE_ATTRIBUTES[code_point]['category'] == 'Zs'
-                and '<noBreak>' not in
-                UNICODE_ATTRIBUTES[code_point]['decomposition']))
+    return DEFAULT_UCD.is_blank(code_point)
 
 def is_space(code_point):
     '''Checks whether the character with this code point is a space'''
-    # Don’t make U+00A0 a space. Non-breaking space means that all programs
-    # should treat it like a punctuation character, not like a space.
-    return (code_point == 0x0020 # ' '
-            or code_point == 0x000C # '\f'
-            or code_point == 0x000A # '\n'
-            or code_point == 0x000D # '\r'
-            or code_point == 0x0009 # '\t'
-            or code_point == 0x000B # '\v'
-            # Categories Zl, Zp, and Zs without mention of "<noBreak>"
-            or (UNICODE_ATTRIBUTES[code_point]['name']
-                and
-                (UNICODE_ATTRIBUTES[code_point]['category'] in ['Zl', 'Zp']
-                 or
-                 (UNICODE_ATTRIBUTES[code_point]['category'] in ['Zs']
-                  and
-                  '<noBreak>' not in
-                  UNICODE_ATTRIBUTES[code_point]['decomposition']))))
+    return DEFAULT_UCD.is_space(code_point)
 
 def is_cntrl(code_point):
     '''Checks whether the character with this code point is
     a control character'''
-    return (UNICODE_ATTRIBUTES[code_point]['name']
-            and (UNICODE_ATTRIBUTES[code_point]['name'] == '<control>'
-                 or
-                 UNICODE_ATTRIBUTES[code_point]['category'] in ['Zl', 'Zp']))
+    return DEFAULT_UCD.is_cntrl(code_point)
 
 def is_xdigit(code_point):
     '''Checks whether the character with this code point is
     a hexadecimal digit'''
-    if False:
-        return (is_digit(code_point)
-                or (code_point >= 0x0041 and code_point <= 0x0046)
-                or (code_point >= 0x0061 and code_point <= 0x0066))
-    else:
-        # SUSV2 gives us some freedom for the "xdigit" category, but ISO C 99
-        # takes it away:
-        # 7.25.2.1.12:
-        #    The iswxdigit function tests for any wide character that
-        #    corresponds to a hexadecimal-digit character (as defined
-        #    in 6.4.4.1).
-        # 6.4.4.1:
-        #    hexadecimal-digit: one of
-        #    0 1 2 3 4 5 6 7 8 9 a b c d e f A B C D E F
-        return ((code_point >= 0x0030 and code_point  <= 0x0039)
-                or (code_point >= 0x0041 and code_point <= 0x0046)
-                or (code_point >= 0x0061 and code_point <= 0x0066))
+    return DEFAULT_UCD.is_xdigit(code_point)
 
 def is_graph(code_point):
     '''Checks whether the character with this code point is
     a graphical character'''
-    return (UNICODE_ATTRIBUTES[code_point]['name']
-            and UNICODE_ATTRIBUTES[code_point]['name'] != '<control>'
-            and not is_space(code_point))
+    return DEFAULT_UCD.is_graph(code_point)
 
 def is_print(code_point):
     '''Checks whether the character with this code point is printable'''
-    return (UNICODE_ATTRIBUTES[code_point]['name']
-            and UNICODE_ATTRIBUTES[code_point]['name'] != '<control>'
-            and UNICODE_ATTRIBUTES[code_point]['category'] not in ['Zl', 'Zp'])
+    return DEFAULT_UCD.is_print(code_point)
 
 def is_punct(code_point):
     '''Checks whether the character with this code point is punctuation'''
-    if False:
-        return (UNICODE_ATTRIBUTES[code_point]['name']
-                and UNICODE_ATTRIBUTES[code_point]['category'].startswith('P'))
-    else:
-        # The traditional POSIX definition of punctuation is every graphic,
-        # non-alphanumeric character.
-        return (is_graph(code_point)
-                and not is_alpha(code_point)
-                and not is_digit(code_point))
+    return DEFAULT_UCD.is_punct(code_point)
 
 def is_combining(code_point):
     '''Checks whether the character with this code point is
     a combining character'''
-    # Up to Unicode 3.0.1 we took the Combining property from the PropList.txt
-    # file. In 3.0.1 it was identical to the union of the general categories
-    # "Mn", "Mc", "Me". In Unicode 3.1 this property has been dropped from the
-    # PropList.txt file, so we take the latter definition.
-    return (UNICODE_ATTRIBUTES[code_point]['name']
-            and
-            UNICODE_ATTRIBUTES[code_point]['category'] in ['Mn', 'Mc', 'Me'])
+    return DEFAULT_UCD.is_combining(code_point)
 
 def is_combining_level3(code_point):
     '''Checks whether the character with this code point is
     a combining level3 character'''
-    return (is_combining(code_point)
-            and
-            int(UNICODE_ATTRIBUTES[code_point]['combining']) in range(0, 200))
+    return DEFAULT_UCD.is_combining_level3(code_point)
+
+def verifications():
+    '''Tests whether the is_* functions observe the known restrictions'''
+    return DEFAULT_UCD.verifications()
 
 def ucs_symbol(code_point):
     '''Return the UCS symbol string for a Unicode character.'''
@@ -413,115 +2575,187 @@ def ucs_symbol(code_point):
     else:
         return '<U{:08X}>'.format(code_point)
 
-def ucs_symbol_range(code_point_low, code_point_high):
+def ucs_symbol_range(code_point_low, code_point_high, step=1):
     '''Returns a string UCS symbol string for a code point range.
 
     Example:
 
     <U0041>..<U005A>
+
+    With step 2 every second code point of the range is meant:
+
+    <U0100>..(2)..<U012E>
+    '''
+    if step == 1:
+        ellipsis = '..'
+    else:
+        ellipsis = '..({:d})..'.format(step)
+    return ucs_symbol(code_point_low) + ellipsis + ucs_symbol(code_point_high)
+
+class FileRegion(object):
+    '''A part of a memory mapped file which is copied into an output
+    file, see split_input_file().'''
+    __slots__ = ('_data', 'start', 'end', '_substitutions')
+
+    def __init__(self, data, start, end, substitutions=()):
+        self._data = data
+        self.start = start
+        self.end = end
+        self._substitutions = substitutions
+
+    def __bool__(self):
+        return self.end > self.start
+
+    def copy_to(self, output_file):
+        '''Writes the bytes of the region to output_file, a file opened
+        in text mode, without decoding them.
+
+        Line endings are converted to “\n” like when reading the
+        file in text mode, so that the copied regions match the
+        generated lines around them.
+        '''
+        output_file.flush()
+        with memoryview(self._data) as view:
+            data = view[self.start:self.end]
+            if (self._substitutions
+                    or self._data.find(b'\r', self.start, self.end) >= 0):
+                data = bytes(data).replace(b'\r\n', b'\n').replace(
+                    b'\r', b'\n')
+                for pattern, replacement in self._substitutions:
+                    data = pattern.sub(replacement, data)
+            output_file.buffer.write(data)
+            del data
+
+def _find_line(data, marker, start):
+    '''Returns the offset of the first line at or after start which
+    starts with marker, None if there is none'''
+    if data[start:start+len(marker)] == marker and (
+            start == 0 or data[start-1:start] == b'\n'):
+        return start
+    offset = data.find(b'\n' + marker, max(start - 1, 0))
+    if offset < 0:
+        return None
+    return offset + 1
+
+@contextlib.contextmanager
+def split_input_file(filename, head_marker, tail_marker,
+                     head_substitutions=()):
+    '''Splits an original file into the head and the tail a generator
+    preserves around the part it generates.
+
+    Lines end in “\n” or “\r\n”.  The head runs up to and including
+    the first line starting with head_marker, the tail from the first
+    line after it starting with tail_marker to the end of the file.
+    If there is no head_marker line, the head is the whole file, if
+    there is no tail_marker line, the tail is empty.  If filename is
+    None, both are empty.
+    head_substitutions is a list of (compiled bytes regular
+    expression, replacement) applied to the head when it is copied.
+
+    A context manager giving (head, tail) as FileRegion objects:
+
+        with split_input_file('i18n', 'LC_CTYPE', 'translit_start') \
+                as (head, tail):
+            head.copy_to(output_file)
+            …
+
+    The offsets of the marker lines are found in a memory map of the
+    file, which is closed at the end of the with statement.  The
+    regions are copied from it directly without being rebuilt line
+    by line.
     '''
-    return ucs_symbol(code_point_low) + '..' + ucs_symbol(code_point_high)
+    data = b''
+    if filename is not None:
+        with open(filename, mode='rb') as input_file:
+            try:
+                data = mmap.mmap(input_file.fileno(), 0,
+                                 access=mmap.ACCESS_READ)
+            except ValueError:
+                # An empty file cannot be mapped
+                pass
+    try:
+        head_end = _find_line(data, head_marker.encode('utf-8'), 0)
+        if head_end is None:
+            head_end = tail_start = len(data)
+        else:
+            head_end = data.find(b'\n', head_end) + 1 or len(data)
+            tail_start = _find_line(
+                data, tail_marker.encode('utf-8'), head_end)
+            if tail_start is None:
+                tail_start = len(data)
+        yield (FileRegion(data, 0, head_end, head_substitutions),
+               FileRegion(data, tail_start, len(data)))
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
 
-def verifications():
-    '''Tests whether the is_* functions observe the known restrictions'''
-    for code_point in sorted(UNICODE_ATTRIBUTES):
-        # toupper restriction: "Only characters specified for the keywords
-        # lower and upper shall be specified.
-        if (to_upper(code_point) != code_point
-            and not (is_lower(code_point) or is_upper(code_point))):
-            sys.stderr.write(
-                ('%(sym)s is not upper|lower '
-                 + 'but toupper(0x%(c)04X) = 0x%(uc)04X\n') %{
-                    'sym': ucs_symbol(code_point),
-                    'c': code_point,
-                    'uc': to_upper(code_point)})
-        # tolower restriction: "Only characters specified for the keywords
-        # lower and upper shall be specified.
-        if (to_lower(code_point) != code_point
-            and not (is_lower(code_point) or is_upper(code_point))):
-            sys.stderr.write(
-                ('%(sym)s is not upper|lower '
-                 + 'but tolower(0x%(c)04X) = 0x%(uc)04X\n') %{
-                    'sym': ucs_symbol(code_point),
-                    'c': code_point,
-                    'uc': to_lower(code_point)})
-        # alpha restriction: "Characters classified as either upper or lower
-        # shall automatically belong to this class.
-        if ((is_lower(code_point) or is_upper(code_point))
-             and not is_alpha(code_point)):
-            sys.stderr.write('%(sym)s is upper|lower but not alpha\n' %{
-                'sym': ucs_symbol(code_point)})
-        # alpha restriction: “No character specified for the keywords cntrl,
-        # digit, punct or space shall be specified.”
-        if (is_alpha(code_point) and is_cntrl(code_point)):
-            sys.stderr.write('%(sym)s is alpha and cntrl\n' %{
-                'sym': ucs_symbol(code_point)})
-        if (is_alpha(code_point) and is_digit(code_point)):
-            sys.stderr.write('%(sym)s is alpha and digit\n' %{
-                'sym': ucs_symbol(code_point)})
-        if (is_alpha(code_point) and is_punct(code_point)):
-            sys.stderr.write('%(sym)s is alpha and punct\n' %{
-                'sym': ucs_symbol(code_point)})
-        if (is_alpha(code_point) and is_space(code_point)):
-            sys.stderr.write('%(sym)s is alpha and space\n' %{
-                'sym': ucs_symbol(code_point)})
-        # space restriction: “No character specified for the keywords upper,
-        # lower, alpha, digit, graph or xdigit shall be specified.”
-        # upper, lower, alpha already checked above.
-        if (is_space(code_point) and is_digit(code_point)):
-            sys.stderr.write('%(sym)s is space and digit\n' %{
-                'sym': ucs_symbol(code_point)})
-        if (is_space(code_point) and is_graph(code_point)):
-            sys.stderr.write('%(sym)s is space and graph\n' %{
-                'sym': ucs_symbol(code_point)})
-        if (is_space(code_point) and is_xdigit(code_point)):
-            sys.stderr.write('%(sym)s is space and xdigit\n' %{
-                'sym': ucs_symbol(code_point)})
-        # cntrl restriction: “No character specified for the keywords upper,
-        # lower, alpha, digit, punct, graph, print or xdigit shall be
-        # specified.”  upper, lower, alpha already checked above.
-        if (is_cntrl(code_point) and is_digit(code_point)):
-            sys.stderr.write('%(sym)s is cntrl and digit\n' %{
-                'sym': ucs_symbol(code_point)})
-        if (is_cntrl(code_point) and is_punct(code_point)):
-            sys.stderr.write('%(sym)s is cntrl and punct\n' %{
-                'sym': ucs_symbol(code_point)})
-        if (is_cntrl(code_point) and is_graph(code_point)):
-            sys.stderr.write('%(sym)s is cntrl and graph\n' %{
-                'sym': ucs_symbol(code_point)})
-        if (is_cntrl(code_point) and is_print(code_point)):
-            sys.stderr.write('%(sym)s is cntrl and print\n' %{
-                'sym': ucs_symbol(code_point)})
-        if (is_cntrl(code_point) and is_xdigit(code_point)):
-            sys.stderr.write('%(sym)s is cntrl and xdigit\n' %{
-                'sym': ucs_symbol(code_point)})
-        # punct restriction: “No character specified for the keywords upper,
-        # lower, alpha, digit, cntrl, xdigit or as the <space> character shall
-        # be specified.”  upper, lower, alpha, cntrl already checked above.
-        if (is_punct(code_point) and is_digit(code_point)):
-            sys.stderr.write('%(sym)s is punct and digit\n' %{
-                'sym': ucs_symbol(code_point)})
-        if (is_punct(code_point) and is_xdigit(code_point)):
-            sys.stderr.write('%(sym)s is punct and xdigit\n' %{
-                'sym': ucs_symbol(code_point)})
-        if (is_punct(code_point) and code_point == 0x0020):
-            sys.stderr.write('%(sym)s is punct\n' %{
-                'sym': ucs_symbol(code_point)})
-        # graph restriction: “No character specified for the keyword cntrl
-        # shall be specified.”  Already checked above.
-
-        # print restriction: “No character specified for the keyword cntrl
-        # shall be specified.”  Already checked above.
-
-        # graph - print relation: differ only in the <space> character.
-        # How is this possible if there are more than one space character?!
-        # I think susv2/xbd/locale.html should speak of “space characters”,
-        # not “space character”.
-        if (is_print(code_point)
-            and not (is_graph(code_point) or is_space(code_point))):
-            sys.stderr.write('%(sym)s is print but not graph|<space>\n' %{
-                'sym': unicode_utils.ucs_symbol(code_point)})
-        if (not is_print(code_point)
-            and (is_graph(code_point) or code_point == 0x0020)):
-            sys.stderr.write('%(sym)s is graph|<space> but not print\n' %{
-                'sym': unicode_utils.ucs_symbol(code_point)})
+class WrappedLineWriter(object):
+    '''Collects the text written to an output file in a list and writes
+    it joined in one chunk when flushed.
+
+    Besides plain text it writes lists of tokens separated by “;” and
+    wrapped at max_column, the continuation lines end in “/” and start
+    with prefix, like the sections of LC_CTYPE:
+
+    writer = WrappedLineWriter(i18n_file)
+    writer.write('upper /\n')
+    writer.add_tokens(['<U0041>..<U005A>', '<U00C0>..<U00D6>'])
+    writer.end_tokens()
+    writer.flush()
+
+    The width of the current line is tracked as a number, tokens are
+    never concatenated to measure it.
+    '''
+    def __init__(self, output_file, max_column=75, prefix='   ',
+                 separator=';'):
+        self.output_file = output_file
+        self.max_column = max_column
+        self.prefix = prefix
+        self.separator = separator
+        self._pieces = []
+        # Writes text, this is the list method itself to keep the
+        # per token overhead low.
+        self.write = self._pieces.append
+        # Width of the current line of tokens, 0 if it has no token yet
+        self._column = 0
+
+    def add_tokens(self, tokens):
+        '''Adds the tokens to the current line, starting a continuation
+        line whenever the next token does not fit'''
+        append = self._pieces.append
+        prefix = self.prefix
+        separator = self.separator
+        max_column = self.max_column - len(separator)
+        column = self._column
+        for token in tokens:
+            if not column:
+                append(prefix)
+                column = len(prefix)
+            else:
+                if column + len(token) > max_column:
+                    append(separator + '/\n' + prefix)
+                    column = len(prefix)
+                else:
+                    append(separator)
+                    column += len(separator)
+            append(token)
+            column += len(token)
+        self._column = column
+
+    def end_tokens(self):
+        '''Ends the current line of tokens, if there is one'''
+        if self._column:
+            self._pieces.append('\n')
+            self._column = 0
+
+    def flush(self):
+        '''Writes all collected text to the output file'''
+        self.end_tokens()
+        self.output_file.write(''.join(self._pieces))
+        del self._pieces[:]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
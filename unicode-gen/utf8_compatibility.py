@@ -252,9 +252,8 @@ if __name__ == "__main__":
         help='Show characters whose width was changed in detail.')
     ARGS = PARSER.parse_args()
 
-    if ARGS.unicode_data_file:
-        unicode_utils.fill_attributes(ARGS.unicode_data_file)
-    if ARGS.east_asian_width_file:
-        unicode_utils.fill_east_asian_widths(ARGS.east_asian_width_file)
+    unicode_utils.fill_all(
+        unicode_data_file=ARGS.unicode_data_file,
+        east_asian_widths_file=ARGS.east_asian_width_file)
     check_charmap(ARGS.old_utf8_file, ARGS.new_utf8_file)
     check_width(ARGS.old_utf8_file, ARGS.new_utf8_file)
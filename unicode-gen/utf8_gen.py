@@ -28,7 +28,6 @@ It will output UTF-8 file
 '''
 
 import sys
-import re
 import unicode_utils
 
 # Auxiliary tables for Hangul syllable names, see the Unicode 3.0 book,
@@ -215,8 +214,9 @@ def write_header_width(outfile):
 #    outfile.write("%   \"grep '^[^;]*;ZERO WIDTH ' UnicodeData.txt\"\n")
     outfile.write("WIDTH\n")
 
-def process_width(outfile, ulines, elines):
-    '''ulines are lines from UnicodeData.txt, elines are lines from
+def process_width(outfile, ulines, wide_ranges):
+    '''ulines are lines from UnicodeData.txt, wide_ranges are the
+    (first, last) code point ranges which have the width W or F in
     EastAsianWidth.txt
 
     '''
@@ -227,22 +227,18 @@ def process_width(outfile, ulines, elines):
             width_dict[int(fields[0], 16)] = unicode_utils.ucs_symbol(
                 int(fields[0], 16)) + '\t0'
 
-    for line in elines:
+    for (first, last) in wide_ranges:
         # If an entry in EastAsianWidth.txt is found, it overrides entries in
         # UnicodeData.txt:
-        fields = line.split(";")
-        if not '..' in fields[0]:
-            width_dict[int(fields[0], 16)] = unicode_utils.ucs_symbol(
-                int(fields[0], 16)) + '\t2'
+        if first == last:
+            width_dict[first] = unicode_utils.ucs_symbol(first) + '\t2'
         else:
-            code_points = fields[0].split("..")
-            for key in range(int(code_points[0], 16),
-                             int(code_points[1], 16)+1):
+            for key in range(first, last+1):
                 if  key in width_dict:
                     del width_dict[key]
-            width_dict[int(code_points[0], 16)] = '{:s}...{:s}\t2'.format(
-                unicode_utils.ucs_symbol(int(code_points[0], 16)),
-                unicode_utils.ucs_symbol(int(code_points[1], 16)))
+            width_dict[first] = '{:s}...{:s}\t2'.format(
+                unicode_utils.ucs_symbol(first),
+                unicode_utils.ucs_symbol(last))
 
     for key in sorted(width_dict):
         outfile.write(width_dict[key]+'\n')
@@ -253,22 +249,26 @@ if __name__ == "__main__":
     else:
         with open(sys.argv[1], mode='r') as UNIDATA_FILE:
             UNICODE_DATA_LINES = UNIDATA_FILE.readlines()
-        with open(sys.argv[2], mode='r') as EAST_ASIAN_WIDTH_FILE:
-            EAST_ASIAN_WIDTH_LINES = []
-            for LINE in EAST_ASIAN_WIDTH_FILE:
-                # If characters from EastAasianWidth.txt which are from
-                # from reserved ranges (i.e. not yet assigned code points)
-                # are added to the WIDTH section of the UTF-8 file, then
-                # “make check” produces “Unknown Character” errors for
-                # these code points because such unassigned code points
-                # are not in the CHARMAP section of the UTF-8 file.
-                #
-                # Therefore, we skip all reserved code points when reading
-                # the EastAsianWidth.txt file.
-                if re.match(r'.*<reserved-.+>\.\.<reserved-.+>.*', LINE):
-                    continue
-                if re.match(r'^[^;]*;[WF]', LINE):
-                    EAST_ASIAN_WIDTH_LINES.append(LINE.strip())
+        unicode_utils.fill_all(
+            unicode_data_file=sys.argv[1],
+            east_asian_widths_file=sys.argv[2])
+        WIDE_RANGES = []
+        for (FIRST, LAST, WIDTH) in unicode_utils.EAST_ASIAN_WIDTHS.ranges(
+                ('W', 'F')):
+            # If characters from EastAasianWidth.txt which are from
+            # from reserved ranges (i.e. not yet assigned code points)
+            # are added to the WIDTH section of the UTF-8 file, then
+            # “make check” produces “Unknown Character” errors for
+            # these code points because such unassigned code points
+            # are not in the CHARMAP section of the UTF-8 file.
+            #
+            # Therefore, we skip all ranges of reserved code points
+            # from the EastAsianWidth.txt file.
+            if (FIRST != LAST
+                    and FIRST not in unicode_utils.UNICODE_ATTRIBUTES
+                    and LAST not in unicode_utils.UNICODE_ATTRIBUTES):
+                continue
+            WIDE_RANGES.append((FIRST, LAST))
         with open('UTF-8', mode='w') as OUTFILE:
             # Processing UnicodeData.txt and write CHARMAP to UTF-8 file
             write_header_charmap(OUTFILE)
@@ -276,5 +276,5 @@ if __name__ == "__main__":
             OUTFILE.write("END CHARMAP\n\n")
             # Processing EastAsianWidth.txt and write WIDTH to UTF-8 file
             write_header_width(OUTFILE)
-            process_width(OUTFILE, UNICODE_DATA_LINES, EAST_ASIAN_WIDTH_LINES)
+            process_width(OUTFILE, UNICODE_DATA_LINES, WIDE_RANGES)
             OUTFILE.write("END WIDTH\n")